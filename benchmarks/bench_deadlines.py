@@ -0,0 +1,169 @@
+"""
+This script benchmarks the hot paths of the deadlines package.
+
+Run it from the project root:
+
+    python benchmarks/bench_deadlines.py --save baseline.json
+    python benchmarks/bench_deadlines.py --compare baseline.json
+
+Each benchmark reports the best time per call over several repeats.
+With --save, the results are written as JSON so they can be kept as a baseline.
+With --compare, each result is compared with the baseline and the script exits with status 1
+if any benchmark is slower than the baseline by more than the threshold factor.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import sys
+import timeit
+from collections.abc import Callable
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from deadlines.canadian_holidays import calc_holidays
+from deadlines.court_calendar import court_calendar_for_years, ensure_court_calendar
+from deadlines.court_days import nth_open_day
+from deadlines.dates import find_year, get_court_calendar, is_court_open, is_holiday, set_court_calendar
+from deadlines.due_dates import deadline, deadline_ordinal, dl
+from deadlines.enums import Month, Weekday
+
+# the default factor by which a benchmark may be slower than its baseline before it is a regression
+DEFAULT_THRESHOLD: float = 1.25
+
+OPEN_DATE: datetime.date = datetime.date(2012, 10, 9)
+HOLIDAY_DATE: datetime.date = datetime.date(2012, 10, 8)
+EVENT_ORDINAL: int = datetime.date(2012, 6, 11).toordinal()
+
+
+def calc_holidays_cold() -> None:
+    calc_holidays.cache_clear()
+    calc_holidays(2012, False)
+
+
+def without_court_calendar(function: Callable[[], object]) -> Callable[[], object]:
+    """
+    Wrap a benchmark so that it runs with the rules instead of the court calendar.
+    """
+
+    def run() -> object:
+        court_calendar = get_court_calendar()
+        set_court_calendar(None)
+        try:
+            return function()
+        finally:
+            set_court_calendar(court_calendar)
+
+    return run
+
+
+# each benchmark is a function of no arguments, and the number of calls to time in each repeat
+BENCHMARKS: dict[str, tuple[Callable[[], object], int]] = {
+    "calc_holidays_cold": (calc_holidays_cold, 1_000),
+    "calc_holidays_warm": (lambda: calc_holidays(2012, False), 100_000),
+    "court_calendar_build_1_year": (lambda: court_calendar_for_years.function(2012, 2012), 20),
+    "is_court_open_calendar": (lambda: is_court_open(OPEN_DATE), 100_000),
+    "is_court_open_rules": (without_court_calendar(lambda: [is_court_open(OPEN_DATE) for _ in range(100)]), 1_000),
+    "is_holiday_calendar": (lambda: is_holiday(HOLIDAY_DATE, True), 100_000),
+    "is_holiday_rules": (without_court_calendar(lambda: [is_holiday(HOLIDAY_DATE, True) for _ in range(100)]), 1_000),
+    "deadline_short": (lambda: deadline(datetime.date(2012, 4, 3), 4), 50_000),
+    "deadline_long": (lambda: deadline(datetime.date(2012, 5, 4), 30), 50_000),
+    "deadline_365": (lambda: deadline(datetime.date(2012, 5, 4), 365), 50_000),
+    "deadline_summer_recess": (lambda: deadline(datetime.date(2012, 6, 11), 30), 50_000),
+    "deadline_seasonal_recess_short": (lambda: deadline(datetime.date(2021, 12, 16), 4), 50_000),
+    "deadline_seasonal_recess_before": (lambda: deadline(datetime.date(2013, 1, 31), 30, after_event=False), 50_000),
+    "deadline_steps_long": (without_court_calendar(lambda: deadline(datetime.date(2012, 6, 11), 30)), 1_000),
+    "dl_round_trip": (lambda: dl("2012-06-11", 30), 50_000),
+    "deadline_ordinal": (lambda: deadline_ordinal(EVENT_ORDINAL, 30), 50_000),
+    "nth_open_day": (lambda: nth_open_day(OPEN_DATE, 30), 50_000),
+    "find_year": (lambda: find_year(Month.MARCH, 14, Weekday.THURSDAY, 2025), 50_000),
+}
+
+
+def run_benchmarks(names: list[str], repeat: int) -> dict[str, float]:
+    """
+    Run benchmarks.
+
+    Args:
+        names: the names of the benchmarks to run
+        repeat: the number of times to repeat each benchmark
+
+    Returns:
+        the best time per call in seconds, keyed by benchmark name
+    """
+
+    ensure_court_calendar()
+
+    results: dict[str, float] = {}
+    for name in names:
+        function, number = BENCHMARKS[name]
+        times: list[float] = timeit.repeat(function, number=number, repeat=repeat)
+        results[name] = min(times) / number
+        print(f"{name:35} {results[name] * 1e6:12.3f} us", file=sys.stderr)
+
+    return results
+
+
+def compare(results: dict[str, float], baseline: dict[str, float], threshold: float) -> list[str]:
+    """
+    Compare results with a baseline.
+
+    Args:
+        results: the time per call of each benchmark
+        baseline: the baseline time per call of each benchmark
+        threshold: the factor by which a benchmark may be slower than its baseline
+
+    Returns:
+        the names of the benchmarks that regressed
+    """
+
+    regressions: list[str] = []
+    for name, seconds in results.items():
+        if name not in baseline:
+            continue
+        ratio: float = seconds / baseline[name]
+        status: str = "REGRESSION" if ratio > threshold else "ok"
+        print(f"{name:35} {ratio:8.2f}x  {status}", file=sys.stderr)
+        if ratio > threshold:
+            regressions.append(name)
+
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the deadlines package.")
+    parser.add_argument("benchmarks", nargs="*", help="the benchmarks to run, all by default")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--save", metavar="PATH", help="save the results as a JSON baseline")
+    parser.add_argument("--compare", metavar="PATH", help="compare the results with a JSON baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+
+    unknown: list[str] = [name for name in args.benchmarks if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(unknown)}")
+
+    results: dict[str, float] = run_benchmarks(args.benchmarks or list(BENCHMARKS), args.repeat)
+
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump({
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                "seconds_per_call": results,
+            }, file, indent=2)
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline: dict[str, float] = json.load(file)["seconds_per_call"]
+        if compare(results, baseline, args.threshold):
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
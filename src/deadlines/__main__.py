@@ -0,0 +1,6 @@
+"""Run the streaming deadline pipeline: python -m deadlines INPUT [OUTPUT]."""
+
+import sys
+from deadlines.pipeline import main
+
+sys.exit(main())
@@ -0,0 +1,182 @@
+"""
+This module computes deadlines for arrays of event dates using NumPy.
+
+NumPy is an optional dependency of this project. Install it with:
+
+    pip install "federal-court-deadlines[numpy]"
+
+The deadlines are computed in vectorized form by searching the prefix sums of the court calendar
+with `numpy.searchsorted`. The prefix sums for the three counting rules (non-recess days,
+court open days, and Quebec court open days) are stacked into one sorted array by adding
+a different offset to each rule, so a single search handles every row.
+
+`find_year_batch` applies `dates.find_year` to arrays, reading the table of each distinct
+(month, day) once and looking up every row that shares it in one vectorized step.
+"""
+
+import datetime
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+from deadlines.court_calendar import CourtCalendar, ensure_court_calendar
+from deadlines.dates import YEARS_PER_CYCLE, find_year_table
+from deadlines.due_dates import deadline
+
+# the proleptic ordinal of the NumPy datetime64 epoch, 1970-01-01
+EPOCH_ORDINAL: int = datetime.date(1970, 1, 1).toordinal()
+
+# the rows of the stacked prefix sums
+NON_RECESS_RULE: int = 0
+OPEN_RULE: int = 1
+QUEBEC_OPEN_RULE: int = 2
+
+
+def stack_counts(court_calendar: CourtCalendar) -> tuple[NDArray[np.int64], int]:
+    """
+    Stack the prefix sums of a court calendar into one sorted array.
+
+    Args:
+        court_calendar: the court calendar
+
+    Returns:
+        the stacked prefix sums, and the offset added to each successive rule
+    """
+
+    counts: NDArray[np.int64] = np.stack([
+        np.frombuffer(court_calendar.non_recess_counts, dtype=np.intc),
+        np.frombuffer(court_calendar.open_counts, dtype=np.intc),
+        np.frombuffer(court_calendar.quebec_open_counts, dtype=np.intc),
+    ]).astype(np.int64)
+
+    # each prefix sum is at most len(court_calendar) so this offset keeps the stacked array sorted
+    stride: int = len(court_calendar) + 1
+    counts += np.arange(3, dtype=np.int64)[:, np.newaxis] * stride
+
+    return counts.ravel(), stride
+
+
+def deadlines_batch(event_dates: ArrayLike,
+                    numbers_of_days: ArrayLike,
+                    after_event: ArrayLike = True,
+                    is_quebec: ArrayLike = False) -> NDArray[np.datetime64]:
+    """
+    Compute the deadlines for arrays of event dates and numbers of days.
+    The arguments are broadcast against each other, so scalars apply to every row.
+    Rows whose deadline is not covered by the court calendar are computed one at a time.
+
+    Args:
+        event_dates: The dates of the events, as datetime64[D] values, dates or ISO strings.
+        numbers_of_days: The numbers of days between the event dates and deadlines.
+        after_event: If True, the deadline is after the event date; otherwise, it's before.
+        is_quebec: If True, the deadline is calculated according to Quebec rules.
+
+    Returns:
+        The computed deadline dates as a datetime64[D] array.
+
+    Raises:
+        ValueError: If any event date is missing (NaT) or any number of days is negative.
+    """
+
+    dates: NDArray[np.datetime64] = np.asarray(event_dates, dtype='datetime64[D]')
+    days: NDArray[np.int64] = np.asarray(numbers_of_days, dtype=np.int64)
+    after: NDArray[np.bool_] = np.asarray(after_event, dtype=bool)
+    quebec: NDArray[np.bool_] = np.asarray(is_quebec, dtype=bool)
+    dates, days, after, quebec = np.broadcast_arrays(dates, days, after, quebec)
+
+    if np.any(np.isnat(dates)):
+        raise ValueError("event dates must not be NaT")
+
+    if np.any(days < 0):
+        raise ValueError("number_of_days must be non-negative")
+
+    court_calendar: CourtCalendar = ensure_court_calendar()
+    counts, stride = stack_counts(court_calendar)
+    size: int = len(court_calendar)
+
+    event_index: NDArray[np.int64] = dates.astype(np.int64) + (EPOCH_ORDINAL - court_calendar.start_ordinal)
+    valid: NDArray[np.bool_] = (event_index >= 0) & (event_index < size)
+    event_index = np.where(valid, event_index, 0)
+
+    # if the allowed number of days is less than 7 then only count days on which the court is open
+    open_rule: NDArray[np.int64] = np.where(quebec, QUEBEC_OPEN_RULE, OPEN_RULE)
+    rule: NDArray[np.int64] = np.where(days < 7, open_rule, NON_RECESS_RULE)
+    base: NDArray[np.int64] = rule * (size + 1)
+    offset: NDArray[np.int64] = rule * stride
+
+    # find the last counted day
+    after_target: NDArray[np.int64] = counts[base + event_index + 1] + days
+    before_target: NDArray[np.int64] = counts[base + event_index] - days
+    target: NDArray[np.int64] = np.where(after, after_target, before_target + 1)
+    valid &= np.where(after, after_target <= counts[base + size], before_target >= offset)
+    candidate_index: NDArray[np.int64] = np.searchsorted(counts, target) - base - 1
+    candidate_index = np.where(days == 0, event_index, candidate_index)
+    candidate_index = np.where(valid, candidate_index, 0)
+
+    # the deadline must be a business day
+    open_base: NDArray[np.int64] = open_rule * (size + 1)
+    open_offset: NDArray[np.int64] = open_rule * stride
+    after_target = counts[open_base + candidate_index] + 1
+    before_target = counts[open_base + candidate_index + 1]
+    target = np.where(after, after_target, before_target)
+    valid &= np.where(after, after_target <= counts[open_base + size], before_target > open_offset)
+    deadline_index: NDArray[np.int64] = np.searchsorted(counts, target) - open_base - 1
+
+    deadline_days: NDArray[np.int64] = deadline_index + (court_calendar.start_ordinal - EPOCH_ORDINAL)
+    deadline_dates: NDArray[np.datetime64] = deadline_days.astype('datetime64[D]')
+
+    # compute the deadlines that are not covered by the calendar one at a time
+    for row in np.flatnonzero(~valid.ravel()):
+        position: tuple[int, ...] = np.unravel_index(row, valid.shape)
+        deadline_dates[position] = deadline(dates[position].item(),
+                                            int(days[position]),
+                                            bool(after[position]),
+                                            bool(quebec[position]))
+
+    return deadline_dates
+
+
+def find_year_batch(months: ArrayLike, days: ArrayLike, weekdays: ArrayLike, max_years: ArrayLike) -> NDArray[np.int64]:
+    """
+    Find the most recent year <= max_year in which each (month, day, weekday) combination occurs.
+    The arguments are broadcast against each other, so scalars apply to every row.
+
+    Args:
+        months: the month numbers, from 1 to 12
+        days: the days, from 1 to 31
+        weekdays: the weekday numbers, from 0 to 6
+        max_years: the maximum years to consider
+
+    Returns:
+        the years, as an int64 array
+
+    Raises:
+        ValueError: If any (month, day) is not a valid date, any weekday is out of range,
+            or no such year is at least 1.
+    """
+
+    month_array: NDArray[np.int64] = np.asarray(months, dtype=np.int64)
+    day_array: NDArray[np.int64] = np.asarray(days, dtype=np.int64)
+    weekday_array: NDArray[np.int64] = np.asarray(weekdays, dtype=np.int64)
+    max_year_array: NDArray[np.int64] = np.asarray(max_years, dtype=np.int64)
+    month_array, day_array, weekday_array, max_year_array = np.broadcast_arrays(month_array,
+                                                                                day_array,
+                                                                                weekday_array,
+                                                                                max_year_array)
+
+    if np.any((weekday_array < 0) | (weekday_array > 6)):
+        raise ValueError("every weekday must be from 0 to 6")
+
+    positions: NDArray[np.int64] = 7 * (max_year_array % YEARS_PER_CYCLE) + weekday_array
+    years: NDArray[np.int64] = np.empty(max_year_array.shape, dtype=np.int64)
+
+    # look up the rows of each distinct (month, day) in its table
+    month_days: NDArray[np.int64] = month_array * 32 + day_array
+    for month_day in np.unique(month_days):
+        rows: NDArray[np.bool_] = month_days == month_day
+        table: NDArray[np.uint8] = np.frombuffer(find_year_table(int(month_day) // 32, int(month_day) % 32),
+                                                 dtype=np.uint8)
+        years[rows] = max_year_array[rows] - table[positions[rows]]
+
+    if np.any(years < datetime.MINYEAR):
+        raise ValueError(f"no year is at least {datetime.MINYEAR} for some rows")
+
+    return years
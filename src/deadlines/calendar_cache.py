@@ -0,0 +1,264 @@
+"""
+This module persists precomputed holiday tables and court calendars on disk.
+
+The cache is optional. It is enabled for the default court calendar by setting the
+environment variable DEADLINES_CACHE_DIR to a directory, or by calling the functions
+in this module directly.
+
+Every cache file name includes a key computed from the package version, the rules version,
+the holiday rules themselves, any installed closures and the range of years, so a new release or a change to the rules
+never reads stale entries.
+Files are written atomically, so many processes on one host may share a cache directory.
+Court calendars are stored in the format of `deadlines.calendar_file` and memory-mapped read-only,
+so the processes also share the pages in memory.
+Loading a court calendar also loads the holiday tables for its years into the `calc_holidays` cache,
+so neither the calendar nor the holidays are recomputed.
+"""
+
+import datetime
+import hashlib
+import json
+import os
+import tempfile
+from deadlines.calendar_file import encode_calendar, open_calendar_file
+from deadlines.canadian_holidays import CANADA_JURISDICTION, QUEBEC_JURISDICTION, calc_holidays, rules_fingerprint
+from deadlines.court_calendar import CourtCalendar, DEFAULT_MAX_YEAR, DEFAULT_MIN_YEAR, RULES_VERSION
+from deadlines.closures import ClosureIndex
+from deadlines.dates import get_closure_index
+
+# the environment variable that names the cache directory
+CACHE_DIR_ENV: str = "DEADLINES_CACHE_DIR"
+
+# the name of the distribution, used to look up the package version
+DISTRIBUTION_NAME: str = "federal-court-deadlines"
+
+# the prefixes of the cache file names
+COURT_CALENDAR_PREFIX: str = "court-calendar"
+HOLIDAY_TABLES_PREFIX: str = "holiday-tables"
+
+
+def package_version() -> str:
+    """
+    Get the version of the installed package.
+
+    Returns:
+        the package version, or "unknown" if the package is not installed
+    """
+
+    # import importlib.metadata on first use since it is slow to import
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version(DISTRIBUTION_NAME)
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def cache_dir_from_env() -> str | None:
+    """
+    Get the cache directory named by the environment.
+
+    Returns:
+        the cache directory, or None if the cache is not enabled
+    """
+
+    return os.environ.get(CACHE_DIR_ENV) or None
+
+
+def cache_key(min_year: int, max_year: int) -> str:
+    """
+    Compute the key that identifies the cache entries for a range of years.
+
+    Args:
+        min_year: the first year
+        max_year: the last year
+
+    Returns:
+        the hexadecimal cache key
+    """
+
+    rules: str = rules_fingerprint(CANADA_JURISDICTION, QUEBEC_JURISDICTION)
+    closure_index: ClosureIndex | None = get_closure_index()
+    if closure_index is not None and len(closure_index) > 0:
+        rules += f":{closure_index.fingerprint()}"
+    key_source: str = f"{package_version()}:{RULES_VERSION}:{rules}:{min_year}:{max_year}"
+
+    return hashlib.sha256(key_source.encode()).hexdigest()[:16]
+
+
+def cache_path(cache_dir: str, prefix: str, min_year: int, max_year: int, suffix: str) -> str:
+    """
+    Get the path of a cache file.
+
+    Args:
+        cache_dir: the cache directory
+        prefix: the prefix of the file name
+        min_year: the first year
+        max_year: the last year
+        suffix: the suffix of the file name
+
+    Returns:
+        the path of the cache file
+    """
+
+    file_name: str = f"{prefix}-{min_year}-{max_year}-{cache_key(min_year, max_year)}{suffix}"
+
+    return os.path.join(cache_dir, file_name)
+
+
+def write_atomically(path: str, data: bytes) -> None:
+    """
+    Write a file so that other processes see either no file or the complete file.
+
+    Args:
+        path: the path of the file
+        data: the contents of the file
+    """
+
+    directory: str = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+
+    file_descriptor, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(file_descriptor, "wb") as file:
+            file.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def load_court_calendar(min_year: int = DEFAULT_MIN_YEAR,
+                        max_year: int = DEFAULT_MAX_YEAR,
+                        cache_dir: str | None = None) -> CourtCalendar:
+    """
+    Load a court calendar from the cache, computing and saving it first if it is not cached.
+    The holiday tables for the same years are loaded into the calc_holidays cache first,
+    so a calendar that must be computed reuses them.
+
+    Args:
+        min_year: the first year covered by the calendar
+        max_year: the last year covered by the calendar
+        cache_dir: the cache directory, or None to use the directory named by the environment
+
+    Returns:
+        the court calendar
+
+    Raises:
+        ValueError: If no cache directory is given or named by the environment.
+    """
+
+    cache_dir = cache_dir or cache_dir_from_env()
+    if cache_dir is None:
+        raise ValueError(f"no cache directory is given and {CACHE_DIR_ENV} is not set")
+
+    for (year, is_quebec), holidays in load_holiday_tables(min_year, max_year, cache_dir).items():
+        calc_holidays.store((year, is_quebec), holidays)
+
+    path: str = cache_path(cache_dir, COURT_CALENDAR_PREFIX, min_year, max_year, ".bin")
+
+    if os.path.exists(path):
+        try:
+            return open_calendar_file(path)
+        except ValueError:
+            # the file is damaged, so replace it
+            pass
+
+    write_atomically(path, encode_calendar(CourtCalendar(min_year, max_year)))
+
+    return open_calendar_file(path)
+
+
+def load_holiday_tables(min_year: int,
+                        max_year: int,
+                        cache_dir: str | None = None) -> dict[tuple[int, bool], dict[str, datetime.date]]:
+    """
+    Load the holiday tables for a range of years from the cache,
+    computing and saving them first if they are not cached.
+
+    Args:
+        min_year: the first year
+        max_year: the last year
+        cache_dir: the cache directory, or None to use the directory named by the environment
+
+    Returns:
+        the dictionary of holidays for each (year, is_quebec) pair, as returned by calc_holidays
+
+    Raises:
+        ValueError: If no cache directory is given or named by the environment.
+    """
+
+    cache_dir = cache_dir or cache_dir_from_env()
+    if cache_dir is None:
+        raise ValueError(f"no cache directory is given and {CACHE_DIR_ENV} is not set")
+
+    path: str = cache_path(cache_dir, HOLIDAY_TABLES_PREFIX, min_year, max_year, ".json")
+
+    if os.path.exists(path):
+        try:
+            with open(path, "rb") as file:
+                return decode_holiday_tables(json.load(file))
+        except (ValueError, KeyError, TypeError):
+            # the file is damaged, so replace it
+            pass
+
+    entries: list[dict] = [
+        {
+            "year": year,
+            "is_quebec": is_quebec,
+            "holidays": {name: date.isoformat() for name, date in calc_holidays(year, is_quebec).items()},
+        }
+        for year in range(min_year, max_year + 1)
+        for is_quebec in (False, True)
+    ]
+    write_atomically(path, json.dumps(entries).encode())
+
+    return decode_holiday_tables(entries)
+
+
+def decode_holiday_tables(entries: list[dict]) -> dict[tuple[int, bool], dict[str, datetime.date]]:
+    """
+    Decode the holiday tables stored in a holiday tables file.
+
+    Args:
+        entries: the JSON entries of the file, one for each (year, is_quebec) pair
+
+    Returns:
+        the dictionary of holidays for each (year, is_quebec) pair, as returned by calc_holidays
+
+    Raises:
+        ValueError: If a date is not in ISO format.
+        KeyError: If an entry is missing a field.
+        TypeError: If an entry has the wrong structure.
+    """
+
+    return {
+        (entry["year"], entry["is_quebec"]): {
+            name: datetime.date.fromisoformat(date) for name, date in entry["holidays"].items()
+        }
+        for entry in entries
+    }
+
+
+def clear_cache(cache_dir: str | None = None) -> int:
+    """
+    Remove every cache file, including stale entries from other versions.
+
+    Args:
+        cache_dir: the cache directory, or None to use the directory named by the environment
+
+    Returns:
+        the number of files removed
+    """
+
+    cache_dir = cache_dir or cache_dir_from_env()
+    if cache_dir is None or not os.path.isdir(cache_dir):
+        return 0
+
+    removed: int = 0
+    for file_name in os.listdir(cache_dir):
+        if file_name.startswith((COURT_CALENDAR_PREFIX, HOLIDAY_TABLES_PREFIX)):
+            os.unlink(os.path.join(cache_dir, file_name))
+            removed += 1
+
+    return removed
@@ -0,0 +1,175 @@
+"""
+This module reads and writes court calendars in a compact binary file format.
+
+A calendar file is loaded with `mmap`, and the court calendar reads its flags and prefix sums
+directly from the mapped pages. Worker processes that open the same file therefore share
+one copy of the calendar in memory and allocate nothing per day.
+
+The file consists of:
+* a header, packed as HEADER_FORMAT, giving the magic number, the format version,
+the rules version, the byte order, the key of the jurisdiction, the range of years and the number of days,
+* one byte of `DayFlag` bits per day, padded with zeros so that the prefix sums are aligned, and
+* the prefix sums of non-recess days, court open days and Quebec court open days,
+each stored as number_of_days + 1 native 32-bit ints.
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+from deadlines.court_calendar import CourtCalendar, RULES_VERSION
+
+MAGIC: bytes = b"FCDC"
+FORMAT_VERSION: int = 2
+
+# magic, format version, rules version, byte order, jurisdiction, min year, max year, number of days
+HEADER_FORMAT: str = "<4sHHBx8shhI"
+HEADER_SIZE: int = struct.calcsize(HEADER_FORMAT)
+
+# the byte order of the prefix sums
+BYTE_ORDERS: dict[str, int] = {"little": 0, "big": 1}
+
+# the maximum length of the key of the jurisdiction, which is stored as ASCII padded with zeros
+JURISDICTION_SIZE: int = 8
+
+# the prefix sums are stored as ints of this type code
+COUNTS_TYPECODE: str = "i"
+
+
+def padded_size(size: int) -> int:
+    """
+    Round a size up to a multiple of the size of a prefix sum entry.
+
+    Args:
+        size: the size in bytes
+
+    Returns:
+        the padded size in bytes
+    """
+
+    itemsize: int = array(COUNTS_TYPECODE).itemsize
+
+    return -(-size // itemsize) * itemsize
+
+
+def encode_calendar(court_calendar: CourtCalendar) -> bytes:
+    """
+    Encode a court calendar in the calendar file format.
+
+    Args:
+        court_calendar: the court calendar
+
+    Returns:
+        the contents of the calendar file
+
+    Raises:
+        ValueError: If the key of the jurisdiction of the calendar is longer than JURISDICTION_SIZE ASCII characters.
+    """
+
+    jurisdiction: bytes = court_calendar.jurisdiction.encode("ascii")
+    if len(jurisdiction) > JURISDICTION_SIZE:
+        raise ValueError(f"the jurisdiction key {court_calendar.jurisdiction!r} is too long for a calendar file")
+
+    number_of_days: int = len(court_calendar)
+    header: bytes = struct.pack(HEADER_FORMAT,
+                                MAGIC,
+                                FORMAT_VERSION,
+                                RULES_VERSION,
+                                BYTE_ORDERS[sys.byteorder],
+                                jurisdiction,
+                                court_calendar.min_year,
+                                court_calendar.max_year,
+                                number_of_days)
+    padding: bytes = bytes(padded_size(HEADER_SIZE + number_of_days) - HEADER_SIZE - number_of_days)
+
+    parts: list[bytes] = [header, bytes(court_calendar.flags), padding]
+    for counts in (court_calendar.non_recess_counts, court_calendar.open_counts, court_calendar.quebec_open_counts):
+        parts.append(array(COUNTS_TYPECODE, counts).tobytes())
+
+    return b"".join(parts)
+
+
+def decode_calendar(buffer: memoryview) -> CourtCalendar:
+    """
+    Decode a court calendar from a buffer in the calendar file format without copying it.
+
+    Args:
+        buffer: the contents of the calendar file
+
+    Returns:
+        the court calendar of the jurisdiction given in the header, whose flags and prefix sums are views of the buffer
+
+    Raises:
+        ValueError: If the buffer is not a valid calendar file for this platform and these rules,
+            or its jurisdiction is not registered.
+    """
+
+    if len(buffer) < HEADER_SIZE:
+        raise ValueError("the calendar file is too short")
+
+    magic, format_version, rules_version, byte_order, jurisdiction, min_year, max_year, number_of_days = \
+        struct.unpack_from(HEADER_FORMAT, buffer)
+
+    if magic != MAGIC:
+        raise ValueError("the file is not a calendar file")
+
+    if format_version != FORMAT_VERSION:
+        raise ValueError(f"the calendar file format version {format_version} is not supported")
+
+    if rules_version != RULES_VERSION:
+        raise ValueError(f"the calendar file was computed with rules version {rules_version}")
+
+    if byte_order != BYTE_ORDERS[sys.byteorder]:
+        raise ValueError("the calendar file was written on a platform with a different byte order")
+
+    counts_start: int = padded_size(HEADER_SIZE + number_of_days)
+    counts_size: int = (number_of_days + 1) * array(COUNTS_TYPECODE).itemsize
+    if len(buffer) != counts_start + 3 * counts_size:
+        raise ValueError("the calendar file has the wrong size")
+
+    flags: memoryview = buffer[HEADER_SIZE:HEADER_SIZE + number_of_days]
+    counts: list[memoryview] = [
+        buffer[start:start + counts_size].cast(COUNTS_TYPECODE)
+        for start in range(counts_start, counts_start + 3 * counts_size, counts_size)
+    ]
+
+    return CourtCalendar(min_year,
+                         max_year,
+                         flags,
+                         (counts[0], counts[1], counts[2]),
+                         jurisdiction.rstrip(b"\0").decode("ascii"))
+
+
+def write_calendar_file(path: str, court_calendar: CourtCalendar) -> None:
+    """
+    Write a court calendar to a calendar file.
+
+    Args:
+        path: the path of the calendar file
+        court_calendar: the court calendar
+    """
+
+    with open(path, "wb") as file:
+        file.write(encode_calendar(court_calendar))
+
+
+def open_calendar_file(path: str) -> CourtCalendar:
+    """
+    Open a calendar file as a court calendar backed by a read-only memory map.
+
+    Args:
+        path: the path of the calendar file
+
+    Returns:
+        the court calendar
+
+    Raises:
+        ValueError: If the file is not a valid calendar file.
+    """
+
+    with open(path, "rb") as file:
+        if file.seek(0, 2) == 0:
+            raise ValueError("the calendar file is empty")
+        buffer: memoryview = memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+
+    return decode_calendar(buffer)
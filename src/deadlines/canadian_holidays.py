@@ -26,13 +26,18 @@ mourning or day of public rejoicing or thanksgiving;
     * (b) in any city, town, municipality or other organized district, any day appointed to be observed
     as a civic holiday by resolution of the council or other authority charged with the administration of the civic or
     municipal affairs of the city, town, municipality or district; (jour férié)
+
+The holidays are described by declarative rules, such as a fixed date or the nth weekday of a month,
+and each jurisdiction registers the rules it observes, optionally on top of those of a parent jurisdiction.
+The rules are defined in `holiday_rules`, which is imported and registered on first use to keep startup fast.
+`calc_holidays` compiles the rules of a jurisdiction into a table of dates for each year and caches it.
+The CA jurisdiction holds the holidays used when is_quebec is False and QC those used when it is True.
 """
 
-import calendar
 import datetime
-from functools import cache
-from holidays import country_holidays, HolidayBase
-from deadlines.enums import Month, Weekday
+from bisect import bisect_left, bisect_right
+from deadlines.enums import Weekday
+from deadlines.memo import bounded_cache
 
 # days listed at https://www.canada.ca/en/revenue-agency/services/tax/public-holidays.html
 NEW_YEARS_DAY: str = "New Year's Day"
@@ -50,6 +55,12 @@ THANKSGIVING_DAY: str = "Thanksgiving Day"
 CHRISTMAS_DAY: str = "Christmas Day"
 BOXING_DAY: str = "Boxing Day"
 
+# provincial holidays
+FAMILY_DAY: str = "Family Day"
+LOUIS_RIEL_DAY: str = "Louis Riel Day"
+HERITAGE_DAY: str = "Heritage Day"
+BC_DAY: str = "British Columbia Day"
+
 PUBLIC_HOLIDAYS: list[str] = [
     NEW_YEARS_DAY,
     GOOD_FRIDAY,
@@ -71,7 +82,24 @@ QUEBEC_ONLY: list[str] = [SAINT_JEAN_BAPTISTE_DAY]
 
 EXCLUDING_QUEBEC: list[str] = [CIVIC_HOLIDAY]
 
+PROVINCIAL_HOLIDAYS: list[str] = [FAMILY_DAY, LOUIS_RIEL_DAY, HERITAGE_DAY, BC_DAY]
+
+# the jurisdictions whose holidays are used when no jurisdiction is given, depending on is_quebec
+CANADA_JURISDICTION: str = "CA"
+QUEBEC_JURISDICTION: str = "QC"
+
+# the maximum number of (year, jurisdiction) holiday tables kept by calc_holidays
+HOLIDAY_CACHE_SIZE: int = 512
+
+# the range of years covered by the shared holiday index, which matches the default court calendar
+HOLIDAY_INDEX_MIN_YEAR: int = 2000
+HOLIDAY_INDEX_MAX_YEAR: int = 2050
+
+# the maximum number of holiday indexes kept by holiday_index
+HOLIDAY_INDEX_CACHE_SIZE: int = 8
+
 # these are the only holidays defined for Canada in the `holidays` package
+# the `holidays` package is an optional dependency that is only used to cross-check the calculations here
 HOLIDAYS_PACKAGE: list[str] = [
     NEW_YEARS_DAY,
     GOOD_FRIDAY,
@@ -81,6 +109,126 @@ HOLIDAYS_PACKAGE: list[str] = [
 ]
 
 
+# the holiday rules of each jurisdiction, as (name, rule) pairs in the order their holidays are listed
+# a name may appear more than once if its rules apply in different years
+# this is None until the built-in jurisdictions are registered on first use
+_jurisdictions: dict[str, list[tuple[str, object]]] | None = None
+
+
+def registered_jurisdictions() -> dict[str, list[tuple[str, object]]]:
+    """
+    Get the holiday rules of every registered jurisdiction, registering the built-in jurisdictions on first use.
+    The rules are built on first use since building them would slow down startup.
+
+    Returns:
+        the (name, rule) pairs of each jurisdiction, keyed by the key of the jurisdiction
+    """
+
+    global _jurisdictions
+    if _jurisdictions is None:
+        from deadlines.holiday_rules import BUILT_IN_JURISDICTIONS
+
+        _jurisdictions = {}
+        for jurisdiction, rules, parent, excluded_names in BUILT_IN_JURISDICTIONS:
+            register_jurisdiction(jurisdiction, rules, parent, excluded_names)
+
+    return _jurisdictions
+
+
+def register_jurisdiction(jurisdiction: str,
+                          rules: list[tuple[str, object]],
+                          parent: str | None = None,
+                          excluded_names: list[str] | None = None) -> None:
+    """
+    Register the holiday rules of a jurisdiction, such as a province or a municipality.
+    The rules of a registered jurisdiction must not change after its holidays have been calculated.
+
+    Args:
+        jurisdiction: the key of the jurisdiction
+        rules: the (name, rule) pairs of the holidays observed in the jurisdiction,
+            where each rule has a date(year) method that returns the date of the holiday, or None
+        parent: the key of a jurisdiction whose holidays are also observed, or None
+        excluded_names: the names of holidays of the parent that are not observed
+
+    Raises:
+        ValueError: If the parent is not registered.
+    """
+
+    all_rules: dict[str, list[tuple[str, object]]] = registered_jurisdictions()
+    parent_rules: list[tuple[str, object]] = jurisdiction_rules(parent) if parent is not None else []
+    excluded: set[str] = set(excluded_names or [])
+    all_rules[jurisdiction] = [(name, rule) for name, rule in parent_rules if name not in excluded] + rules
+
+
+def jurisdiction_rules(jurisdiction: str) -> list[tuple[str, object]]:
+    """
+    Get the holiday rules of a jurisdiction.
+
+    Args:
+        jurisdiction: the key of the jurisdiction
+
+    Returns:
+        the (name, rule) pairs of the holidays observed in the jurisdiction
+
+    Raises:
+        ValueError: If the jurisdiction is not registered.
+    """
+
+    all_rules: dict[str, list[tuple[str, object]]] = registered_jurisdictions()
+    if jurisdiction not in all_rules:
+        raise ValueError(f"unknown jurisdiction {jurisdiction!r}")
+
+    return all_rules[jurisdiction]
+
+
+def jurisdictions() -> list[str]:
+    """
+    Get the keys of the registered jurisdictions.
+
+    Returns:
+        the keys, in the order the jurisdictions were registered
+    """
+
+    return list(registered_jurisdictions())
+
+
+def resolve_jurisdiction(jurisdiction: str | None = None, is_quebec: bool = False) -> str:
+    """
+    Get the key of the jurisdiction whose holidays apply.
+
+    Args:
+        jurisdiction: the key of the jurisdiction, or None to choose it with is_quebec
+        is_quebec: if True and no jurisdiction is given, apply Quebec holidays
+
+    Returns:
+        the key of the jurisdiction
+
+    Raises:
+        ValueError: If the jurisdiction is not registered.
+    """
+
+    if jurisdiction is None:
+        return QUEBEC_JURISDICTION if is_quebec else CANADA_JURISDICTION
+
+    jurisdiction_rules(jurisdiction)
+    return jurisdiction
+
+
+def rules_fingerprint(*keys: str) -> str:
+    """
+    Describe the holiday rules of some jurisdictions, so that data computed from them can be invalidated
+    when they change.
+
+    Args:
+        keys: the keys of the jurisdictions
+
+    Returns:
+        a string that changes whenever the rules of any of the jurisdictions change
+    """
+
+    return ";".join(f"{key}={jurisdiction_rules(key)!r}" for key in keys)
+
+
 def calc_first_monday(year:int, month:int) -> datetime.date:
     """
     Calculate the first Monday of a given month and year.
@@ -93,20 +241,9 @@ def calc_first_monday(year:int, month:int) -> datetime.date:
         the date of the first Monday of the given month and year
     """
 
-    # Calculate the first day of the month
-    first_day_date: datetime.date = datetime.date(year, month, 1)
-
-    # recall that weekdays are numbered from 0 (Monday) to 6 (Sunday)
-    first_weekday: int = first_day_date.weekday()
-
-    # Calculate the day of the month of the first Monday
-    first_monday_day: int = 1 if first_weekday == Weekday.MONDAY else 8 - first_weekday
-    first_monday_date: datetime.date = datetime.date(year, month, first_monday_day)
+    from deadlines.holiday_rules import NthWeekday
 
-    # assert that the first Monday is indeed a Monday
-    assert first_monday_date.weekday() == Weekday.MONDAY
-
-    return first_monday_date
+    return NthWeekday(month, Weekday.MONDAY, 1).date(year)
 
 
 def calc_new_years_day(year:int) -> datetime.date:
@@ -119,36 +256,43 @@ def calc_new_years_day(year:int) -> datetime.date:
     Returns:
         the date of New Year's Day for the given year
     """
-    # New Year's Day is celebrated on January 1
-    return datetime.date(year, Month.JANUARY, 1)
 
+    from deadlines.holiday_rules import NEW_YEARS_DAY_RULE
 
-def calc_good_friday(year:int) -> datetime.date:
+    return NEW_YEARS_DAY_RULE.date(year)
+
+
+def calc_holidays_package_date(year: int, name: str) -> datetime.date:
     """
-    Calculate Good Friday for a given year.
+    Look up a Canadian holiday in the `holidays` package.
+    The package is imported on first use since it is optional and slow to import.
 
     Args:
         year: the year
+        name: the name of the holiday, which must be one of HOLIDAYS_PACKAGE
 
     Returns:
-        the date of Good Friday for the given year
+        the date of the holiday in the given year
+
+    Raises:
+        ImportError: If the `holidays` package is not installed.
     """
 
+    from holidays import country_holidays, HolidayBase
+
     ca_holidays: HolidayBase = country_holidays('CA', years=year)
-    matches:list[datetime.date] = ca_holidays.get_named(GOOD_FRIDAY, lookup='exact')
+    matches: list[datetime.date] = ca_holidays.get_named(name, lookup='exact')
 
-    # assert that there is exactly one match for Good Friday
+    # assert that there is exactly one match for the holiday
     assert len(matches) == 1
 
-    # assert that Good Friday is indeed a Friday
-    assert matches[0].weekday() == Weekday.FRIDAY
-
     return matches[0]
 
 
 def calc_easter_sunday(year:int) -> datetime.date:
     """
     Calculate Easter Sunday for a given year.
+    This uses the Anonymous Gregorian algorithm, also known as the Meeus/Jones/Butcher algorithm.
 
     Args:
         year: the year
@@ -157,8 +301,56 @@ def calc_easter_sunday(year:int) -> datetime.date:
         the date of Easter Sunday for the given year
     """
 
-    # Easter Sunday is 2 days after Good Friday
-    return calc_good_friday(year) + datetime.timedelta(days=2)
+    # the position of the year in the 19-year Metonic cycle
+    a: int = year % 19
+
+    # the century and the year within it
+    b: int
+    c: int
+    b, c = divmod(year, 100)
+
+    # the leap year corrections
+    d: int
+    e: int
+    d, e = divmod(b, 4)
+
+    # the correction for the lunar orbit
+    g: int = (8 * b + 13) // 25
+
+    # the number of days from March 21 to the Paschal full moon
+    h: int = (19 * a + b - d - g + 15) % 30
+
+    # the number of days from the Paschal full moon to the following Sunday
+    i: int
+    k: int
+    i, k = divmod(c, 4)
+    l: int = (2 * e + 2 * i - h - k + 32) % 7
+    m: int = (a + 11 * h + 19 * l) // 433
+
+    month: int = (h + l - 7 * m + 90) // 25
+    day: int = (h + l - 7 * m + 33 * month + 19) % 32
+    easter_sunday_date: datetime.date = datetime.date(year, month, day)
+
+    # assert that Easter Sunday is indeed a Sunday
+    assert easter_sunday_date.weekday() == Weekday.SUNDAY
+
+    return easter_sunday_date
+
+
+def calc_good_friday(year:int) -> datetime.date:
+    """
+    Calculate Good Friday for a given year.
+
+    Args:
+        year: the year
+
+    Returns:
+        the date of Good Friday for the given year
+    """
+
+    from deadlines.holiday_rules import GOOD_FRIDAY_RULE
+
+    return GOOD_FRIDAY_RULE.date(year)
 
 
 def calc_easter_monday(year:int) -> datetime.date:
@@ -172,8 +364,9 @@ def calc_easter_monday(year:int) -> datetime.date:
         the date of Easter Monday for the given year
     """
 
-    # Easter Monday is 3 days after Good Friday
-    return calc_good_friday(year) + datetime.timedelta(days=3)
+    from deadlines.holiday_rules import EASTER_MONDAY_RULE
+
+    return EASTER_MONDAY_RULE.date(year)
 
 
 def calc_victoria_day(year:int) -> datetime.date:
@@ -187,20 +380,9 @@ def calc_victoria_day(year:int) -> datetime.date:
         the date of Victoria Day for the given year
     """
 
-    # Victoria Day is celebrated on the last Monday before May 25
-    may_25_date: datetime.date = datetime.date(year, Month.MAY, 25)
-
-    # recall that weekdays are numbered from 0 (Monday) to 6 (Sunday)
-    may_25_weekday: int = may_25_date.weekday()
-
-    # Calculate the gap between Victoria Day and May 25
-    gap: int = may_25_weekday if may_25_weekday > Weekday.MONDAY else 7
-    victoria_day_date: datetime.date = may_25_date - datetime.timedelta(days=gap)
-
-    # assert that Victoria Day is a Monday
-    assert victoria_day_date.weekday() == Weekday.MONDAY
+    from deadlines.holiday_rules import VICTORIA_DAY_RULE
 
-    return victoria_day_date
+    return VICTORIA_DAY_RULE.date(year)
 
 
 def calc_saint_jean_baptiste_day(year:int) -> datetime.date:
@@ -214,8 +396,9 @@ def calc_saint_jean_baptiste_day(year:int) -> datetime.date:
         the date of Saint-Jean-Baptiste Day for the given year
     """
 
-    # Saint-Jean-Baptiste Day is celebrated on June 24
-    return datetime.date(year, Month.JUNE, 24)
+    from deadlines.holiday_rules import SAINT_JEAN_BAPTISTE_DAY_RULE
+
+    return SAINT_JEAN_BAPTISTE_DAY_RULE.date(year)
 
 
 def calc_canada_day(year:int) -> datetime.date:
@@ -229,14 +412,9 @@ def calc_canada_day(year:int) -> datetime.date:
         the date of Canada Day for the given year
     """
 
-    # Canada Day is normally celebrated on July 1
-    july_1_date: datetime.date = datetime.date(year, Month.JULY, 1)
-
-    # If July 1 is a Sunday, Canada Day is celebrated on July 2
-    if july_1_date.weekday() == Weekday.SUNDAY:
-        return datetime.date(year, Month.JULY, 2)
+    from deadlines.holiday_rules import CANADA_DAY_RULE
 
-    return july_1_date
+    return CANADA_DAY_RULE.date(year)
 
 
 def calc_civic_holiday(year:int) -> datetime.date:
@@ -250,8 +428,9 @@ def calc_civic_holiday(year:int) -> datetime.date:
         the date of Civic Holiday for the given year
     """
 
-    # Civic Holiday is celebrated on the first Monday in August
-    return calc_first_monday(year, Month.AUGUST)
+    from deadlines.holiday_rules import CIVIC_HOLIDAY_RULE
+
+    return CIVIC_HOLIDAY_RULE.date(year)
 
 
 def calc_labour_day(year:int) -> datetime.date:
@@ -265,8 +444,9 @@ def calc_labour_day(year:int) -> datetime.date:
         the date of Labour Day for the given year
     """
 
-    # Labour Day is celebrated on the first Monday in September
-    return calc_first_monday(year, Month.SEPTEMBER)
+    from deadlines.holiday_rules import LABOUR_DAY_RULE
+
+    return LABOUR_DAY_RULE.date(year)
 
 
 def calc_national_day_for_truth_and_reconciliation(year:int) -> datetime.date:
@@ -280,8 +460,9 @@ def calc_national_day_for_truth_and_reconciliation(year:int) -> datetime.date:
         the date of National Day for Truth and Reconciliation for the given year
     """
 
-    # National Day for Truth and Reconciliation is celebrated on September 30
-    return datetime.date(year, Month.SEPTEMBER, 30)
+    from deadlines.holiday_rules import NATIONAL_DAY_FOR_TRUTH_AND_RECONCILIATION_RULE
+
+    return NATIONAL_DAY_FOR_TRUTH_AND_RECONCILIATION_RULE.date(year)
 
 def calc_remembrance_day(year:int) -> datetime.date:
     """
@@ -294,8 +475,9 @@ def calc_remembrance_day(year:int) -> datetime.date:
         the date of Remembrance Day for the given year
     """
 
-    # Remembrance Day is celebrated on November 11
-    return datetime.date(year, Month.NOVEMBER, 11)
+    from deadlines.holiday_rules import REMEMBRANCE_DAY_RULE
+
+    return REMEMBRANCE_DAY_RULE.date(year)
 
 def calc_thanksgiving_day(year:int) -> datetime.date:
     """
@@ -308,10 +490,9 @@ def calc_thanksgiving_day(year:int) -> datetime.date:
         the date of Thanksgiving Day for the given year
     """
 
-    first_monday_date: datetime.date = calc_first_monday(year, Month.OCTOBER)
+    from deadlines.holiday_rules import THANKSGIVING_DAY_RULE
 
-    # Thanksgiving Day is celebrated on the second Monday in October
-    return first_monday_date + datetime.timedelta(days=7)
+    return THANKSGIVING_DAY_RULE.date(year)
 
 
 def calc_christmas_day(year:int) -> datetime.date:
@@ -325,8 +506,9 @@ def calc_christmas_day(year:int) -> datetime.date:
         the date of Christmas Day for the given year
     """
 
-    # Christmas Day is celebrated on December 25
-    return datetime.date(year, Month.DECEMBER, 25)
+    from deadlines.holiday_rules import CHRISTMAS_DAY_RULE
+
+    return CHRISTMAS_DAY_RULE.date(year)
 
 
 def calc_boxing_day(year:int) -> datetime.date:
@@ -340,42 +522,233 @@ def calc_boxing_day(year:int) -> datetime.date:
         the date of Boxing Day for the given year
     """
 
-    # Boxing Day is celebrated on December 26
-    return datetime.date(year, Month.DECEMBER, 26)
+    from deadlines.holiday_rules import BOXING_DAY_RULE
+
+    return BOXING_DAY_RULE.date(year)
+
+
+def holidays_cache_key(year: int, is_quebec: bool = False, jurisdiction: str | None = None) -> tuple[int, str]:
+    """
+    Get the key under which calc_holidays caches the holidays of a year.
+    The key is the same however the jurisdiction is chosen,
+    so calc_holidays(year, True) and calc_holidays(year, jurisdiction="QC") share one entry.
+
+    Args:
+        year: the year
+        is_quebec: if True and no jurisdiction is given, include Quebec holidays
+        jurisdiction: the key of the jurisdiction, or None to choose it with is_quebec
 
+    Returns:
+        the year and the key of the jurisdiction
 
-@cache
-def calc_holidays(year: int, is_quebec: bool = False) -> dict[str, datetime.date]:
+    Raises:
+        ValueError: If the jurisdiction is not registered.
     """
-    Calculate the Canadian public holidays for a given year.
+
+    return year, resolve_jurisdiction(jurisdiction, is_quebec)
+
+
+@bounded_cache(HOLIDAY_CACHE_SIZE, key=holidays_cache_key)
+def calc_holidays(year: int, is_quebec: bool = False, jurisdiction: str | None = None) -> dict[str, datetime.date]:
+    """
+    Calculate the Canadian public holidays for a given year by compiling the rules of a jurisdiction.
     Cache the results to avoid recomputing them.
+    The cache keeps the most recently used years, so arbitrary years do not make it grow without limit.
 
     Args:
         year: the year
-        is_quebec: if True, include Quebec holidays
+        is_quebec: if True and no jurisdiction is given, include Quebec holidays
+        jurisdiction: the key of the jurisdiction, or None to choose it with is_quebec
 
     Returns:
         the dictionary of Canadian public holidays for the given year
+
+    Raises:
+        ValueError: If the jurisdiction is not registered.
     """
 
-    all_holidays: dict[str, datetime.date] = {
-        NEW_YEARS_DAY: calc_new_years_day(year),
-        GOOD_FRIDAY: calc_good_friday(year),
-        EASTER_SUNDAY: calc_easter_sunday(year),
-        EASTER_MONDAY: calc_easter_monday(year),
-        VICTORIA_DAY: calc_victoria_day(year),
-        CANADA_DAY: calc_canada_day(year),
-        LABOUR_DAY: calc_labour_day(year),
-        NATIONAL_DAY_FOR_TRUTH_AND_RECONCILIATION: calc_national_day_for_truth_and_reconciliation(year),
-        THANKSGIVING_DAY: calc_thanksgiving_day(year),
-        REMEMBRANCE_DAY: calc_remembrance_day(year),
-        CHRISTMAS_DAY: calc_christmas_day(year),
-        BOXING_DAY: calc_boxing_day(year),
-    }
-
-    if is_quebec:
-        all_holidays[SAINT_JEAN_BAPTISTE_DAY] = calc_saint_jean_baptiste_day(year)
-    else:
-        all_holidays[CIVIC_HOLIDAY] = calc_civic_holiday(year)
+    all_holidays: dict[str, datetime.date] = {}
+    for name, rule in jurisdiction_rules(resolve_jurisdiction(jurisdiction, is_quebec)):
+        holiday_date: datetime.date | None = rule.date(year)
+        if holiday_date is not None:
+            all_holidays[name] = holiday_date
 
     return all_holidays
+
+
+def warm_holidays(min_year: int, max_year: int) -> None:
+    """
+    Calculate and cache the Canadian public holidays for a range of years, with and without Quebec holidays.
+    Since the cache key does not depend on how the jurisdiction is chosen, this also warms the holidays
+    of the CA and QC jurisdictions that court calendars use.
+
+    Args:
+        min_year: the first year
+        max_year: the last year
+    """
+
+    calc_holidays.warm_up((year, is_quebec) for year in range(min_year, max_year + 1) for is_quebec in (False, True))
+
+
+class HolidayIndex:
+    """
+    A reverse index from dates to the names of the Canadian public holidays on them, covering a range of years.
+    """
+
+    def __init__(self, min_year: int, max_year: int, is_quebec: bool = False, jurisdiction: str | None = None):
+        """
+        Index the holidays for every year in the range.
+
+        Args:
+            min_year: the first year covered by the index
+            max_year: the last year covered by the index
+            is_quebec: if True and no jurisdiction is given, index Quebec holidays
+            jurisdiction: the key of the jurisdiction, or None to choose it with is_quebec
+
+        Raises:
+            ValueError: If min_year is greater than max_year, or the jurisdiction is not registered.
+        """
+
+        if min_year > max_year:
+            raise ValueError("min_year must not be greater than max_year")
+
+        self.min_year: int = min_year
+        self.max_year: int = max_year
+        self.jurisdiction: str = resolve_jurisdiction(jurisdiction, is_quebec)
+
+        # the holiday names keyed by the ordinal of their date, and the ordinals in increasing order
+        self.names: dict[int, str] = {}
+        for year in range(min_year, max_year + 1):
+            for name, holiday_date in calc_holidays(year, jurisdiction=self.jurisdiction).items():
+                ordinal: int = holiday_date.toordinal()
+                # two holidays on the same date share one entry
+                self.names[ordinal] = f"{self.names[ordinal]}; {name}" if ordinal in self.names else name
+        self.ordinals: list[int] = sorted(self.names)
+
+    def covers(self, date: datetime.date) -> bool:
+        """
+        Check if a given date is covered by the index.
+
+        Args:
+            date: the given date
+
+        Returns:
+            True if the date is covered, False otherwise
+        """
+
+        return self.min_year <= date.year <= self.max_year
+
+    def holiday_name(self, date: datetime.date) -> str | None:
+        """
+        Get the name of the holiday on a given date.
+
+        Args:
+            date: the given date, which must be covered by the index
+
+        Returns:
+            the name of the holiday, or None if the date is not a holiday
+        """
+
+        return self.names.get(date.toordinal())
+
+    def holidays_between(self, start_date: datetime.date, end_date: datetime.date) -> list[tuple[datetime.date, str]]:
+        """
+        Get the holidays between two dates inclusive.
+
+        Args:
+            start_date: the first date
+            end_date: the last date
+
+        Returns:
+            the date and name of each holiday covered by the index between the dates, in date order
+        """
+
+        start_position: int = bisect_left(self.ordinals, start_date.toordinal())
+        end_position: int = bisect_right(self.ordinals, end_date.toordinal())
+
+        return [(datetime.date.fromordinal(ordinal), self.names[ordinal])
+                for ordinal in self.ordinals[start_position:end_position]]
+
+
+@bounded_cache(HOLIDAY_INDEX_CACHE_SIZE)
+def holiday_index(min_year: int, max_year: int, jurisdiction: str = CANADA_JURISDICTION) -> HolidayIndex:
+    """
+    Get the holiday index of a jurisdiction for a range of years.
+    Cache the results to avoid rebuilding them.
+
+    Args:
+        min_year: the first year covered by the index
+        max_year: the last year covered by the index
+        jurisdiction: the key of the jurisdiction
+
+    Returns:
+        the holiday index
+    """
+
+    return HolidayIndex(min_year, max_year, jurisdiction=jurisdiction)
+
+
+def holiday_index_for_years(min_year: int,
+                            max_year: int,
+                            is_quebec: bool = False,
+                            jurisdiction: str | None = None) -> HolidayIndex:
+    """
+    Get a holiday index that covers a range of years, preferring the index for the default range of years.
+
+    Args:
+        min_year: the first year needed
+        max_year: the last year needed
+        is_quebec: if True and no jurisdiction is given, index Quebec holidays
+        jurisdiction: the key of the jurisdiction, or None to choose it with is_quebec
+
+    Returns:
+        the holiday index
+    """
+
+    jurisdiction = resolve_jurisdiction(jurisdiction, is_quebec)
+    if HOLIDAY_INDEX_MIN_YEAR <= min_year and max_year <= HOLIDAY_INDEX_MAX_YEAR:
+        return holiday_index(HOLIDAY_INDEX_MIN_YEAR, HOLIDAY_INDEX_MAX_YEAR, jurisdiction)
+
+    return holiday_index(min_year, max_year, jurisdiction)
+
+
+def holiday_name(date: datetime.date, is_quebec: bool = False, jurisdiction: str | None = None) -> str | None:
+    """
+    Get the name of the Canadian public holiday on a given date.
+
+    Args:
+        date: the given date
+        is_quebec: if True and no jurisdiction is given, include Quebec holidays
+        jurisdiction: the key of the jurisdiction, or None to choose it with is_quebec
+
+    Returns:
+        the name of the holiday, or None if the date is not a holiday
+    """
+
+    return holiday_index_for_years(date.year, date.year, is_quebec, jurisdiction).holiday_name(date)
+
+
+def holidays_between(start_date: datetime.date,
+                     end_date: datetime.date,
+                     is_quebec: bool = False,
+                     jurisdiction: str | None = None) -> list[tuple[datetime.date, str]]:
+    """
+    Get the Canadian public holidays between two dates inclusive.
+
+    Args:
+        start_date: the first date
+        end_date: the last date
+        is_quebec: if True and no jurisdiction is given, include Quebec holidays
+        jurisdiction: the key of the jurisdiction, or None to choose it with is_quebec
+
+    Returns:
+        the date and name of each holiday between the dates, in date order
+    """
+
+    if start_date > end_date:
+        return []
+
+    return holiday_index_for_years(start_date.year,
+                                   end_date.year,
+                                   is_quebec,
+                                   jurisdiction).holidays_between(start_date, end_date)
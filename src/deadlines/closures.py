@@ -0,0 +1,470 @@
+"""
+This module models court closures that are not given by the holiday and recess rules.
+
+A closure is a period during which the court is closed, such as a storm, a system outage or a
+proclaimed day of mourning, or a period of additional recess. Closures are loaded from a CSV file
+with the columns start_date, end_date, kind and reason, so they can change without a code change.
+The end date may be left empty for a one-day closure and the kind defaults to a closure.
+
+A closure index keeps the periods of each kind merged and sorted, so point and range queries
+take a binary search. Installing an index makes `dates.is_recess`, `dates.is_court_open` and the
+court calendars take the closures into account. The calendars are rebuilt on first use, so the
+deadline calculations keep reading a single byte per day.
+
+A closure may also be added or removed after the calendars are built, for example when a day of
+mourning is proclaimed. Only the flags of the days of the closure, and the prefix sums after them,
+are patched in the installed calendars. Given a batch of previously computed deadlines, only those
+whose days overlap the closure are recomputed to report which of them changed.
+"""
+
+import csv
+import datetime
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+from collections.abc import Iterable, Sequence
+from deadlines.court_calendar import (CLOSURE, RECESS, CourtCalendar, court_calendar_for_years, reset_court_calendars,
+                                      with_open_flags)
+from deadlines.dates import get_closure_index, installed_calendars, is_rule_recess, parse_date, set_closure_index
+from deadlines.due_dates import DeadlineRequest, deadline
+from deadlines.enums import ClosureKind
+
+# a period of closure, from start_date to end_date inclusive
+Closure = namedtuple("Closure", ["start_date", "end_date", "kind", "reason"], defaults=[ClosureKind.CLOSURE, ""])
+
+
+def closure_dates(closure: Closure) -> tuple[datetime.date, datetime.date]:
+    """
+    Get the sort key of a closure, since closures of different kinds cannot be compared.
+
+    Args:
+        closure: the closure
+
+    Returns:
+        the start date and end date of the closure
+    """
+
+    return closure.start_date, closure.end_date
+
+
+class ClosureIntervals:
+    """
+    A sorted list of disjoint periods of one kind of closure.
+    """
+
+    def __init__(self, closures: Iterable[Closure]):
+        """
+        Merge overlapping and adjacent periods.
+
+        Args:
+            closures: the closures, in any order
+        """
+
+        # the first and last ordinals of each merged period, and the reasons for it
+        self.starts: list[int] = []
+        self.ends: list[int] = []
+        self.reasons: list[str] = []
+        for closure in sorted(closures, key=closure_dates):
+            start: int = closure.start_date.toordinal()
+            end: int = closure.end_date.toordinal()
+            if self.ends and start <= self.ends[-1] + 1:
+                self.ends[-1] = max(self.ends[-1], end)
+                if closure.reason and closure.reason not in self.reasons[-1].split("; "):
+                    self.reasons[-1] = f"{self.reasons[-1]}; {closure.reason}" if self.reasons[-1] else closure.reason
+            else:
+                self.starts.append(start)
+                self.ends.append(end)
+                self.reasons.append(closure.reason)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def find(self, date: datetime.date) -> int | None:
+        """
+        Find the period that contains a given date.
+
+        Args:
+            date: the given date
+
+        Returns:
+            the position of the period, or None if no period contains the date
+        """
+
+        ordinal: int = date.toordinal()
+        position: int = bisect_right(self.starts, ordinal) - 1
+        if position >= 0 and ordinal <= self.ends[position]:
+            return position
+
+        return None
+
+    def between(self, start_date: datetime.date, end_date: datetime.date) -> range:
+        """
+        Find the periods that overlap two dates inclusive.
+
+        Args:
+            start_date: the first date
+            end_date: the last date
+
+        Returns:
+            the positions of the periods
+        """
+
+        return range(bisect_left(self.ends, start_date.toordinal()),
+                     bisect_right(self.starts, end_date.toordinal()))
+
+
+class ClosureIndex:
+    """
+    An index of the periods of recess and closure, each merged and sorted for binary search.
+    """
+
+    def __init__(self, closures: Iterable[Closure] = ()):
+        """
+        Index closures.
+
+        Args:
+            closures: the closures, in any order
+
+        Raises:
+            ValueError: If a closure ends before it starts.
+        """
+
+        closures = list(closures)
+        for closure in closures:
+            if closure.end_date < closure.start_date:
+                raise ValueError(f"the closure {closure} ends before it starts")
+
+        self.intervals: dict[ClosureKind, ClosureIntervals] = {
+            kind: ClosureIntervals(closure for closure in closures if closure.kind == kind) for kind in ClosureKind
+        }
+
+    def __len__(self) -> int:
+        return sum(len(intervals) for intervals in self.intervals.values())
+
+    def closure(self, date: datetime.date) -> Closure | None:
+        """
+        Get the closure that contains a given date, preferring a recess to a closure.
+
+        Args:
+            date: the given date
+
+        Returns:
+            the merged period that contains the date, or None if the court is not closed by the index
+        """
+
+        for kind, intervals in self.intervals.items():
+            position: int | None = intervals.find(date)
+            if position is not None:
+                return self._closure(kind, position)
+
+        return None
+
+    def is_recess(self, date: datetime.date) -> bool:
+        """
+        Check if a given date is during a period of additional recess.
+
+        Args:
+            date: the given date
+
+        Returns:
+            True if the date is during a recess period of the index, False otherwise
+        """
+
+        return self.intervals[ClosureKind.RECESS].find(date) is not None
+
+    def is_closure(self, date: datetime.date) -> bool:
+        """
+        Check if the court is closed on a given date by a closure that is not a recess.
+
+        Args:
+            date: the given date
+
+        Returns:
+            True if the date is during a closure period of the index, False otherwise
+        """
+
+        return self.intervals[ClosureKind.CLOSURE].find(date) is not None
+
+    def closures_between(self, start_date: datetime.date, end_date: datetime.date) -> list[Closure]:
+        """
+        Get the closures that overlap two dates inclusive.
+
+        Args:
+            start_date: the first date
+            end_date: the last date
+
+        Returns:
+            the merged periods that overlap the dates, ordered by start date
+        """
+
+        closures: list[Closure] = [self._closure(kind, position)
+                                   for kind, intervals in self.intervals.items()
+                                   for position in intervals.between(start_date, end_date)]
+
+        return sorted(closures, key=closure_dates)
+
+    def closures(self) -> list[Closure]:
+        """
+        Get every closure of the index.
+
+        Returns:
+            the merged periods, ordered by start date
+        """
+
+        closures: list[Closure] = [self._closure(kind, position)
+                                   for kind, intervals in self.intervals.items()
+                                   for position in range(len(intervals))]
+
+        return sorted(closures, key=closure_dates)
+
+    def with_closure(self, closure: Closure) -> "ClosureIndex":
+        """
+        Get a copy of the index with a closure added.
+
+        Args:
+            closure: the closure to add
+
+        Returns:
+            the new closure index
+
+        Raises:
+            ValueError: If the closure ends before it starts.
+        """
+
+        return ClosureIndex(self.closures() + [closure])
+
+    def without_closure(self, closure: Closure) -> "ClosureIndex":
+        """
+        Get a copy of the index with the days of a closure removed from the periods of its kind.
+
+        Args:
+            closure: the closure to remove
+
+        Returns:
+            the new closure index
+        """
+
+        closures: list[Closure] = []
+        for other in self.closures():
+            if other.kind != closure.kind or other.end_date < closure.start_date or other.start_date > closure.end_date:
+                closures.append(other)
+                continue
+
+            # keep the days of the period before and after the removed days
+            if other.start_date < closure.start_date:
+                closures.append(other._replace(end_date=closure.start_date - datetime.timedelta(days=1)))
+            if other.end_date > closure.end_date:
+                closures.append(other._replace(start_date=closure.end_date + datetime.timedelta(days=1)))
+
+        return ClosureIndex(closures)
+
+    def fingerprint(self) -> str:
+        """
+        Describe the periods of the index, so that data computed from them can be invalidated when they change.
+
+        Returns:
+            a string that changes whenever the periods change
+        """
+
+        return ";".join(f"{kind.value}={list(zip(intervals.starts, intervals.ends))}"
+                        for kind, intervals in self.intervals.items())
+
+    def _closure(self, kind: ClosureKind, position: int) -> Closure:
+        intervals: ClosureIntervals = self.intervals[kind]
+        return Closure(datetime.date.fromordinal(intervals.starts[position]),
+                       datetime.date.fromordinal(intervals.ends[position]),
+                       kind,
+                       intervals.reasons[position])
+
+
+def read_closures(path: str) -> list[Closure]:
+    """
+    Read closures from a CSV file.
+
+    Args:
+        path: the path of the file
+
+    Returns:
+        the closures, in the order of the file
+
+    Raises:
+        ValueError: If a date or kind is not valid.
+    """
+
+    closures: list[Closure] = []
+    with open(path, newline="", encoding="utf-8") as file:
+        for row in csv.DictReader(file):
+            start_date: datetime.date = parse_date(row["start_date"].strip())
+            end_date_str: str = (row.get("end_date") or "").strip()
+            kind_str: str = (row.get("kind") or "").strip().lower()
+            closures.append(Closure(start_date,
+                                    parse_date(end_date_str) if end_date_str else start_date,
+                                    ClosureKind(kind_str) if kind_str else ClosureKind.CLOSURE,
+                                    (row.get("reason") or "").strip()))
+
+    return closures
+
+
+def load_closures(path: str) -> ClosureIndex:
+    """
+    Load and index closures from a CSV file.
+
+    Args:
+        path: the path of the file
+
+    Returns:
+        the closure index
+
+    Raises:
+        ValueError: If a date or kind is not valid, or a closure ends before it starts.
+    """
+
+    return ClosureIndex(read_closures(path))
+
+
+def install_closures(closure_index: ClosureIndex | None) -> None:
+    """
+    Install a closure index, so that the closures apply to every later check and deadline.
+    The court calendars are discarded and rebuilt on first use to include the closures.
+
+    Args:
+        closure_index: the closure index, or None to remove the installed index
+    """
+
+    set_closure_index(closure_index)
+    reset_court_calendars()
+
+
+def closure_day_flags(flags: int, date: datetime.date, closure_index: ClosureIndex) -> int:
+    """
+    Recalculate the recess, closure and open flags of a day for a closure index.
+
+    Args:
+        flags: the current DayFlag bits of the day
+        date: the day
+        closure_index: the closure index
+
+    Returns:
+        the new DayFlag bits of the day
+    """
+
+    flags &= ~(RECESS | CLOSURE)
+    if is_rule_recess(date) or closure_index.is_recess(date):
+        flags |= RECESS
+    if closure_index.is_closure(date):
+        flags |= CLOSURE
+
+    return with_open_flags(flags)
+
+
+def patch_court_calendars(closure_index: ClosureIndex,
+                          start_date: datetime.date,
+                          end_date: datetime.date) -> list[datetime.date]:
+    """
+    Install a closure index that differs from the installed one only between two dates,
+    and patch the flags of those days in the installed court calendars.
+    Cached calendars that are not installed are discarded, so they are rebuilt on first use.
+
+    Args:
+        closure_index: the new closure index
+        start_date: the first day that may differ
+        end_date: the last day that may differ
+
+    Returns:
+        the days whose flags changed in any installed calendar, in date order
+    """
+
+    set_closure_index(closure_index)
+    court_calendar_for_years.cache_clear()
+
+    changed_ordinals: set[int] = set()
+    court_calendar: CourtCalendar
+    for court_calendar in installed_calendars():
+        first_ordinal: int = max(start_date.toordinal(), court_calendar.start_ordinal)
+        last_ordinal: int = min(end_date.toordinal(), court_calendar.end_ordinal)
+        if first_ordinal > last_ordinal:
+            continue
+
+        day_flags: list[int] = [closure_day_flags(court_calendar.flags[ordinal - court_calendar.start_ordinal],
+                                                  datetime.date.fromordinal(ordinal),
+                                                  closure_index)
+                                for ordinal in range(first_ordinal, last_ordinal + 1)]
+        changed_indices: list[int] = court_calendar.patch_flags(datetime.date.fromordinal(first_ordinal), day_flags)
+        changed_ordinals.update(court_calendar.start_ordinal + index for index in changed_indices)
+
+    return [datetime.date.fromordinal(ordinal) for ordinal in sorted(changed_ordinals)]
+
+
+def add_closure(closure: Closure) -> list[datetime.date]:
+    """
+    Add a closure, such as a proclaimed holiday, to the installed closures and patch the installed court calendars.
+
+    Args:
+        closure: the closure to add
+
+    Returns:
+        the days whose flags changed in any installed calendar, in date order
+
+    Raises:
+        ValueError: If the closure ends before it starts.
+    """
+
+    closure_index: ClosureIndex = get_closure_index() or ClosureIndex()
+
+    return patch_court_calendars(closure_index.with_closure(closure), closure.start_date, closure.end_date)
+
+
+def remove_closure(closure: Closure) -> list[datetime.date]:
+    """
+    Remove the days of a closure from the installed closures of its kind and patch the installed court calendars.
+
+    Args:
+        closure: the closure to remove
+
+    Returns:
+        the days whose flags changed in any installed calendar, in date order
+    """
+
+    closure_index: ClosureIndex = get_closure_index() or ClosureIndex()
+
+    return patch_court_calendars(closure_index.without_closure(closure), closure.start_date, closure.end_date)
+
+
+def affected_deadlines(requests: Sequence[DeadlineRequest],
+                       deadline_dates: Sequence[datetime.date],
+                       start_date: datetime.date,
+                       end_date: datetime.date) -> dict[int, datetime.date]:
+    """
+    Find the previously computed deadlines that change after the days between two dates have changed.
+    A deadline only depends on the days from the event date to the deadline, so only the requests
+    whose days overlap the changed days are recomputed.
+
+    Args:
+        requests: the requests, each an (event_date, number_of_days, after_event, is_quebec) tuple
+        deadline_dates: the deadlines previously computed for the requests
+        start_date: the first changed day
+        end_date: the last changed day
+
+    Returns:
+        the new deadlines that differ from the previous ones, keyed by the index of the request
+    """
+
+    changed_deadlines: dict[int, datetime.date] = {}
+    for index, (request, deadline_date) in enumerate(zip(requests, deadline_dates)):
+        event_date, number_of_days, after_event = request[:3]
+
+        # the days read are those after the event date up to the deadline, or the event date itself for no days
+        first_date: datetime.date = min(event_date, deadline_date)
+        last_date: datetime.date = max(event_date, deadline_date)
+        if number_of_days > 0:
+            if after_event:
+                first_date += datetime.timedelta(days=1)
+            else:
+                last_date -= datetime.timedelta(days=1)
+        if first_date > end_date or last_date < start_date:
+            continue
+
+        new_deadline_date: datetime.date = deadline(*request)
+        if new_deadline_date != deadline_date:
+            changed_deadlines[index] = new_deadline_date
+
+    return changed_deadlines
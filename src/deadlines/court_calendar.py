@@ -0,0 +1,641 @@
+"""
+This module precomputes a compact court calendar for fast date lookups.
+
+A court calendar stores one byte of `DayFlag` bits for every day in a range of years.
+The byte for a date is found by subtracting the proleptic ordinal of January 1 of the
+first year from the ordinal of the date, so every check becomes a single indexed read.
+
+Closures installed with `closures.install_closures` set the RECESS or CLOSURE flags of their days.
+
+Each calendar is built for a jurisdiction, whose holidays set the HOLIDAY and OPEN flags, while
+the QUEBEC_HOLIDAY and QUEBEC_OPEN flags always follow the Quebec holidays.
+
+The calendar also stores prefix sums of the days counted by the deadline rules.
+Entry i of a prefix sum is the number of counted days before index i, so the nth
+counted day after any date can be found by a binary search instead of a loop.
+"""
+
+import datetime
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from deadlines.canadian_holidays import CANADA_JURISDICTION, QUEBEC_JURISDICTION, calc_holidays, resolve_jurisdiction
+from deadlines.dates import (clear_jurisdiction_calendars, get_court_calendar, get_jurisdiction_calendar, is_closure,
+                             is_recess, is_weekend, set_court_calendar, set_jurisdiction_calendar)
+from deadlines.enums import DayFlag, Month
+from deadlines.memo import bounded_cache
+
+# the default range of years covered by a court calendar
+DEFAULT_MIN_YEAR: int = 2000
+DEFAULT_MAX_YEAR: int = 2050
+
+# the maximum number of calendars kept by court_calendar_for_years
+CALENDAR_CACHE_SIZE: int = 8
+
+# the version of the recess rules and flags used to compute the calendar
+# increment this whenever they change so that cached calendars are recomputed
+# changes to the holiday rules are detected by canadian_holidays.rules_fingerprint
+RULES_VERSION: int = 2
+
+# plain int copies of the flags for use in loops over every day
+WEEKEND: int = DayFlag.WEEKEND.value
+HOLIDAY: int = DayFlag.HOLIDAY.value
+QUEBEC_HOLIDAY: int = DayFlag.QUEBEC_HOLIDAY.value
+RECESS: int = DayFlag.RECESS.value
+OPEN: int = DayFlag.OPEN.value
+QUEBEC_OPEN: int = DayFlag.QUEBEC_OPEN.value
+CLOSURE: int = DayFlag.CLOSURE.value
+
+
+def calc_day_flags(date: datetime.date,
+                   holidays: set[datetime.date],
+                   quebec_holidays: set[datetime.date]) -> int:
+    """
+    Calculate the flags for a given date.
+    The flags are combined as plain ints since this is called for every day in a calendar.
+
+    Args:
+        date: the given date
+        holidays: the holidays for the year of the date
+        quebec_holidays: the Quebec holidays for the year of the date
+
+    Returns:
+        the DayFlag bits for the date
+    """
+
+    flags: int = 0
+
+    if is_weekend(date):
+        flags |= WEEKEND
+
+    if date in holidays:
+        flags |= HOLIDAY
+
+    if date in quebec_holidays:
+        flags |= QUEBEC_HOLIDAY
+
+    if is_recess(date):
+        flags |= RECESS
+
+    if is_closure(date):
+        flags |= CLOSURE
+
+    return with_open_flags(flags)
+
+
+def with_open_flags(flags: int) -> int:
+    """
+    Set the OPEN and QUEBEC_OPEN flags from the other flags of a day.
+
+    Args:
+        flags: the DayFlag bits of the day, whose OPEN and QUEBEC_OPEN bits are ignored
+
+    Returns:
+        the DayFlag bits with OPEN and QUEBEC_OPEN set as the other flags require
+    """
+
+    flags &= ~(OPEN | QUEBEC_OPEN)
+
+    # the court is open on business days that are neither holidays nor in recess nor closed
+    if not flags & (WEEKEND | RECESS | CLOSURE):
+        if not flags & HOLIDAY:
+            flags |= OPEN
+        if not flags & QUEBEC_HOLIDAY:
+            flags |= QUEBEC_OPEN
+
+    return flags
+
+
+def calc_calendar_flags(min_year: int, max_year: int, jurisdiction: str = CANADA_JURISDICTION) -> bytearray:
+    """
+    Calculate the flags for every day from January 1 of min_year to December 31 of max_year.
+
+    Args:
+        min_year: the first year
+        max_year: the last year
+        jurisdiction: the key of the jurisdiction whose holidays set the HOLIDAY and OPEN flags
+
+    Returns:
+        the flags for each day, in order
+    """
+
+    flags: bytearray = bytearray()
+    for year in range(min_year, max_year + 1):
+        holidays: set[datetime.date] = set(calc_holidays(year, jurisdiction=jurisdiction).values())
+        quebec_holidays: set[datetime.date] = set(calc_holidays(year, True).values())
+        first_ordinal: int = datetime.date(year, Month.JANUARY, 1).toordinal()
+        last_ordinal: int = datetime.date(year, Month.DECEMBER, 31).toordinal()
+        for ordinal in range(first_ordinal, last_ordinal + 1):
+            date: datetime.date = datetime.date.fromordinal(ordinal)
+            flags.append(calc_day_flags(date, holidays, quebec_holidays))
+
+    return flags
+
+
+def calc_counts(flags: bytes | bytearray | memoryview, flag: int, is_set: bool = True) -> array:
+    """
+    Calculate the prefix sums of the days whose flags include, or exclude, a given flag.
+
+    Args:
+        flags: the flags for each day
+        flag: the flag to test
+        is_set: if True, count the days with the flag set, otherwise count the days with it clear
+
+    Returns:
+        the array of length len(flags) + 1 whose entry i is the number of counted days before index i
+    """
+
+    return array('i', accumulate((bool(day_flags & flag) == is_set for day_flags in flags), initial=0))
+
+
+class CourtCalendar:
+    """
+    A precomputed calendar of court days covering the years min_year to max_year inclusive.
+    """
+
+    def __init__(self,
+                 min_year: int = DEFAULT_MIN_YEAR,
+                 max_year: int = DEFAULT_MAX_YEAR,
+                 flags: bytes | bytearray | memoryview | None = None,
+                 counts: tuple[array | memoryview, array | memoryview, array | memoryview] | None = None,
+                 jurisdiction: str = CANADA_JURISDICTION):
+        """
+        Precompute the flags and prefix sums for every day in the range of years.
+        Previously computed flags and prefix sums may be supplied instead, in any buffer that
+        supports indexing by day, such as bytes, a bytearray or a memoryview of a read-only mmap.
+
+        Args:
+            min_year: the first year covered by the calendar
+            max_year: the last year covered by the calendar
+            flags: the previously computed flags, or None to compute them
+            counts: the previously computed prefix sums of non-recess days, court open days
+                and Quebec court open days, or None to compute them from the flags
+            jurisdiction: the key of the jurisdiction whose holidays set the HOLIDAY and OPEN flags
+
+        Raises:
+            ValueError: If min_year is greater than max_year, the flags do not cover the years,
+                or the jurisdiction is not registered.
+        """
+
+        if min_year > max_year:
+            raise ValueError("min_year must not be greater than max_year")
+
+        self.jurisdiction: str = resolve_jurisdiction(jurisdiction)
+        self.min_year: int = min_year
+        self.max_year: int = max_year
+        self.start_ordinal: int = datetime.date(min_year, Month.JANUARY, 1).toordinal()
+        self.end_ordinal: int = datetime.date(max_year, Month.DECEMBER, 31).toordinal()
+
+        number_of_days: int = self.end_ordinal - self.start_ordinal + 1
+        if flags is None:
+            flags = calc_calendar_flags(min_year, max_year, self.jurisdiction)
+        elif len(flags) != number_of_days:
+            raise ValueError(f"the flags do not cover the years {min_year}-{max_year}")
+        self.flags: bytes | bytearray | memoryview = flags
+
+        if counts is None:
+            counts = (calc_counts(self.flags, RECESS, is_set=False),
+                      calc_counts(self.flags, OPEN),
+                      calc_counts(self.flags, QUEBEC_OPEN))
+        elif any(len(day_counts) != number_of_days + 1 for day_counts in counts):
+            raise ValueError(f"the prefix sums do not cover the years {min_year}-{max_year}")
+        self.non_recess_counts: array | memoryview = counts[0]
+        self.open_counts: array | memoryview = counts[1]
+        self.quebec_open_counts: array | memoryview = counts[2]
+
+    def __len__(self) -> int:
+        return len(self.flags)
+
+    def patch_flags(self, start_date: datetime.date, day_flags: list[int]) -> list[int]:
+        """
+        Replace the flags of consecutive days and update the prefix sums from the first of them.
+        Flags and prefix sums in read-only buffers, such as a memory-mapped calendar file,
+        are copied before the first patch, so the file itself is never changed.
+
+        Args:
+            start_date: the first day to patch
+            day_flags: the new flags of each day from start_date
+
+        Returns:
+            the indices of the days whose flags changed
+
+        Raises:
+            ValueError: If the days are not covered by the calendar.
+        """
+
+        start_index: int = self.index(start_date)
+        if start_index + len(day_flags) > len(self.flags):
+            raise ValueError(f"the days after {start_date} are not covered by the calendar "
+                             f"for {self.min_year}-{self.max_year}")
+
+        changed_indices: list[int] = [start_index + offset for offset, flags in enumerate(day_flags)
+                                      if self.flags[start_index + offset] != flags]
+        if not changed_indices:
+            return changed_indices
+
+        if not isinstance(self.flags, bytearray):
+            self.flags = bytearray(self.flags)
+        self.flags[start_index:start_index + len(day_flags)] = bytes(day_flags)
+
+        # only the prefix sums after the first changed day change
+        first_index: int = changed_indices[0]
+        tail: memoryview = memoryview(self.flags)[first_index:]
+        counts: list[array] = []
+        for day_counts, flag, is_set in ((self.non_recess_counts, RECESS, False),
+                                         (self.open_counts, OPEN, True),
+                                         (self.quebec_open_counts, QUEBEC_OPEN, True)):
+            if not isinstance(day_counts, array):
+                day_counts = array('i', day_counts)
+            day_counts[first_index:] = array('i', accumulate((bool(flags & flag) == is_set for flags in tail),
+                                                             initial=day_counts[first_index]))
+            counts.append(day_counts)
+        self.non_recess_counts, self.open_counts, self.quebec_open_counts = counts
+
+        return changed_indices
+
+    def covers(self, date: datetime.date) -> bool:
+        """
+        Check if a given date is covered by the calendar.
+
+        Args:
+            date: the given date
+
+        Returns:
+            True if the date is covered, False otherwise
+        """
+
+        return self.min_year <= date.year <= self.max_year
+
+    def index(self, date: datetime.date) -> int:
+        """
+        Get the index of the flags for a given date.
+
+        Args:
+            date: the given date
+
+        Returns:
+            the offset of the date from the start of the calendar
+
+        Raises:
+            ValueError: If the date is not covered by the calendar.
+        """
+
+        if not self.covers(date):
+            raise ValueError(f"{date} is not covered by the calendar for {self.min_year}-{self.max_year}")
+
+        return date.toordinal() - self.start_ordinal
+
+    def day_flags(self, date: datetime.date) -> DayFlag:
+        """
+        Get the flags for a given date.
+
+        Args:
+            date: the given date
+
+        Returns:
+            the flags for the date
+        """
+
+        return DayFlag(self.flags[self.index(date)])
+
+    def is_weekend(self, date: datetime.date) -> bool:
+        """
+        Check if a given date falls on a weekend.
+
+        Args:
+            date: the given date
+
+        Returns:
+            True if the date is a weekend, False otherwise
+        """
+
+        return bool(self.flags[self.index(date)] & WEEKEND)
+
+    def is_holiday(self, date: datetime.date, is_quebec: bool = False) -> bool:
+        """
+        Check if a given date is a holiday.
+
+        Args:
+            date: the given date
+            is_quebec: if True, check for Quebec holidays
+
+        Returns:
+            True if the date is a holiday, False otherwise
+        """
+
+        return bool(self.flags[self.index(date)] & (QUEBEC_HOLIDAY if is_quebec else HOLIDAY))
+
+    def is_recess(self, date: datetime.date) -> bool:
+        """
+        Check if a given date is during a court recess.
+
+        Args:
+            date: the given date
+
+        Returns:
+            True if the date is during a recess, False otherwise
+        """
+
+        return bool(self.flags[self.index(date)] & RECESS)
+
+    def is_closure(self, date: datetime.date) -> bool:
+        """
+        Check if the court is closed on a given date by a closure that is not a recess.
+
+        Args:
+            date: the given date
+
+        Returns:
+            True if the date is during a closure, False otherwise
+        """
+
+        return bool(self.flags[self.index(date)] & CLOSURE)
+
+    def is_court_open(self, date: datetime.date, is_quebec: bool = False) -> bool:
+        """
+        Check if the court is open on a given date.
+
+        Args:
+            date: the given date
+            is_quebec: if True, check for Quebec holidays
+
+        Returns:
+            True if the court is open, False otherwise
+        """
+
+        return bool(self.flags[self.index(date)] & (QUEBEC_OPEN if is_quebec else OPEN))
+
+    def court_open_counts(self, is_quebec: bool = False) -> array | memoryview:
+        """
+        Get the prefix sums of the days on which the court is open.
+
+        Args:
+            is_quebec: if True, count the days on which the court is open in Quebec
+
+        Returns:
+            the prefix sums of open days
+        """
+
+        return self.quebec_open_counts if is_quebec else self.open_counts
+
+    def countable_counts(self, number_of_days: int, is_quebec: bool = False) -> array | memoryview:
+        """
+        Get the prefix sums of the days counted towards a deadline of a given number of days.
+        Recess days are never counted. If the number of days is less than 7 then
+        only the days on which the court is open are counted.
+
+        Args:
+            number_of_days: the number of days between the event date and the deadline
+            is_quebec: if True, count the days on which the court is open in Quebec
+
+        Returns:
+            the prefix sums of counted days
+        """
+
+        if number_of_days < 7:
+            return self.court_open_counts(is_quebec)
+
+        return self.non_recess_counts
+
+    def nth_countable_index(self,
+                            index: int,
+                            number_of_days: int,
+                            after_event: bool = True,
+                            is_quebec: bool = False) -> int | None:
+        """
+        Find the index of the day on which the count of days from a given index reaches number_of_days.
+
+        Args:
+            index: the index of the event date
+            number_of_days: the number of days to count
+            after_event: if True, count the days after the index; otherwise, count the days before it
+            is_quebec: if True, apply Quebec holidays
+
+        Returns:
+            the index of the last counted day, or None if it is not covered by the calendar
+        """
+
+        if number_of_days == 0:
+            return index
+
+        counts: array | memoryview = self.countable_counts(number_of_days, is_quebec)
+
+        if after_event:
+            # the counted day is the first index j such that counts[j + 1] reaches the target
+            target: int = counts[index + 1] + number_of_days
+            if target > counts[-1]:
+                return None
+            return bisect_left(counts, target, index + 1) - 1
+
+        # the counted day is the last index j such that counts[j] is number_of_days less than counts[index]
+        target = counts[index] - number_of_days
+        if target < 0:
+            return None
+        return bisect_left(counts, target + 1, 0, index + 1) - 1
+
+    def open_index(self, index: int, after_event: bool = True, is_quebec: bool = False) -> int | None:
+        """
+        Find the index of the nearest day on which the court is open, starting from a given index.
+
+        Args:
+            index: the starting index
+            after_event: if True, search forwards; otherwise, search backwards
+            is_quebec: if True, apply Quebec holidays
+
+        Returns:
+            the index of the open day, or None if it is not covered by the calendar
+        """
+
+        counts: array | memoryview = self.court_open_counts(is_quebec)
+
+        if after_event:
+            target: int = counts[index] + 1
+            if target > counts[-1]:
+                return None
+            return bisect_left(counts, target, index + 1) - 1
+
+        target = counts[index + 1]
+        if target == 0:
+            return None
+        return bisect_left(counts, target, 0, index + 2) - 1
+
+    def latest_event_index(self,
+                           deadline_index: int,
+                           number_of_days: int,
+                           after_event: bool = True,
+                           is_quebec: bool = False) -> int | None:
+        """
+        Find the index of the latest event date whose deadline falls on or before a given index.
+        This inverts nth_countable_index and open_index, using the fact that the deadline
+        never moves earlier when the event date moves later.
+
+        Args:
+            deadline_index: the index of the latest acceptable deadline
+            number_of_days: the number of days between the event date and deadline
+            after_event: if True, the deadline is after the event date; otherwise, it's before
+            is_quebec: if True, apply Quebec holidays
+
+        Returns:
+            the index of the latest event date, or None if it is not covered by the calendar
+        """
+
+        counts: array | memoryview = self.countable_counts(number_of_days, is_quebec)
+        event_index: int
+
+        if after_event:
+            # the deadline is on or before the last open day on or before the deadline index
+            last_open_index: int | None = self.open_index(deadline_index, False, is_quebec)
+            if last_open_index is None:
+                return None
+            if number_of_days == 0:
+                return last_open_index
+
+            # the event date must be followed by number_of_days counted days up to the last open day
+            event_index = bisect_right(counts, counts[last_open_index + 1] - number_of_days) - 2
+        else:
+            # the last counted day must be before the next open day after the deadline index
+            next_open_index: int | None = self.open_index(deadline_index + 1, True, is_quebec)
+            if next_open_index is None:
+                return None
+            if number_of_days == 0:
+                return next_open_index - 1
+
+            # fewer than number_of_days counted days may precede the event date from the next open day
+            event_index = bisect_right(counts, counts[next_open_index] + number_of_days - 1) - 1
+
+        if not 0 <= event_index < len(self.flags):
+            return None
+
+        return event_index
+
+    def earliest_event_index(self,
+                             deadline_index: int,
+                             number_of_days: int,
+                             after_event: bool = True,
+                             is_quebec: bool = False) -> int | None:
+        """
+        Find the index of the earliest event date whose deadline falls on or after a given index.
+
+        Args:
+            deadline_index: the index of the earliest acceptable deadline
+            number_of_days: the number of days between the event date and deadline
+            after_event: if True, the deadline is after the event date; otherwise, it's before
+            is_quebec: if True, apply Quebec holidays
+
+        Returns:
+            the index of the earliest event date, or None if it is not covered by the calendar
+        """
+
+        counts: array | memoryview = self.countable_counts(number_of_days, is_quebec)
+        event_index: int
+
+        if after_event:
+            # the last counted day must be after the last open day before the deadline index
+            last_open_index: int | None = self.open_index(deadline_index - 1, False, is_quebec)
+            if last_open_index is None:
+                return None
+            if number_of_days == 0:
+                return last_open_index + 1
+
+            # fewer than number_of_days counted days may follow the event date up to the last open day
+            event_index = bisect_left(counts, counts[last_open_index + 1] - number_of_days + 1) - 1
+        else:
+            # the deadline is on or after the first open day on or after the deadline index
+            first_open_index: int | None = self.open_index(deadline_index, True, is_quebec)
+            if first_open_index is None:
+                return None
+            if number_of_days == 0:
+                return first_open_index
+
+            # the event date must be preceded by number_of_days counted days from the first open day
+            event_index = bisect_left(counts, counts[first_open_index] + number_of_days)
+
+        if not 0 <= event_index < len(self.flags):
+            return None
+
+        return event_index
+
+
+@bounded_cache(CALENDAR_CACHE_SIZE)
+def court_calendar_for_years(min_year: int, max_year: int, jurisdiction: str = CANADA_JURISDICTION) -> CourtCalendar:
+    """
+    Get a court calendar covering a range of years.
+    Cache the results to avoid recomputing them.
+
+    Args:
+        min_year: the first year covered by the calendar
+        max_year: the last year covered by the calendar
+        jurisdiction: the key of the jurisdiction whose holidays set the HOLIDAY and OPEN flags
+
+    Returns:
+        the court calendar
+    """
+
+    return CourtCalendar(min_year, max_year, jurisdiction=jurisdiction)
+
+
+def ensure_court_calendar() -> CourtCalendar:
+    """
+    Get the installed court calendar.
+    If no calendar is installed then build one for the default range of years and install it.
+    The calendar is loaded from the persistent cache if the cache is enabled.
+
+    Returns:
+        the installed court calendar
+    """
+
+    court_calendar: CourtCalendar | None = get_court_calendar()
+    if court_calendar is None:
+        # import the cache on first use since it is optional
+        from deadlines.calendar_cache import cache_dir_from_env, load_court_calendar
+
+        if cache_dir_from_env() is not None:
+            court_calendar = load_court_calendar()
+        else:
+            court_calendar = court_calendar_for_years(DEFAULT_MIN_YEAR, DEFAULT_MAX_YEAR)
+        set_court_calendar(court_calendar)
+
+    return court_calendar
+
+
+def ensure_jurisdiction_calendar(jurisdiction: str | None = None,
+                                 is_quebec: bool = False) -> tuple[CourtCalendar, bool]:
+    """
+    Get a court calendar for the holidays of a jurisdiction, building and installing it if necessary.
+    The installed court calendar is used for its own jurisdiction and for Quebec.
+
+    Args:
+        jurisdiction: the key of the jurisdiction, or None to choose it with is_quebec
+        is_quebec: if True and no jurisdiction is given, apply Quebec holidays
+
+    Returns:
+        the court calendar, and True if its Quebec flags apply, otherwise False
+
+    Raises:
+        ValueError: If the jurisdiction is not registered.
+    """
+
+    court_calendar: CourtCalendar | None = ensure_court_calendar()
+    jurisdiction = resolve_jurisdiction(jurisdiction, is_quebec)
+    if jurisdiction == QUEBEC_JURISDICTION:
+        return court_calendar, True
+    if jurisdiction == court_calendar.jurisdiction:
+        return court_calendar, False
+
+    court_calendar = get_jurisdiction_calendar(jurisdiction)
+    if court_calendar is None:
+        court_calendar = court_calendar_for_years(DEFAULT_MIN_YEAR, DEFAULT_MAX_YEAR, jurisdiction)
+        set_jurisdiction_calendar(jurisdiction, court_calendar)
+
+    return court_calendar, False
+
+
+def reset_court_calendars() -> None:
+    """
+    Discard the installed court calendars and the cached calendars, so that they are rebuilt on first use.
+    Call this after changing the rules that set the flags, such as the installed closures.
+    """
+
+    set_court_calendar(None)
+    clear_jurisdiction_calendars()
+    court_calendar_for_years.cache_clear()
@@ -0,0 +1,228 @@
+"""
+This module iterates over and searches for court days.
+
+The iterators yield lazily and never end, so take as many days as needed with
+`itertools.islice` or stop at a date with `itertools.takewhile`. Each accepts a `Direction`.
+Within the court calendar they jump over whole runs of closed days or recess days with a binary
+search of the prefix sums, and outside it they check one day at a time with the rules.
+
+`nth_open_day` finds the nth day on which the court is open after or before a date directly,
+by ranking the date in the prefix sums of open days and selecting the day with the target rank.
+"""
+
+import datetime
+from array import array
+from bisect import bisect_left
+from collections.abc import Callable, Iterator
+from itertools import islice
+from deadlines.canadian_holidays import calc_holidays
+from deadlines.court_calendar import CourtCalendar, ensure_court_calendar, ensure_jurisdiction_calendar
+from deadlines.dates import is_court_open, is_recess
+from deadlines.enums import Direction
+
+
+def select_index(rank: Callable[[int], int], size: int, index: int, direction: Direction) -> int | None:
+    """
+    Find the nearest day counted by a prefix sum, starting from a given index.
+
+    Args:
+        rank: the prefix sum, whose value at i is the number of counted days before index i
+        size: the number of days
+        index: the starting index
+        direction: the direction in which to search
+
+    Returns:
+        the index of the counted day, or None if no day is counted in that direction
+    """
+
+    indices: range = range(size + 1)
+    if direction == Direction.FORWARD:
+        target: int = rank(index) + 1
+        if target > rank(size):
+            return None
+        return bisect_left(indices, target, index + 1, key=rank) - 1
+
+    target = rank(index + 1)
+    if target == 0:
+        return None
+    return bisect_left(indices, target, 0, index + 2, key=rank) - 1
+
+
+def find_recess_ordinal(ordinal: int, direction: Direction, is_in_recess: bool) -> int:
+    """
+    Find the nearest day that is, or is not, during a recess, starting from a given day.
+
+    Args:
+        ordinal: the proleptic Gregorian ordinal of the starting day
+        direction: the direction in which to search
+        is_in_recess: if True, find a recess day, otherwise find a day that is not in recess
+
+    Returns:
+        the ordinal of the day found
+    """
+
+    court_calendar: CourtCalendar = ensure_court_calendar()
+    non_recess_counts: array | memoryview = court_calendar.non_recess_counts
+
+    def rank(index: int) -> int:
+        return index - non_recess_counts[index] if is_in_recess else non_recess_counts[index]
+
+    while True:
+        index: int = ordinal - court_calendar.start_ordinal
+        if 0 <= index < len(court_calendar):
+            found_index: int | None = select_index(rank, len(court_calendar), index, direction)
+            if found_index is not None:
+                return court_calendar.start_ordinal + found_index
+
+            # continue with the rules from the end of the calendar
+            index = len(court_calendar) if direction == Direction.FORWARD else -1
+            ordinal = court_calendar.start_ordinal + index
+
+        if is_recess(datetime.date.fromordinal(ordinal)) == is_in_recess:
+            return ordinal
+        ordinal += direction
+
+
+def iter_open_days(date: datetime.date,
+                   direction: Direction = Direction.FORWARD,
+                   is_quebec: bool = False,
+                   jurisdiction: str | None = None) -> Iterator[datetime.date]:
+    """
+    Iterate over the days on which the court is open after, or before, a given date.
+
+    Args:
+        date: the given date, which is not included
+        direction: the direction in which to iterate
+        is_quebec: if True and no jurisdiction is given, apply Quebec holidays
+        jurisdiction: the key of the jurisdiction whose holidays apply, or None to choose it with is_quebec
+
+    Returns:
+        the open days, nearest first
+
+    Raises:
+        ValueError: If the jurisdiction is not registered.
+    """
+
+    court_calendar, lane_is_quebec = ensure_jurisdiction_calendar(jurisdiction, is_quebec)
+    after: bool = direction == Direction.FORWARD
+
+    ordinal: int = date.toordinal()
+    while True:
+        index: int = ordinal + direction - court_calendar.start_ordinal
+        if 0 <= index < len(court_calendar):
+            # jump over the closed days
+            open_index: int | None = court_calendar.open_index(index, after, lane_is_quebec)
+            if open_index is None:
+                ordinal = court_calendar.end_ordinal if after else court_calendar.start_ordinal
+                continue
+            ordinal = court_calendar.start_ordinal + open_index
+            yield datetime.date.fromordinal(ordinal)
+        else:
+            ordinal += direction
+            open_date: datetime.date = datetime.date.fromordinal(ordinal)
+            if is_court_open(open_date, is_quebec, jurisdiction):
+                yield open_date
+
+
+def iter_recess_spans(date: datetime.date,
+                      direction: Direction = Direction.FORWARD) -> Iterator[tuple[datetime.date, datetime.date]]:
+    """
+    Iterate over the spans of consecutive recess days that include, or follow or precede, a given date.
+
+    Args:
+        date: the given date
+        direction: the direction in which to iterate
+
+    Returns:
+        the first and last days of each span, nearest span first
+    """
+
+    ordinal: int = date.toordinal()
+
+    # start from the beginning of a span that includes the date
+    if is_recess(date):
+        ordinal = find_recess_ordinal(ordinal, Direction(-direction), False) + direction
+
+    while True:
+        first_ordinal: int = find_recess_ordinal(ordinal, direction, True)
+        last_ordinal: int = find_recess_ordinal(first_ordinal, direction, False) - direction
+        yield (datetime.date.fromordinal(min(first_ordinal, last_ordinal)),
+               datetime.date.fromordinal(max(first_ordinal, last_ordinal)))
+        ordinal = last_ordinal + direction
+
+
+def iter_holidays(date: datetime.date,
+                  direction: Direction = Direction.FORWARD,
+                  is_quebec: bool = False,
+                  jurisdiction: str | None = None) -> Iterator[tuple[datetime.date, str]]:
+    """
+    Iterate over the holidays after, or before, a given date.
+
+    Args:
+        date: the given date, which is not included
+        direction: the direction in which to iterate
+        is_quebec: if True and no jurisdiction is given, apply Quebec holidays
+        jurisdiction: the key of the jurisdiction whose holidays apply, or None to choose it with is_quebec
+
+    Returns:
+        the date and name of each holiday, nearest first
+
+    Raises:
+        ValueError: If the jurisdiction is not registered.
+    """
+
+    year: int = date.year
+    while True:
+        holidays: list[tuple[datetime.date, str]] = sorted((holiday_date, name) for name, holiday_date
+                                                           in calc_holidays(year, is_quebec, jurisdiction).items())
+        if direction == Direction.BACKWARD:
+            holidays.reverse()
+        for holiday_date, name in holidays:
+            if (holiday_date - date).days * direction > 0:
+                yield holiday_date, name
+        year += direction
+
+
+def nth_open_day(date: datetime.date,
+                 n: int,
+                 direction: Direction = Direction.FORWARD,
+                 is_quebec: bool = False,
+                 jurisdiction: str | None = None) -> datetime.date:
+    """
+    Find the nth day on which the court is open after, or before, a given date.
+
+    Args:
+        date: the given date, which is not counted
+        n: the number of open days, from 1
+        direction: the direction in which to count
+        is_quebec: if True and no jurisdiction is given, apply Quebec holidays
+        jurisdiction: the key of the jurisdiction whose holidays apply, or None to choose it with is_quebec
+
+    Returns:
+        the nth open day
+
+    Raises:
+        ValueError: If n is less than 1 or the jurisdiction is not registered.
+    """
+
+    if n < 1:
+        raise ValueError("n must be at least 1")
+
+    court_calendar, lane_is_quebec = ensure_jurisdiction_calendar(jurisdiction, is_quebec)
+    index: int = date.toordinal() - court_calendar.start_ordinal
+    if 0 <= index < len(court_calendar):
+        counts: array | memoryview = court_calendar.court_open_counts(lane_is_quebec)
+
+        # the rank of the date is the number of open days before it, and the target rank selects the nth day
+        if direction == Direction.FORWARD:
+            target: int = counts[index + 1] + n
+            if target <= counts[-1]:
+                return datetime.date.fromordinal(court_calendar.start_ordinal +
+                                                 bisect_left(counts, target, index + 1) - 1)
+        else:
+            target = counts[index] - n
+            if target >= 0:
+                return datetime.date.fromordinal(court_calendar.start_ordinal +
+                                                 bisect_left(counts, target + 1, 0, index + 1) - 1)
+
+    return next(islice(iter_open_days(date, direction, is_quebec, jurisdiction), n - 1, None))
@@ -1,22 +1,253 @@
 """This module contains date functions useful for computing Federal Court due dates."""
 
-import calendar
 import datetime
-from deadlines.canadian_holidays import calc_holidays
+from array import array
+from collections.abc import Iterable
+from deadlines.canadian_holidays import QUEBEC_JURISDICTION, holiday_name, resolve_jurisdiction
 from deadlines.enums import Month, Weekday
 
+# type checkers treat this name as True, and importing typing at runtime would slow down startup
+TYPE_CHECKING: bool = False
+if TYPE_CHECKING:
+    from deadlines.closures import ClosureIndex
+    from deadlines.court_calendar import CourtCalendar
+
+# the number of years in the Gregorian cycle, after which the weekdays of every date repeat
+YEARS_PER_CYCLE: int = 400
+
+# the tables built by find_year_table, keyed by (month, day)
+# a plain dict is enough since there are at most 366 tables, and find_year reads it on every call
+_find_year_tables: dict[tuple[int, int], array] = {}
+
+# the maximum number of dates kept by each of the caches of parse_ordinal and format_ordinal
+ISO_CACHE_SIZE: int = 65_536
+
+# the caches of parse_ordinal and format_ordinal, which are cleared when they are full
+_string_ordinals: dict[str, int] = {}
+_ordinal_strings: dict[int, str] = {}
+
+# the precomputed court calendar, if any, consulted by is_holiday, is_recess and is_court_open
+_court_calendar: "CourtCalendar | None" = None
+
+# the precomputed court calendars for other jurisdictions, keyed by jurisdiction
+_jurisdiction_calendars: dict[str, "CourtCalendar"] = {}
+
+# the index of closures, if any, consulted by is_recess, is_closure and is_court_open
+_closure_index: "ClosureIndex | None" = None
+
+# the number of times the installed index of closures has changed
+_closure_generation: int = 0
+
+
+def set_court_calendar(court_calendar: "CourtCalendar | None") -> None:
+    """
+    Install a precomputed court calendar.
+    Dates covered by the calendar are then checked with a single lookup.
+    Dates outside the calendar are still checked using the rules.
+
+    Args:
+        court_calendar: the calendar to install, or None to remove the installed calendar
+    """
+
+    global _court_calendar
+    _court_calendar = court_calendar
+
+
+def get_court_calendar() -> "CourtCalendar | None":
+    """
+    Get the installed court calendar.
+
+    Returns:
+        the installed court calendar, or None if no calendar is installed
+    """
+
+    return _court_calendar
+
+
+def set_jurisdiction_calendar(jurisdiction: str, court_calendar: "CourtCalendar | None") -> None:
+    """
+    Install a precomputed court calendar for a jurisdiction other than that of the installed court calendar.
+
+    Args:
+        jurisdiction: the key of the jurisdiction
+        court_calendar: the calendar to install, or None to remove the calendar installed for the jurisdiction
+    """
+
+    if court_calendar is None:
+        _jurisdiction_calendars.pop(jurisdiction, None)
+    else:
+        _jurisdiction_calendars[jurisdiction] = court_calendar
+
+
+def get_jurisdiction_calendar(jurisdiction: str) -> "CourtCalendar | None":
+    """
+    Get the court calendar installed for a jurisdiction other than that of the installed court calendar.
+
+    Args:
+        jurisdiction: the key of the jurisdiction
+
+    Returns:
+        the installed court calendar, or None if no calendar is installed for the jurisdiction
+    """
+
+    return _jurisdiction_calendars.get(jurisdiction)
+
+
+def installed_calendars() -> "list[CourtCalendar]":
+    """
+    Get every installed court calendar.
+
+    Returns:
+        the installed court calendar, if any, followed by the calendars installed for other jurisdictions
+    """
+
+    court_calendars: "list[CourtCalendar]" = [] if _court_calendar is None else [_court_calendar]
+
+    return court_calendars + list(_jurisdiction_calendars.values())
+
+
+def clear_jurisdiction_calendars() -> None:
+    """
+    Remove the court calendars installed for every jurisdiction other than that of the installed court calendar.
+    """
+
+    _jurisdiction_calendars.clear()
+
+
+def set_closure_index(closure_index: "ClosureIndex | None") -> None:
+    """
+    Install an index of closures.
+    Use `closures.install_closures` instead so that the court calendars are rebuilt to include the closures.
+
+    Args:
+        closure_index: the index to install, or None to remove the installed index
+    """
+
+    global _closure_index, _closure_generation
+    if closure_index is not _closure_index:
+        _closure_index = closure_index
+        _closure_generation += 1
+
+
+def get_closure_index() -> "ClosureIndex | None":
+    """
+    Get the installed index of closures.
+
+    Returns:
+        the installed closure index, or None if no index is installed
+    """
+
+    return _closure_index
+
+
+def closure_generation() -> int:
+    """
+    Get the number of times the installed index of closures has changed.
+    Caches of deadlines compare it with the generation of their results to detect results that may be stale.
+
+    Returns:
+        the closure generation
+    """
+
+    return _closure_generation
+
+
+def jurisdiction_lane(jurisdiction: str, is_quebec: bool = False) -> "tuple[CourtCalendar | None, bool]":
+    """
+    Find the installed court calendar whose flags describe the holidays of a jurisdiction.
+
+    Args:
+        jurisdiction: the key of the jurisdiction
+        is_quebec: ignored, since the jurisdiction is given
+
+    Returns:
+        the court calendar, or None if none is installed, and True if its Quebec flags apply, otherwise False
+    """
+
+    jurisdiction = resolve_jurisdiction(jurisdiction, is_quebec)
+    if jurisdiction == QUEBEC_JURISDICTION:
+        return _court_calendar, True
+    if _court_calendar is not None and _court_calendar.jurisdiction == jurisdiction:
+        return _court_calendar, False
+
+    return _jurisdiction_calendars.get(jurisdiction), False
+
+
+def is_leap_year(year: int) -> bool:
+    """
+    Check if a given year is a leap year in the Gregorian calendar.
+
+    Args:
+        year: the year
+
+    Returns:
+        True if the year is a leap year, False otherwise
+    """
+
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def find_year_table(month: int, day: int) -> array:
+    """
+    Tabulate how many years before each year of the Gregorian cycle a given (month, day) last fell on each weekday.
+    The table is built on first use and kept.
+
+    The calendar repeats every 400 years, since 400 years have 146097 days, which is a whole
+    number of weeks. Entry 7 * (year % 400) + weekday of the table is the number of years
+    from year back to the most recent year in which (month, day) fell on weekday.
+    The gap is at most 28 years for most dates, but February 29 can take up to 40 years
+    when a century that is not a leap year, such as 1900 or 2100, interrupts the leap years.
+
+    Args:
+        month: the month number, from 1 to 12
+        day: the day, from 1 to 31
+
+    Returns:
+        the table of 400 * 7 gaps in years
+
+    Raises:
+        ValueError: If (month, day) is not a valid date in a leap year.
+    """
+
+    table: array | None = _find_year_tables.get((month, day))
+    if table is not None:
+        return table
+
+    # 2000 is a leap year that starts the cycle, so every valid (month, day) occurs in it
+    datetime.date(2000, month, day)
+
+    # the weekday of (month, day) in each year of the cycle, or None if it does not occur
+    weekdays: list[int | None] = []
+    for year in range(2000, 2000 + YEARS_PER_CYCLE):
+        if month == Month.FEBRUARY and day == 29 and not is_leap_year(year):
+            weekdays.append(None)
+        else:
+            weekdays.append(datetime.date(year, month, day).weekday())
+
+    # walk two cycles so that the second one sees the years before the start of the cycle
+    table = array('B', bytes(7 * YEARS_PER_CYCLE))
+    last_years: list[int | None] = [None] * 7
+    for position in range(2 * YEARS_PER_CYCLE):
+        year_weekday: int | None = weekdays[position % YEARS_PER_CYCLE]
+        if year_weekday is not None:
+            last_years[year_weekday] = position
+        if position >= YEARS_PER_CYCLE:
+            for weekday, last_year in enumerate(last_years):
+                table[7 * (position - YEARS_PER_CYCLE) + weekday] = position - last_year
+    _find_year_tables[(month, day)] = table
+
+    return table
+
 
 def find_year(month:int, day:int, weekday:int, max_year: int) -> int:
     """
     Find the most recent year <= max_year in which the given (month, day, weekday)
     combination occurs.
 
-    We can safely assume that we can always find a matching year.
-    In fact,we only have to check the most recent 28 years since the
-    pattern of weekdays repeats every 28 years. To see this recall
-    that we have a leap year every 4 years, and every year must begin on
-    one of 7 weekdays. The pattern of weekdays must therefore repeat
-    every 4*7=28 years.
+    The answer is read from a table of the 400-year Gregorian cycle for (month, day),
+    built on first use, so each call takes constant time.
+    A 28-year search is not enough in general: the pattern of weekdays only repeats every
+    28 years between the centuries that are not leap years, such as 1900 and 2100.
 
     Args:
         month: the month number, from 1 to 12
@@ -26,18 +257,21 @@ def find_year(month:int, day:int, weekday:int, max_year: int) -> int:
 
     Returns:
         the most recent year <= max_year in which (month, day, weekday) occurs
+
+    Raises:
+        ValueError: If (month, day) is not a valid date, the weekday is out of range, or no such year is at least 1.
     """
 
-    # start from max_year and work backwards for 28 years
-    year:int = max_year
-    min_year:int = max_year - 28
-    while year > min_year:
-        date:datetime.date = datetime.date(year, month, day)
-        date_weekday:int = datetime.date.weekday(date)
-        if weekday == date_weekday:
-            break
-        else:
-            year -= 1
+    if not 0 <= weekday < 7:
+        raise ValueError(f"weekday must be from 0 to 6, not {weekday}")
+
+    table: array | None = _find_year_tables.get((month, day))
+    if table is None:
+        table = find_year_table(month, day)
+
+    year: int = max_year - table[7 * (max_year % YEARS_PER_CYCLE) + weekday]
+    if year < datetime.MINYEAR:
+        raise ValueError(f"no year from {datetime.MINYEAR} to {max_year} has {month}-{day} on weekday {weekday}")
 
     return year
 
@@ -69,6 +303,84 @@ def parse_date(yyyymmdd: str) -> datetime.date:
     return datetime.date.fromisoformat(yyyymmdd)
 
 
+def parse_ordinal(yyyymmdd: str) -> int:
+    """
+    Parse an ISO date string into a proleptic Gregorian ordinal.
+    The results are cached, since the same dates recur in bulk data.
+
+    Args:
+        yyyymmdd: A string representation of a date in ISO format.
+
+    Returns:
+        The ordinal of the date.
+
+    Raises:
+        ValueError: If the string is not a valid ISO date.
+    """
+
+    ordinal: int | None = _string_ordinals.get(yyyymmdd)
+    if ordinal is None:
+        ordinal = datetime.date.fromisoformat(yyyymmdd).toordinal()
+        if len(_string_ordinals) >= ISO_CACHE_SIZE:
+            _string_ordinals.clear()
+        _string_ordinals[yyyymmdd] = ordinal
+
+    return ordinal
+
+
+def format_ordinal(ordinal: int) -> str:
+    """
+    Format a proleptic Gregorian ordinal as an ISO date string.
+    The results are cached, since the same dates recur in bulk data.
+
+    Args:
+        ordinal: The ordinal of the date.
+
+    Returns:
+        A string representation of the date in ISO format.
+    """
+
+    yyyymmdd: str | None = _ordinal_strings.get(ordinal)
+    if yyyymmdd is None:
+        yyyymmdd = datetime.date.fromordinal(ordinal).isoformat()
+        if len(_ordinal_strings) >= ISO_CACHE_SIZE:
+            _ordinal_strings.clear()
+        _ordinal_strings[ordinal] = yyyymmdd
+
+    return yyyymmdd
+
+
+def parse_ordinals(yyyymmdds: Iterable[str]) -> list[int]:
+    """
+    Parse ISO date strings into proleptic Gregorian ordinals.
+
+    Args:
+        yyyymmdds: The string representations of dates in ISO format.
+
+    Returns:
+        The ordinals of the dates, in the same order.
+
+    Raises:
+        ValueError: If any string is not a valid ISO date.
+    """
+
+    return [parse_ordinal(yyyymmdd) for yyyymmdd in yyyymmdds]
+
+
+def format_ordinals(ordinals: Iterable[int]) -> list[str]:
+    """
+    Format proleptic Gregorian ordinals as ISO date strings.
+
+    Args:
+        ordinals: The ordinals of the dates.
+
+    Returns:
+        The string representations of the dates in ISO format, in the same order.
+    """
+
+    return [format_ordinal(ordinal) for ordinal in ordinals]
+
+
 def add_days(date: datetime.date, n_days: int) -> datetime.date:
     """
     Add a specified number of days to a date.
@@ -138,6 +450,9 @@ def weekday_name(date: datetime.date) -> str:
         the weekday name
     """
 
+    # import calendar on first use since it pulls in locale and re
+    import calendar
+
     return calendar.day_name[weekday_number(date)]
 
 
@@ -169,7 +484,7 @@ def is_business_day(date: datetime.date) -> bool:
     return weekday_number(date) < Weekday.SATURDAY
 
 
-def is_holiday(date: datetime.date, is_quebec: bool = False) -> bool:
+def is_holiday(date: datetime.date, is_quebec: bool = False, jurisdiction: str | None = None) -> bool:
     """
     Check if a given date is a holiday.
     This function is a placeholder and should be replaced with actual
@@ -177,16 +492,21 @@ def is_holiday(date: datetime.date, is_quebec: bool = False) -> bool:
 
     Args:
         date: the given date
-        is_quebec: if True, check for Quebec holidays
+        is_quebec: if True and no jurisdiction is given, check for Quebec holidays
+        jurisdiction: the key of the jurisdiction, or None to choose it with is_quebec
 
     Returns:
         True if the date is a holiday, False otherwise
     """
 
-    # get the holidays for the year
-    all_holidays: dict[str, datetime.date] = calc_holidays(date.year, is_quebec)
+    court_calendar: "CourtCalendar | None" = _court_calendar
+    if jurisdiction is not None:
+        court_calendar, is_quebec = jurisdiction_lane(jurisdiction, is_quebec)
 
-    return date in all_holidays.values()
+    if court_calendar is not None and court_calendar.covers(date):
+        return court_calendar.is_holiday(date, is_quebec)
+
+    return holiday_name(date, is_quebec, jurisdiction) is not None
 
 
 def is_recess(date: datetime.date) -> bool:
@@ -202,6 +522,27 @@ def is_recess(date: datetime.date) -> bool:
         True if the date is during a recess, False otherwise
     """
 
+    if _court_calendar is not None and _court_calendar.covers(date):
+        return _court_calendar.is_recess(date)
+
+    # the court may be in an additional recess
+    if _closure_index is not None and _closure_index.is_recess(date):
+        return True
+
+    return is_rule_recess(date)
+
+
+def is_rule_recess(date: datetime.date) -> bool:
+    """
+    Check if a given date is during a recess given by the rules, ignoring the court calendar and closures.
+
+    Args:
+        date: the given date
+
+    Returns:
+        True if the date is during the summer or seasonal recess, False otherwise
+    """
+
     # the Federal Court is in summer recess during the months of July and August
     if date.month in (Month.JULY, Month.AUGUST):
         return True
@@ -218,7 +559,24 @@ def is_recess(date: datetime.date) -> bool:
     return False
 
 
-def is_court_open(date: datetime.date, is_quebec: bool = False) -> bool:
+def is_closure(date: datetime.date) -> bool:
+    """
+    Check if the court is closed on a given date by a closure that is not a recess, such as a storm.
+
+    Args:
+        date: the given date
+
+    Returns:
+        True if the court is closed by a closure, False otherwise
+    """
+
+    if _court_calendar is not None and _court_calendar.covers(date):
+        return _court_calendar.is_closure(date)
+
+    return _closure_index is not None and _closure_index.is_closure(date)
+
+
+def is_court_open(date: datetime.date, is_quebec: bool = False, jurisdiction: str | None = None) -> bool:
     """
     Check if the court is open on a given date.
     The court is open if the date is a business day and not a holiday
@@ -226,22 +584,32 @@ def is_court_open(date: datetime.date, is_quebec: bool = False) -> bool:
 
     Args:
         date: the given date
-        is_quebec: if True, check for Quebec holidays
+        is_quebec: if True and no jurisdiction is given, check for Quebec holidays
+        jurisdiction: the key of the jurisdiction, or None to choose it with is_quebec
 
     Returns:
         True if the court is open, False otherwise
     """
 
+    court_calendar: "CourtCalendar | None" = _court_calendar
+    if jurisdiction is not None:
+        court_calendar, is_quebec = jurisdiction_lane(jurisdiction, is_quebec)
+
+    if court_calendar is not None and court_calendar.covers(date):
+        return court_calendar.is_court_open(date, is_quebec)
+
     if is_weekend(date):
         return False
 
     assert is_business_day(date)
 
-    if is_holiday(date, is_quebec):
+    if is_holiday(date, is_quebec, jurisdiction):
         return False
 
     if is_recess(date):
         return False
 
+    if is_closure(date):
+        return False
 
     return True
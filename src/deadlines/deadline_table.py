@@ -0,0 +1,383 @@
+"""
+This module precomputes every deadline for a window of event dates into a compact lookup table.
+
+The domain of `due_dates.deadline` is small: for event dates in a range of years, numbers of days
+up to some maximum, two directions and two sets of holidays, a table holds every deadline as the
+signed number of days from the event date, stored as a 16-bit int. A deadline in the window is
+then a single array read, and any other deadline is computed as usual.
+
+Tables are saved in a binary file that is loaded with `mmap`, like a calendar file, and the
+table reads its entries directly from the mapped pages. The file consists of:
+* a header, packed as HEADER_FORMAT, giving the magic number, the format version, the rules version,
+the byte order, a key of the holiday rules and closures, the range of years, the maximum number
+of days and the number of event dates, and
+* the deltas, stored as native 16-bit ints in the order given by `DeadlineTable.position`.
+
+A table only answers while the installed closures match those it was computed with. Once closures
+are added or removed, every lookup falls back to computing the deadline until they match again.
+
+Since a table records the deadlines of the rules that computed it, a table saved from a trusted
+version of the rules also serves as a golden truth table: `verify_deadline_table` reports every
+deadline that the current rules compute differently.
+"""
+
+import datetime
+import hashlib
+import mmap
+import struct
+import sys
+from array import array
+from deadlines.canadian_holidays import CANADA_JURISDICTION, QUEBEC_JURISDICTION, rules_fingerprint
+from deadlines.closures import ClosureIndex
+from deadlines.court_calendar import RULES_VERSION
+from deadlines.dates import closure_generation, get_closure_index
+from deadlines.due_dates import deadline, deadline_ordinal
+from deadlines.enums import Month
+
+MAGIC: bytes = b"FCDT"
+FORMAT_VERSION: int = 1
+
+# magic, format version, rules version, byte order, rules key, min year, max year, max days, number of event dates
+HEADER_FORMAT: str = "<4sHHBx8shhHI"
+HEADER_SIZE: int = struct.calcsize(HEADER_FORMAT)
+
+# the byte order of the deltas
+BYTE_ORDERS: dict[str, int] = {"little": 0, "big": 1}
+
+# the deltas are stored as ints of this type code
+DELTAS_TYPECODE: str = "h"
+
+# a deadline that differs from the rules:
+# (event_date, number_of_days, after_event, is_quebec, table_deadline_date, computed_deadline_date)
+DeadlineMismatch = tuple[datetime.date, int, bool, bool, datetime.date, datetime.date]
+
+# the largest maximum number of days, which keeps every delta within a 16-bit int
+MAX_TABLE_DAYS: int = 16_000
+
+
+def rules_key() -> bytes:
+    """
+    Compute a key of the holiday rules and installed closures that the deadlines depend on.
+
+    Returns:
+        the key, which changes whenever the rules or closures change
+    """
+
+    closure_index: ClosureIndex | None = get_closure_index()
+    closures: str = closure_index.fingerprint() if closure_index is not None and len(closure_index) > 0 else ""
+    key_source: str = f"{rules_fingerprint(CANADA_JURISDICTION, QUEBEC_JURISDICTION)}:{closures}"
+
+    return hashlib.sha256(key_source.encode()).digest()[:8]
+
+
+class DeadlineTable:
+    """
+    A precomputed table of the deadlines for every event date from min_year to max_year inclusive,
+    every number of days from 0 to max_days, both directions, and both sets of holidays.
+    """
+
+    def __init__(self,
+                 min_year: int,
+                 max_year: int,
+                 max_days: int,
+                 deltas: array | memoryview | None = None,
+                 key: bytes | None = None):
+        """
+        Compute the deltas of every deadline in the window, or use previously computed deltas.
+
+        Args:
+            min_year: the first year of the event dates
+            max_year: the last year of the event dates
+            max_days: the maximum number of days
+            deltas: the previously computed deltas, in any buffer of 16-bit ints, or None to compute them
+            key: the rules key of the rules and closures that computed the deltas, or None for the current key
+
+        Raises:
+            ValueError: If min_year is greater than max_year, max_days is out of range,
+                or the deltas do not cover the window.
+        """
+
+        if min_year > max_year:
+            raise ValueError("min_year must not be greater than max_year")
+
+        if not 0 <= max_days <= MAX_TABLE_DAYS:
+            raise ValueError(f"max_days must be from 0 to {MAX_TABLE_DAYS}")
+
+        self.min_year: int = min_year
+        self.max_year: int = max_year
+        self.max_days: int = max_days
+        self.start_ordinal: int = datetime.date(min_year, Month.JANUARY, 1).toordinal()
+        self.end_ordinal: int = datetime.date(max_year, Month.DECEMBER, 31).toordinal()
+        self.number_of_dates: int = self.end_ordinal - self.start_ordinal + 1
+
+        if deltas is None:
+            deltas = calc_deadline_deltas(self)
+        elif len(deltas) != 4 * (max_days + 1) * self.number_of_dates:
+            raise ValueError(f"the deltas do not cover the years {min_year}-{max_year} and {max_days} days")
+        self.deltas: array | memoryview = deltas
+        self.key: bytes = key if key is not None else rules_key()
+        self.generation: int = closure_generation()
+
+    def __len__(self) -> int:
+        return len(self.deltas)
+
+    def covers(self, event_ordinal: int, number_of_days: int) -> bool:
+        """
+        Check if the deadline for a given event date and number of days is in the table.
+
+        Args:
+            event_ordinal: the proleptic Gregorian ordinal of the event date
+            number_of_days: the number of days between the event date and deadline
+
+        Returns:
+            True if the deadline is in the table, False otherwise
+        """
+
+        return self.start_ordinal <= event_ordinal <= self.end_ordinal and 0 <= number_of_days <= self.max_days
+
+    def is_current(self) -> bool:
+        """
+        Check if the table was computed with the installed closures.
+        The closures are only compared again after they change.
+
+        Returns:
+            True if the table may answer lookups, False otherwise
+        """
+
+        generation: int = closure_generation()
+        if generation != self.generation:
+            if rules_key() != self.key:
+                return False
+            # the closures changed but match the table again
+            self.generation = generation
+
+        return True
+
+    def position(self,
+                 event_ordinal: int,
+                 number_of_days: int,
+                 after_event: bool = True,
+                 is_quebec: bool = False) -> int:
+        """
+        Get the position of a deadline in the deltas.
+        The deltas are ordered by holidays, then direction, then number of days, then event date,
+        so the deadlines of one number of days for consecutive event dates are adjacent.
+
+        Args:
+            event_ordinal: the proleptic Gregorian ordinal of the event date, which must be covered
+            number_of_days: the number of days between the event date and deadline, which must be covered
+            after_event: if True, the deadline is after the event date; otherwise, it's before
+            is_quebec: if True, the deadline is calculated according to Quebec rules
+
+        Returns:
+            the position of the delta of the deadline
+        """
+
+        row: int = (2 * is_quebec + (not after_event)) * (self.max_days + 1) + number_of_days
+
+        return row * self.number_of_dates + event_ordinal - self.start_ordinal
+
+    def deadline_ordinal(self,
+                         event_ordinal: int,
+                         number_of_days: int,
+                         after_event: bool = True,
+                         is_quebec: bool = False) -> int | None:
+        """
+        Look up the ordinal of the deadline for a given event date and number of days.
+
+        Args:
+            event_ordinal: the proleptic Gregorian ordinal of the event date
+            number_of_days: the number of days between the event date and deadline
+            after_event: if True, the deadline is after the event date; otherwise, it's before
+            is_quebec: if True, the deadline is calculated according to Quebec rules
+
+        Returns:
+            the ordinal of the deadline, or None if it is not in the table or the closures have changed
+        """
+
+        if not self.covers(event_ordinal, number_of_days) or not self.is_current():
+            return None
+
+        return event_ordinal + self.deltas[self.position(event_ordinal, number_of_days, after_event, is_quebec)]
+
+    def deadline(self,
+                 event_date: datetime.date,
+                 number_of_days: int,
+                 after_event: bool = True,
+                 is_quebec: bool = False) -> datetime.date:
+        """
+        Get the deadline for a given event date and number of days,
+        from the table if it is in the table and computed otherwise.
+
+        Args:
+            event_date: the date of the event
+            number_of_days: the number of days between the event date and deadline
+            after_event: if True, the deadline is after the event date; otherwise, it's before
+            is_quebec: if True, the deadline is calculated according to Quebec rules
+
+        Returns:
+            the deadline date
+
+        Raises:
+            ValueError: If number_of_days is negative.
+        """
+
+        ordinal: int | None = self.deadline_ordinal(event_date.toordinal(), number_of_days, after_event, is_quebec)
+        if ordinal is None:
+            return deadline(event_date, number_of_days, after_event, is_quebec)
+
+        return datetime.date.fromordinal(ordinal)
+
+
+def calc_deadline_deltas(table: DeadlineTable) -> array:
+    """
+    Compute the delta of every deadline in the window of a table.
+
+    Args:
+        table: the table, whose window is used
+
+    Returns:
+        the deltas, in the order given by `DeadlineTable.position`
+    """
+
+    deltas: array = array(DELTAS_TYPECODE)
+    for is_quebec in (False, True):
+        for after_event in (True, False):
+            for number_of_days in range(table.max_days + 1):
+                deltas.extend(deadline_ordinal(event_ordinal, number_of_days, after_event, is_quebec) - event_ordinal
+                              for event_ordinal in range(table.start_ordinal, table.end_ordinal + 1))
+
+    return deltas
+
+
+def encode_deadline_table(table: DeadlineTable) -> bytes:
+    """
+    Encode a deadline table in the deadline table file format.
+
+    Args:
+        table: the deadline table
+
+    Returns:
+        the contents of the deadline table file
+    """
+
+    header: bytes = struct.pack(HEADER_FORMAT,
+                                MAGIC,
+                                FORMAT_VERSION,
+                                RULES_VERSION,
+                                BYTE_ORDERS[sys.byteorder],
+                                table.key,
+                                table.min_year,
+                                table.max_year,
+                                table.max_days,
+                                table.number_of_dates)
+
+    return header + array(DELTAS_TYPECODE, table.deltas).tobytes()
+
+
+def decode_deadline_table(buffer: memoryview, check_rules: bool = True) -> DeadlineTable:
+    """
+    Decode a deadline table from a buffer in the deadline table file format without copying it.
+
+    Args:
+        buffer: the contents of the deadline table file
+        check_rules: if True, reject a table computed with other rules or closures, otherwise accept it,
+            for example to compare a golden table with the current rules
+
+    Returns:
+        the deadline table, whose deltas are a view of the buffer
+
+    Raises:
+        ValueError: If the buffer is not a valid deadline table file for this platform and, if checked, these rules.
+    """
+
+    if len(buffer) < HEADER_SIZE:
+        raise ValueError("the deadline table file is too short")
+
+    magic, format_version, rules_version, byte_order, key, min_year, max_year, max_days, number_of_dates = \
+        struct.unpack_from(HEADER_FORMAT, buffer)
+
+    if magic != MAGIC:
+        raise ValueError("the file is not a deadline table file")
+
+    if format_version != FORMAT_VERSION:
+        raise ValueError(f"the deadline table file format version {format_version} is not supported")
+
+    if check_rules and (rules_version != RULES_VERSION or key != rules_key()):
+        raise ValueError("the deadline table file was computed with other rules")
+
+    if byte_order != BYTE_ORDERS[sys.byteorder]:
+        raise ValueError("the deadline table file was written on a platform with a different byte order")
+
+    deltas_size: int = 4 * (max_days + 1) * number_of_dates * array(DELTAS_TYPECODE).itemsize
+    if len(buffer) != HEADER_SIZE + deltas_size:
+        raise ValueError("the deadline table file has the wrong size")
+
+    return DeadlineTable(min_year, max_year, max_days, buffer[HEADER_SIZE:].cast(DELTAS_TYPECODE), key)
+
+
+def write_deadline_table(path: str, table: DeadlineTable) -> None:
+    """
+    Write a deadline table to a deadline table file.
+
+    Args:
+        path: the path of the deadline table file
+        table: the deadline table
+    """
+
+    with open(path, "wb") as file:
+        file.write(encode_deadline_table(table))
+
+
+def open_deadline_table(path: str, check_rules: bool = True) -> DeadlineTable:
+    """
+    Open a deadline table file as a deadline table backed by a read-only memory map.
+
+    Args:
+        path: the path of the deadline table file
+        check_rules: if True, reject a table computed with other rules or closures
+
+    Returns:
+        the deadline table
+
+    Raises:
+        ValueError: If the file is not a valid deadline table file.
+    """
+
+    with open(path, "rb") as file:
+        if file.seek(0, 2) == 0:
+            raise ValueError("the deadline table file is empty")
+        buffer: memoryview = memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+
+    return decode_deadline_table(buffer, check_rules)
+
+
+def verify_deadline_table(table: DeadlineTable) -> list[DeadlineMismatch]:
+    """
+    Compare every deadline in a table with the deadline computed by the current rules.
+
+    Args:
+        table: the deadline table, for example a golden table opened without checking the rules
+
+    Returns:
+        the event date, number of days, direction, Quebec flag, table deadline and computed deadline
+        of every deadline that differs, which is empty if the table agrees with the rules
+    """
+
+    fresh_deltas: array = calc_deadline_deltas(table)
+    mismatches: list[DeadlineMismatch] = []
+    for position, (delta, fresh_delta) in enumerate(zip(table.deltas, fresh_deltas)):
+        if delta == fresh_delta:
+            continue
+
+        row, event_index = divmod(position, table.number_of_dates)
+        lane, number_of_days = divmod(row, table.max_days + 1)
+        event_ordinal: int = table.start_ordinal + event_index
+        mismatches.append((datetime.date.fromordinal(event_ordinal),
+                           number_of_days,
+                           lane % 2 == 0,
+                           lane >= 2,
+                           datetime.date.fromordinal(event_ordinal + delta),
+                           datetime.date.fromordinal(event_ordinal + fresh_delta)))
+
+    return mismatches
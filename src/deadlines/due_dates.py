@@ -1,87 +1,657 @@
 """This module computes due dates for Federal Court cases."""
 
 import datetime
-from deadlines.dates import add_days, is_court_open, is_recess, parse_date, format_date
+import time
+from array import array
+from itertools import chain
+from deadlines import instrumentation
+from deadlines.court_calendar import CourtCalendar, ensure_court_calendar, ensure_jurisdiction_calendar
+from deadlines.dates import add_days, format_ordinal, is_court_open, is_recess, parse_ordinal
+from deadlines.enums import CountingRule
+from deadlines.explanation import DeadlineExplanation, explain_deadline
+
+# a deadline request: (event_date, number_of_days, after_event, is_quebec)
+DeadlineRequest = tuple[datetime.date, int, bool, bool]
 
 
 def deadline(event_date: datetime.date,
              number_of_days: int,
              after_event: bool = True,
-             is_quebec: bool = False) -> datetime.date:
+             is_quebec: bool = False,
+             explain: bool = False,
+             jurisdiction: str | None = None) -> datetime.date | DeadlineExplanation:
     """
     Compute the deadline for a given event date and number of days.
+    The deadline is found by jumping through the prefix sums of the court calendar.
+    Deadlines that fall outside the calendar are found by stepping one day at a time.
+    While tracing is enabled in `instrumentation`, a trace of the computation is recorded.
+
+    Args:
+        event_date: The date of the event.
+        number_of_days: The number of days between the event date and deadline.
+        after_event: If True, the deadline is after the event date; otherwise, it's before.
+        is_quebec: If True and no jurisdiction is given, the deadline is calculated according to Quebec rules.
+        explain: If True, return an explanation of which days were counted and skipped.
+        jurisdiction: The key of the jurisdiction whose holidays apply, or None to choose it with is_quebec.
+
+    Returns:
+        The computed deadline date, or its explanation if explain is True.
+
+    Raises:
+        ValueError: If number_of_days is negative or the jurisdiction is not registered.
+    """
+
+    if number_of_days < 0:
+        raise ValueError("number_of_days must be non-negative")
+
+    if explain:
+        return explain_deadline(event_date, number_of_days, after_event, is_quebec, jurisdiction)
+
+    if instrumentation.enabled:
+        return traced_deadline(event_date, number_of_days, after_event, is_quebec, jurisdiction)
+
+    court_calendar: CourtCalendar
+    lane_is_quebec: bool = is_quebec
+    if jurisdiction is None:
+        court_calendar = ensure_court_calendar()
+    else:
+        court_calendar, lane_is_quebec = ensure_jurisdiction_calendar(jurisdiction, is_quebec)
+
+    deadline_date: datetime.date | None = deadline_by_calendar(court_calendar,
+                                                               event_date,
+                                                               number_of_days,
+                                                               after_event,
+                                                               lane_is_quebec)
+    if deadline_date is None:
+        deadline_date = deadline_by_steps(event_date, number_of_days, after_event, is_quebec, jurisdiction)
+
+    return deadline_date
+
+
+def deadline_by_calendar(court_calendar: CourtCalendar,
+                         event_date: datetime.date,
+                         number_of_days: int,
+                         after_event: bool = True,
+                         is_quebec: bool = False) -> datetime.date | None:
+    """
+    Compute the deadline for a given event date and number of days using the prefix sums of a court calendar.
 
     Args:
+        court_calendar: The court calendar.
         event_date: The date of the event.
         number_of_days: The number of days between the event date and deadline.
         after_event: If True, the deadline is after the event date; otherwise, it's before.
         is_quebec: If True, the deadline is calculated according to Quebec rules.
 
     Returns:
-        The computed deadline date.
+        The computed deadline date, or None if the deadline is not covered by the calendar.
+    """
+
+    deadline_ordinal: int | None = deadline_ordinal_by_calendar(court_calendar,
+                                                                event_date.toordinal(),
+                                                                number_of_days,
+                                                                after_event,
+                                                                is_quebec)
+    if deadline_ordinal is None:
+        return None
+
+    return datetime.date.fromordinal(deadline_ordinal)
+
+
+def deadline_ordinal_by_calendar(court_calendar: CourtCalendar,
+                                 event_ordinal: int,
+                                 number_of_days: int,
+                                 after_event: bool = True,
+                                 is_quebec: bool = False) -> int | None:
+    """
+    Compute the ordinal of the deadline for a given event ordinal and number of days
+    using the prefix sums of a court calendar, without creating any date objects.
+
+    Args:
+        court_calendar: The court calendar.
+        event_ordinal: The proleptic Gregorian ordinal of the date of the event.
+        number_of_days: The number of days between the event date and deadline.
+        after_event: If True, the deadline is after the event date; otherwise, it's before.
+        is_quebec: If True, the deadline is calculated according to Quebec rules.
+
+    Returns:
+        The ordinal of the computed deadline, or None if the deadline is not covered by the calendar.
+    """
+
+    if not court_calendar.start_ordinal <= event_ordinal <= court_calendar.end_ordinal:
+        return None
+
+    event_index: int = event_ordinal - court_calendar.start_ordinal
+
+    # find the last counted day
+    candidate_index: int | None = court_calendar.nth_countable_index(event_index,
+                                                                     number_of_days,
+                                                                     after_event,
+                                                                     is_quebec)
+    if candidate_index is None:
+        return None
+
+    # the deadline must be a business day
+    deadline_index: int | None = court_calendar.open_index(candidate_index, after_event, is_quebec)
+    if deadline_index is None:
+        return None
+
+    return court_calendar.start_ordinal + deadline_index
+
+
+def deadline_ordinal(event_ordinal: int,
+                     number_of_days: int,
+                     after_event: bool = True,
+                     is_quebec: bool = False,
+                     jurisdiction: str | None = None) -> int:
+    """
+    Compute the deadline for a given event date and number of days, as proleptic Gregorian ordinals.
+    Within the court calendar no date objects are created. Deadlines that fall outside the calendar,
+    and deadlines computed while tracing is enabled, are computed by `deadline`.
+
+    Args:
+        event_ordinal: The ordinal of the date of the event.
+        number_of_days: The number of days between the event date and deadline.
+        after_event: If True, the deadline is after the event date; otherwise, it's before.
+        is_quebec: If True and no jurisdiction is given, the deadline is calculated according to Quebec rules.
+        jurisdiction: The key of the jurisdiction whose holidays apply, or None to choose it with is_quebec.
+
+    Returns:
+        The ordinal of the computed deadline.
 
     Raises:
-        ValueError: If number_of_days is negative.
+        ValueError: If number_of_days is negative or the jurisdiction is not registered.
     """
 
     if number_of_days < 0:
         raise ValueError("number_of_days must be non-negative")
 
+    if not instrumentation.enabled:
+        court_calendar: CourtCalendar
+        lane_is_quebec: bool = is_quebec
+        if jurisdiction is None:
+            court_calendar = ensure_court_calendar()
+        else:
+            court_calendar, lane_is_quebec = ensure_jurisdiction_calendar(jurisdiction, is_quebec)
+
+        ordinal: int | None = deadline_ordinal_by_calendar(court_calendar,
+                                                           event_ordinal,
+                                                           number_of_days,
+                                                           after_event,
+                                                           lane_is_quebec)
+        if ordinal is not None:
+            return ordinal
+
+    return deadline(datetime.date.fromordinal(event_ordinal),
+                    number_of_days,
+                    after_event,
+                    is_quebec,
+                    jurisdiction=jurisdiction).toordinal()
+
+
+def deadline_by_steps(event_date: datetime.date,
+                      number_of_days: int,
+                      after_event: bool = True,
+                      is_quebec: bool = False,
+                      jurisdiction: str | None = None) -> datetime.date:
+    """
+    Compute the deadline for a given event date and number of days by stepping one day at a time.
+
+    Args:
+        event_date: The date of the event.
+        number_of_days: The number of days between the event date and deadline.
+        after_event: If True, the deadline is after the event date; otherwise, it's before.
+        is_quebec: If True and no jurisdiction is given, the deadline is calculated according to Quebec rules.
+        jurisdiction: The key of the jurisdiction whose holidays apply, or None to choose it with is_quebec.
+
+    Returns:
+        The computed deadline date.
+    """
+
+    candidate_date, _, _ = count_days_by_steps(event_date, number_of_days, after_event, is_quebec, jurisdiction)
+
+    # the deadline must be a business day
+    return open_date_by_steps(candidate_date, after_event, is_quebec, jurisdiction)
+
+
+def count_days_by_steps(event_date: datetime.date,
+                        number_of_days: int,
+                        after_event: bool = True,
+                        is_quebec: bool = False,
+                        jurisdiction: str | None = None) -> tuple[datetime.date, int, int]:
+    """
+    Find the last counted day for a given event date and number of days by stepping one day at a time.
+
+    Args:
+        event_date: The date of the event.
+        number_of_days: The number of days between the event date and deadline.
+        after_event: If True, the deadline is after the event date; otherwise, it's before.
+        is_quebec: If True and no jurisdiction is given, the deadline is calculated according to Quebec rules.
+        jurisdiction: The key of the jurisdiction whose holidays apply, or None to choose it with is_quebec.
+
+    Returns:
+        The last counted day, the number of recess days skipped and the number of closed days skipped.
+    """
+
     day_step: int = 1 if after_event else -1
 
     # compute the candidate date for the deadline
     candidate_date: datetime.date = event_date
     cumulative_days: int = 0
+    recess_days: int = 0
+    closed_days: int = 0
     while cumulative_days < number_of_days:
         candidate_date = add_days(candidate_date, day_step)
 
         # never count a recess day
         if is_recess(candidate_date):
+            recess_days += 1
             continue
 
         # if the allowed number of days is less than 7 then only count days on which the court is open
-        if number_of_days < 7 and not is_court_open(candidate_date, is_quebec):
+        if number_of_days < 7 and not is_court_open(candidate_date, is_quebec, jurisdiction):
+            closed_days += 1
             continue
 
         # count the day
         cumulative_days += 1
 
-    # the deadline must be a business day
-    deadline_date: datetime.date = candidate_date
-    while not is_court_open(deadline_date, is_quebec):
-        deadline_date = add_days(deadline_date, day_step)
+    return candidate_date, recess_days, closed_days
+
+
+def open_date_by_steps(date: datetime.date,
+                       after_event: bool = True,
+                       is_quebec: bool = False,
+                       jurisdiction: str | None = None) -> datetime.date:
+    """
+    Find the nearest day on which the court is open, starting from a given date, by stepping one day at a time.
+
+    Args:
+        date: The starting date.
+        after_event: If True, search forwards; otherwise, search backwards.
+        is_quebec: If True and no jurisdiction is given, apply Quebec holidays.
+        jurisdiction: The key of the jurisdiction whose holidays apply, or None to choose it with is_quebec.
+
+    Returns:
+        The open date.
+    """
+
+    day_step: int = 1 if after_event else -1
+
+    open_date: datetime.date = date
+    while not is_court_open(open_date, is_quebec, jurisdiction):
+        open_date = add_days(open_date, day_step)
+
+    return open_date
+
+
+def traced_deadline(event_date: datetime.date,
+                    number_of_days: int,
+                    after_event: bool = True,
+                    is_quebec: bool = False,
+                    jurisdiction: str | None = None) -> datetime.date:
+    """
+    Compute the deadline for a given event date and number of days, and record a trace of the computation.
+    When the court calendar covers the computation, the skipped days are counted from its prefix sums.
+
+    Args:
+        event_date: The date of the event.
+        number_of_days: The number of days between the event date and deadline.
+        after_event: If True, the deadline is after the event date; otherwise, it's before.
+        is_quebec: If True and no jurisdiction is given, the deadline is calculated according to Quebec rules.
+        jurisdiction: The key of the jurisdiction whose holidays apply, or None to choose it with is_quebec.
+
+    Returns:
+        The computed deadline date.
+    """
+
+    start_time: float = time.perf_counter()
+
+    court_calendar, lane_is_quebec = ensure_jurisdiction_calendar(jurisdiction, is_quebec)
+    candidate_index: int | None = None
+    deadline_index: int | None = None
+    if court_calendar.covers(event_date):
+        event_index: int = event_date.toordinal() - court_calendar.start_ordinal
+        candidate_index = court_calendar.nth_countable_index(event_index, number_of_days, after_event, lane_is_quebec)
+        if candidate_index is not None:
+            deadline_index = court_calendar.open_index(candidate_index, after_event, lane_is_quebec)
+
+    candidate_date: datetime.date
+    deadline_date: datetime.date
+    recess_days: int
+    closed_days: int
+    if deadline_index is not None:
+        candidate_date = datetime.date.fromordinal(court_calendar.start_ordinal + candidate_index)
+        deadline_date = datetime.date.fromordinal(court_calendar.start_ordinal + deadline_index)
+
+        # the stepped days run from the day after the event date to the last counted day, in either direction
+        first_index, last_index = sorted((event_index + (1 if after_event else -1), candidate_index))
+        days_stepped: int = abs(candidate_index - event_index)
+        non_recess_days: int = (court_calendar.non_recess_counts[last_index + 1] -
+                                court_calendar.non_recess_counts[first_index]) if days_stepped else 0
+        recess_days = days_stepped - non_recess_days
+        closed_days = non_recess_days - number_of_days
+    else:
+        candidate_date, recess_days, closed_days = count_days_by_steps(event_date,
+                                                                       number_of_days,
+                                                                       after_event,
+                                                                       is_quebec,
+                                                                       jurisdiction)
+        deadline_date = open_date_by_steps(candidate_date, after_event, is_quebec, jurisdiction)
+
+    instrumentation.record(instrumentation.DeadlineTrace(event_date,
+                                                         number_of_days,
+                                                         after_event,
+                                                         is_quebec,
+                                                         deadline_date,
+                                                         abs((candidate_date - event_date).days),
+                                                         recess_days,
+                                                         closed_days,
+                                                         abs((deadline_date - candidate_date).days),
+                                                         deadline_index is not None,
+                                                         time.perf_counter() - start_time))
 
     return deadline_date
 
 
-def deadline_after(event_date: datetime.date, number_of_days: int, is_quebec: bool = False) -> datetime.date:
-    return deadline(event_date, number_of_days, after_event=True, is_quebec=is_quebec)
+def deadlines_for_offsets(event_date: datetime.date,
+                          offsets: list[int],
+                          after_event: bool = True,
+                          is_quebec: bool = False) -> list[datetime.date]:
+    """
+    Compute the deadlines for a given event date and several numbers of days in a single pass.
+    The days are walked once, keeping separate counts of the days on which the court is open,
+    which apply to offsets less than 7, and of the non-recess days, which apply to the others.
+
+    Args:
+        event_date: The date of the event.
+        offsets: The numbers of days between the event date and each deadline.
+        after_event: If True, the deadlines are after the event date; otherwise, they're before.
+        is_quebec: If True, the deadlines are calculated according to Quebec rules.
+
+    Returns:
+        The computed deadline dates, in the same order as the offsets.
+
+    Raises:
+        ValueError: If any offset is negative.
+    """
+
+    if any(number_of_days < 0 for number_of_days in offsets):
+        raise ValueError("number_of_days must be non-negative")
+
+    day_step: int = 1 if after_event else -1
+
+    # the offsets whose deadlines are still to be found, in decreasing order so the next one is at the end
+    short_offsets: list[int] = sorted({n for n in offsets if 0 < n < 7}, reverse=True)
+    long_offsets: list[int] = sorted({n for n in offsets if n >= 7}, reverse=True)
+
+    # the offsets whose last day has been counted but which are waiting for a day on which the court is open
+    pending_offsets: list[int] = [0] if 0 in offsets else []
+
+    deadline_dates: dict[int, datetime.date] = {}
+    candidate_date: datetime.date = event_date
+    open_days: int = 0
+    non_recess_days: int = 0
+    is_open: bool = is_court_open(candidate_date, is_quebec)
+    while True:
+        # the deadline must be a business day
+        if is_open:
+            for number_of_days in pending_offsets:
+                deadline_dates[number_of_days] = candidate_date
+            pending_offsets.clear()
+
+        if not (short_offsets or long_offsets or pending_offsets):
+            break
 
+        candidate_date = add_days(candidate_date, day_step)
+        is_open = is_court_open(candidate_date, is_quebec)
+
+        # never count a recess day
+        if is_recess(candidate_date):
+            continue
+
+        non_recess_days += 1
+        while long_offsets and long_offsets[-1] == non_recess_days:
+            pending_offsets.append(long_offsets.pop())
+
+        # if the allowed number of days is less than 7 then only count days on which the court is open
+        if is_open:
+            open_days += 1
+            while short_offsets and short_offsets[-1] == open_days:
+                pending_offsets.append(short_offsets.pop())
 
-def deadline_before(event_date: datetime.date, number_of_days: int, is_quebec: bool = False) -> datetime.date:
-    return deadline(event_date, number_of_days, after_event=False, is_quebec=is_quebec)
+    return [deadline_dates[number_of_days] for number_of_days in offsets]
 
-def dl(event_date_str: str, signed_number_of_days: int, is_quebec: bool = False) -> str:
+
+def deadline_after(event_date: datetime.date,
+                   number_of_days: int,
+                   is_quebec: bool = False,
+                   jurisdiction: str | None = None) -> datetime.date:
+    return deadline(event_date, number_of_days, after_event=True, is_quebec=is_quebec, jurisdiction=jurisdiction)
+
+
+def deadline_before(event_date: datetime.date,
+                    number_of_days: int,
+                    is_quebec: bool = False,
+                    jurisdiction: str | None = None) -> datetime.date:
+    return deadline(event_date, number_of_days, after_event=False, is_quebec=is_quebec, jurisdiction=jurisdiction)
+
+def dl(event_date_str: str,
+       signed_number_of_days: int,
+       is_quebec: bool = False,
+       jurisdiction: str | None = None) -> str:
     """
     Compute the deadline for a given event date and number of days.
 
     Args:
         event_date_str: The date of the event in YYYY-MM-DD format.
         signed_number_of_days: The number of days between the event date and deadline.
-        is_quebec: If True, the deadline is calculated according to Quebec rules.
+        is_quebec: If True and no jurisdiction is given, the deadline is calculated according to Quebec rules.
+        jurisdiction: The key of the jurisdiction whose holidays apply, or None to choose it with is_quebec.
 
     Returns:
         The computed deadline date in YYYY-MM-DD format.
     """
-    event_date: datetime.date = parse_date(event_date_str)
-    deadline_date: datetime.date
-
     # if the number of days is positive, the deadline is after the event date, else it is before
-    if signed_number_of_days > 0:
-        deadline_date = deadline_after(event_date, signed_number_of_days, is_quebec)
+    return format_ordinal(deadline_ordinal(parse_ordinal(event_date_str),
+                                           abs(signed_number_of_days),
+                                           signed_number_of_days > 0,
+                                           is_quebec,
+                                           jurisdiction))
+
+
+def counting_rule(number_of_days: int) -> CountingRule:
+    """
+    Get the rule that decides which days are counted towards a deadline of a given number of days.
+
+    Args:
+        number_of_days: The number of days between the event date and deadline.
+
+    Returns:
+        CountingRule.OPEN if the number of days is less than 7, otherwise CountingRule.NON_RECESS.
+    """
+
+    return CountingRule.OPEN if number_of_days < 7 else CountingRule.NON_RECESS
+
+
+def count_countable_days(start_date: datetime.date,
+                         end_date: datetime.date,
+                         rule: CountingRule = CountingRule.NON_RECESS,
+                         is_quebec: bool = False,
+                         jurisdiction: str | None = None) -> int:
+    """
+    Count the days from a start date to an end date inclusive that a counting rule counts towards a deadline.
+    The days covered by the court calendar are counted from its prefix sums in constant time,
+    and any other days are checked one at a time.
+
+    Args:
+        start_date: The first day.
+        end_date: The last day.
+        rule: The counting rule, such as the one given by `counting_rule` for a number of days.
+        is_quebec: If True and no jurisdiction is given, apply Quebec holidays.
+        jurisdiction: The key of the jurisdiction whose holidays apply, or None to choose it with is_quebec.
+
+    Returns:
+        The number of counted days, which is 0 if the end date is before the start date.
+
+    Raises:
+        ValueError: If the jurisdiction is not registered.
+    """
+
+    if end_date < start_date:
+        return 0
+
+    court_calendar: CourtCalendar
+    lane_is_quebec: bool = is_quebec
+    if jurisdiction is None:
+        court_calendar = ensure_court_calendar()
     else:
-        deadline_date = deadline_before(event_date, -signed_number_of_days, is_quebec)
+        court_calendar, lane_is_quebec = ensure_jurisdiction_calendar(jurisdiction, is_quebec)
+
+    counts: array | memoryview
+    if rule is CountingRule.OPEN:
+        counts = court_calendar.court_open_counts(lane_is_quebec)
+    else:
+        counts = court_calendar.non_recess_counts
+
+    start_ordinal: int = start_date.toordinal()
+    end_ordinal: int = end_date.toordinal()
+    first_ordinal: int = max(start_ordinal, court_calendar.start_ordinal)
+    last_ordinal: int = min(end_ordinal, court_calendar.end_ordinal)
+
+    counted_days: int = 0
+    if first_ordinal <= last_ordinal:
+        counted_days = (counts[last_ordinal - court_calendar.start_ordinal + 1] -
+                        counts[first_ordinal - court_calendar.start_ordinal])
+
+    # the days before and after the calendar are checked one at a time
+    for ordinal in chain(range(start_ordinal, min(end_ordinal + 1, court_calendar.start_ordinal)),
+                         range(max(start_ordinal, court_calendar.end_ordinal + 1), end_ordinal + 1)):
+        date: datetime.date = datetime.date.fromordinal(ordinal)
+        if rule is CountingRule.OPEN:
+            counted_days += is_court_open(date, is_quebec, jurisdiction)
+        else:
+            counted_days += not is_recess(date)
+
+    return counted_days
+
+
+def count_open_days(start_date: datetime.date,
+                    end_date: datetime.date,
+                    is_quebec: bool = False,
+                    jurisdiction: str | None = None) -> int:
+    """
+    Count the days from a start date to an end date inclusive on which the court is open.
+
+    Args:
+        start_date: The first day.
+        end_date: The last day.
+        is_quebec: If True and no jurisdiction is given, apply Quebec holidays.
+        jurisdiction: The key of the jurisdiction whose holidays apply, or None to choose it with is_quebec.
+
+    Returns:
+        The number of open days, which is 0 if the end date is before the start date.
+
+    Raises:
+        ValueError: If the jurisdiction is not registered.
+    """
+
+    return count_countable_days(start_date, end_date, CountingRule.OPEN, is_quebec, jurisdiction)
+
+
+def latest_event_date(deadline_date: datetime.date,
+                      number_of_days: int,
+                      after_event: bool = True,
+                      is_quebec: bool = False) -> datetime.date:
+    """
+    Compute the latest event date whose deadline falls on or before a given date.
+    For example, the latest date on which a document can be served so that a 30-day deadline
+    falls on or before the given date.
+
+    Args:
+        deadline_date: The latest acceptable deadline date.
+        number_of_days: The number of days between the event date and deadline.
+        after_event: If True, the deadline is after the event date; otherwise, it's before.
+        is_quebec: If True, the deadline is calculated according to Quebec rules.
+
+    Returns:
+        The latest event date.
+
+    Raises:
+        ValueError: If number_of_days is negative or the event date is not covered by the court calendar.
+    """
+
+    if number_of_days < 0:
+        raise ValueError("number_of_days must be non-negative")
+
+    court_calendar: CourtCalendar = ensure_court_calendar()
+    event_index: int | None = court_calendar.latest_event_index(court_calendar.index(deadline_date),
+                                                                number_of_days,
+                                                                after_event,
+                                                                is_quebec)
+    if event_index is None:
+        raise ValueError(f"the event date for {deadline_date} is not covered by the court calendar")
+
+    return datetime.date.fromordinal(court_calendar.start_ordinal + event_index)
+
+
+def earliest_event_date(deadline_date: datetime.date,
+                        number_of_days: int,
+                        after_event: bool = True,
+                        is_quebec: bool = False) -> datetime.date:
+    """
+    Compute the earliest event date whose deadline falls on or after a given date.
+
+    Args:
+        deadline_date: The earliest acceptable deadline date.
+        number_of_days: The number of days between the event date and deadline.
+        after_event: If True, the deadline is after the event date; otherwise, it's before.
+        is_quebec: If True, the deadline is calculated according to Quebec rules.
+
+    Returns:
+        The earliest event date.
+
+    Raises:
+        ValueError: If number_of_days is negative or the event date is not covered by the court calendar.
+    """
+
+    if number_of_days < 0:
+        raise ValueError("number_of_days must be non-negative")
+
+    court_calendar: CourtCalendar = ensure_court_calendar()
+    event_index: int | None = court_calendar.earliest_event_index(court_calendar.index(deadline_date),
+                                                                  number_of_days,
+                                                                  after_event,
+                                                                  is_quebec)
+    if event_index is None:
+        raise ValueError(f"the event date for {deadline_date} is not covered by the court calendar")
+
+    return datetime.date.fromordinal(court_calendar.start_ordinal + event_index)
+
+
+def event_dates_for_deadline(deadline_date: datetime.date,
+                             number_of_days: int,
+                             after_event: bool = True,
+                             is_quebec: bool = False) -> list[datetime.date]:
+    """
+    Compute all the event dates whose deadline is a given date.
+    Since the deadline never moves earlier when the event date moves later,
+    these event dates form a consecutive run, which is empty if the court is closed on the given date.
+
+    Args:
+        deadline_date: The deadline date.
+        number_of_days: The number of days between the event date and deadline.
+        after_event: If True, the deadline is after the event date; otherwise, it's before.
+        is_quebec: If True, the deadline is calculated according to Quebec rules.
+
+    Returns:
+        The event dates in increasing order.
+
+    Raises:
+        ValueError: If number_of_days is negative or the event dates are not covered by the court calendar.
+    """
 
-    deadline_date_str: str = format_date(deadline_date)
+    first_date: datetime.date = earliest_event_date(deadline_date, number_of_days, after_event, is_quebec)
+    last_date: datetime.date = latest_event_date(deadline_date, number_of_days, after_event, is_quebec)
 
-    return deadline_date_str
+    return [add_days(first_date, n_days) for n_days in range((last_date - first_date).days + 1)]
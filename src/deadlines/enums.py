@@ -6,7 +6,7 @@ with earlier versions of Python, especially Python 3.11.11 which is the version
 provided in Google Colab as of 2025-03-31.
 """
 
-from enum import IntEnum
+from enum import Enum, IntEnum, IntFlag
 
 
 class Month(IntEnum):
@@ -40,3 +40,60 @@ class Weekday(IntEnum):
     FRIDAY = 4
     SATURDAY = 5
     SUNDAY = 6
+
+
+class DayFlag(IntFlag):
+    """
+    Flags describing a day in a precomputed court calendar.
+    Each day is stored as one byte so all flags must fit in 8 bits.
+    """
+
+    WEEKEND = 1
+    HOLIDAY = 2
+    QUEBEC_HOLIDAY = 4
+    RECESS = 8
+    OPEN = 16
+    QUEBEC_OPEN = 32
+    CLOSURE = 64
+
+
+class DayReason(Enum):
+    """
+    Enum for the reasons why a day was counted or skipped when finding a deadline.
+    """
+
+    COUNTED = "counted"
+    WEEKEND = "weekend"
+    HOLIDAY = "holiday"
+    RECESS = "recess"
+    CLOSURE = "closure"
+
+
+class ClosureKind(Enum):
+    """
+    Enum for the kinds of period during which the court is closed, in addition to the holiday and recess rules.
+    A recess day is never counted towards a deadline, while a closure day is treated like a holiday.
+    """
+
+    RECESS = "recess"
+    CLOSURE = "closure"
+
+
+class CountingRule(Enum):
+    """
+    Enum for the rules that decide which days are counted towards a deadline.
+    Only the days on which the court is open are counted for fewer than 7 days,
+    and every day that is not in recess is counted for 7 or more days.
+    """
+
+    OPEN = "open"
+    NON_RECESS = "non_recess"
+
+
+class Direction(IntEnum):
+    """
+    Enum for the directions in which to search for days, whose values are the steps in days.
+    """
+
+    FORWARD = 1
+    BACKWARD = -1
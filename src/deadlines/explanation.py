@@ -0,0 +1,241 @@
+"""
+This module explains how deadlines are found.
+
+An explanation holds the deadline together with every day walked from the event date to the deadline,
+run-length encoded into segments of consecutive days that were counted, or skipped for the same reason.
+The deadline and its segments are found together in a single pass over the day flags, read from the
+court calendar where it covers the days and calculated from the rules elsewhere, so the holiday and
+recess rules are never re-run to explain a deadline after it has been found.
+"""
+
+import datetime
+from deadlines.canadian_holidays import calc_holidays, holiday_name, resolve_jurisdiction
+from deadlines.court_calendar import (CLOSURE, HOLIDAY, OPEN, QUEBEC_HOLIDAY, QUEBEC_OPEN, RECESS, CourtCalendar,
+                                      calc_day_flags, ensure_jurisdiction_calendar)
+from deadlines.enums import DayReason
+
+
+class Segment:
+    """
+    A run of consecutive days that were counted, or skipped for the same reason, when finding a deadline.
+    """
+
+    __slots__ = ("start_date", "end_date", "reason", "is_rolled", "holiday_name")
+
+    def __init__(self,
+                 start_date: datetime.date,
+                 end_date: datetime.date,
+                 reason: DayReason,
+                 is_rolled: bool = False,
+                 holiday_name: str | None = None):
+        """
+        Create a segment.
+
+        Args:
+            start_date: the first day of the segment
+            end_date: the last day of the segment
+            reason: the reason why the days were counted or skipped
+            is_rolled: True if the days were skipped to move the deadline to a day on which the court is open
+            holiday_name: the name of the holiday, if the reason is DayReason.HOLIDAY
+        """
+
+        self.start_date: datetime.date = start_date
+        self.end_date: datetime.date = end_date
+        self.reason: DayReason = reason
+        self.is_rolled: bool = is_rolled
+        self.holiday_name: str | None = holiday_name
+
+    def __len__(self) -> int:
+        return (self.end_date - self.start_date).days + 1
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Segment):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        return (f"Segment({self.start_date}, {self.end_date}, {self.reason.value}"
+                f"{', rolled' if self.is_rolled else ''}"
+                f"{', ' + repr(self.holiday_name) if self.holiday_name else ''})")
+
+
+class DeadlineExplanation:
+    """
+    A deadline together with the segments of days counted and skipped to find it, in date order.
+    """
+
+    __slots__ = ("event_date", "number_of_days", "after_event", "jurisdiction", "deadline_date", "segments")
+
+    def __init__(self,
+                 event_date: datetime.date,
+                 number_of_days: int,
+                 after_event: bool,
+                 jurisdiction: str,
+                 deadline_date: datetime.date,
+                 segments: list[Segment]):
+        self.event_date: datetime.date = event_date
+        self.number_of_days: int = number_of_days
+        self.after_event: bool = after_event
+        self.jurisdiction: str = jurisdiction
+        self.deadline_date: datetime.date = deadline_date
+        self.segments: list[Segment] = segments
+
+    def skipped_segments(self) -> list[Segment]:
+        """
+        Get the segments of days that were skipped.
+
+        Returns:
+            the segments whose reason is not DayReason.COUNTED, in date order
+        """
+
+        return [segment for segment in self.segments if segment.reason is not DayReason.COUNTED]
+
+    def __repr__(self) -> str:
+        return f"DeadlineExplanation({self.deadline_date}, {self.segments})"
+
+
+class DayFlagsReader:
+    """
+    A reader of the flags of each day, from a court calendar where it covers the day and from the rules elsewhere.
+    """
+
+    def __init__(self, court_calendar: CourtCalendar, is_quebec: bool = False):
+        """
+        Create a reader for the flags of a court calendar.
+
+        Args:
+            court_calendar: the court calendar
+            is_quebec: if True, name the holidays in the Quebec flags, otherwise those of the calendar's jurisdiction
+        """
+
+        self.court_calendar: CourtCalendar = court_calendar
+        self.is_quebec: bool = is_quebec
+
+        # the holiday sets of each year outside the calendar, keyed by year
+        self._holiday_sets: dict[int, tuple[set[datetime.date], set[datetime.date]]] = {}
+
+    def day_flags(self, ordinal: int) -> int:
+        """
+        Get the flags of a day.
+
+        Args:
+            ordinal: the proleptic Gregorian ordinal of the day
+
+        Returns:
+            the DayFlag bits of the day
+        """
+
+        if self.court_calendar.start_ordinal <= ordinal <= self.court_calendar.end_ordinal:
+            return self.court_calendar.flags[ordinal - self.court_calendar.start_ordinal]
+
+        date: datetime.date = datetime.date.fromordinal(ordinal)
+        holiday_sets: tuple[set[datetime.date], set[datetime.date]] | None = self._holiday_sets.get(date.year)
+        if holiday_sets is None:
+            holiday_sets = (set(calc_holidays(date.year, jurisdiction=self.court_calendar.jurisdiction).values()),
+                            set(calc_holidays(date.year, True).values()))
+            self._holiday_sets[date.year] = holiday_sets
+
+        return calc_day_flags(date, *holiday_sets)
+
+    def holiday_name(self, ordinal: int) -> str:
+        """
+        Get the name of the holiday on a day.
+
+        Args:
+            ordinal: the proleptic Gregorian ordinal of the day, which must be a holiday
+
+        Returns:
+            the name of the holiday
+        """
+
+        return holiday_name(datetime.date.fromordinal(ordinal),
+                            self.is_quebec,
+                            None if self.is_quebec else self.court_calendar.jurisdiction)
+
+
+def explain_deadline(event_date: datetime.date,
+                     number_of_days: int,
+                     after_event: bool = True,
+                     is_quebec: bool = False,
+                     jurisdiction: str | None = None) -> DeadlineExplanation:
+    """
+    Compute the deadline for a given event date and number of days, and explain which days were counted and skipped.
+
+    Args:
+        event_date: The date of the event.
+        number_of_days: The number of days between the event date and deadline.
+        after_event: If True, the deadline is after the event date; otherwise, it's before.
+        is_quebec: If True and no jurisdiction is given, the deadline is calculated according to Quebec rules.
+        jurisdiction: The key of the jurisdiction whose holidays apply, or None to choose it with is_quebec.
+
+    Returns:
+        The computed deadline date and the segments of days walked to find it.
+    """
+
+    court_calendar, lane_is_quebec = ensure_jurisdiction_calendar(jurisdiction, is_quebec)
+    reader: DayFlagsReader = DayFlagsReader(court_calendar, lane_is_quebec)
+    holiday_flag: int = QUEBEC_HOLIDAY if lane_is_quebec else HOLIDAY
+    open_flag: int = QUEBEC_OPEN if lane_is_quebec else OPEN
+    day_step: int = 1 if after_event else -1
+
+    # the segments in the order the days are walked, as [first ordinal, last ordinal, reason, is_rolled, name]
+    runs: list[list] = []
+
+    def add_day(ordinal: int, flags: int, is_counted: bool, is_rolled: bool) -> None:
+        reason: DayReason
+        holiday_name: str | None = None
+        if is_counted:
+            reason = DayReason.COUNTED
+        elif flags & RECESS:
+            reason = DayReason.RECESS
+        elif flags & holiday_flag:
+            reason = DayReason.HOLIDAY
+            holiday_name = reader.holiday_name(ordinal)
+        elif flags & CLOSURE:
+            reason = DayReason.CLOSURE
+        else:
+            reason = DayReason.WEEKEND
+
+        if runs and runs[-1][2:] == [reason, is_rolled, holiday_name]:
+            runs[-1][1] = ordinal
+        else:
+            runs.append([ordinal, ordinal, reason, is_rolled, holiday_name])
+
+    # count the days
+    ordinal: int = event_date.toordinal()
+    cumulative_days: int = 0
+    while cumulative_days < number_of_days:
+        ordinal += day_step
+        flags: int = reader.day_flags(ordinal)
+
+        # never count a recess day, and if the allowed number of days is less than 7
+        # then only count days on which the court is open
+        is_counted: bool = not flags & RECESS and (number_of_days >= 7 or bool(flags & open_flag))
+        if is_counted:
+            cumulative_days += 1
+        add_day(ordinal, flags, is_counted, False)
+
+    # the deadline must be a business day
+    flags = reader.day_flags(ordinal)
+    while not flags & open_flag:
+        # the last counted day is already in a segment
+        if number_of_days == 0 or runs[-1][1] != ordinal:
+            add_day(ordinal, flags, False, True)
+        ordinal += day_step
+        flags = reader.day_flags(ordinal)
+
+    if not after_event:
+        runs.reverse()
+    segments: list[Segment] = [Segment(datetime.date.fromordinal(min(first_ordinal, last_ordinal)),
+                                       datetime.date.fromordinal(max(first_ordinal, last_ordinal)),
+                                       reason,
+                                       is_rolled,
+                                       holiday_name)
+                               for first_ordinal, last_ordinal, reason, is_rolled, holiday_name in runs]
+
+    return DeadlineExplanation(event_date,
+                               number_of_days,
+                               after_event,
+                               resolve_jurisdiction(jurisdiction, is_quebec),
+                               datetime.date.fromordinal(ordinal),
+                               segments)
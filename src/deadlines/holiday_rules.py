@@ -0,0 +1,148 @@
+"""
+This module defines the declarative holiday rules and the holidays of the built-in jurisdictions.
+
+Each rule has a date(year) method that returns the date of its holiday in a year, or None if the
+holiday is not observed that year. `canadian_holidays` imports this module on first use and registers
+the BUILT_IN_JURISDICTIONS, so building the rule classes and tables does not slow down startup.
+"""
+
+import datetime
+from collections import namedtuple
+from deadlines.canadian_holidays import (BC_DAY, BOXING_DAY, CANADA_DAY, CANADA_JURISDICTION, CHRISTMAS_DAY,
+                                         CIVIC_HOLIDAY, EASTER_MONDAY, EASTER_SUNDAY, FAMILY_DAY, GOOD_FRIDAY,
+                                         HERITAGE_DAY, LABOUR_DAY, LOUIS_RIEL_DAY,
+                                         NATIONAL_DAY_FOR_TRUTH_AND_RECONCILIATION, NEW_YEARS_DAY, QUEBEC_JURISDICTION,
+                                         REMEMBRANCE_DAY, SAINT_JEAN_BAPTISTE_DAY, THANKSGIVING_DAY, VICTORIA_DAY,
+                                         calc_easter_sunday)
+from deadlines.enums import Month, Weekday
+
+
+# the holiday rules are namedtuples so that their reprs describe the rules exactly and deterministically,
+# which lets canadian_holidays.rules_fingerprint use them to fingerprint the rules
+
+
+class FixedDate(namedtuple("FixedDate", ["month", "day"])):
+    """
+    A holiday that falls on the same date every year.
+    """
+
+    __slots__ = ()
+
+    def date(self, year: int) -> datetime.date:
+        return datetime.date(year, self.month, self.day)
+
+
+class NthWeekday(namedtuple("NthWeekday", ["month", "weekday", "n"])):
+    """
+    A holiday that falls on the nth given weekday of a month, for example the second Monday in October.
+    """
+
+    __slots__ = ()
+
+    def date(self, year: int) -> datetime.date:
+        first_day_date: datetime.date = datetime.date(year, self.month, 1)
+        days: int = (self.weekday - first_day_date.weekday()) % 7 + 7 * (self.n - 1)
+        return first_day_date + datetime.timedelta(days=days)
+
+
+class LastWeekdayBefore(namedtuple("LastWeekdayBefore", ["month", "day", "weekday"])):
+    """
+    A holiday that falls on the last given weekday strictly before a date, for example the last Monday before May 25.
+    """
+
+    __slots__ = ()
+
+    def date(self, year: int) -> datetime.date:
+        before_date: datetime.date = datetime.date(year, self.month, self.day)
+        gap: int = (before_date.weekday() - self.weekday - 1) % 7 + 1
+        return before_date - datetime.timedelta(days=gap)
+
+
+class EasterRelative(namedtuple("EasterRelative", ["days"])):
+    """
+    A holiday that falls a number of days after Easter Sunday, or before it if the number is negative.
+    """
+
+    __slots__ = ()
+
+    def date(self, year: int) -> datetime.date:
+        return calc_easter_sunday(year) + datetime.timedelta(days=self.days)
+
+
+class ObservedIfSunday(namedtuple("ObservedIfSunday", ["rule"])):
+    """
+    A holiday that is observed on the following Monday when it falls on a Sunday.
+    """
+
+    __slots__ = ()
+
+    def date(self, year: int) -> datetime.date | None:
+        holiday_date: datetime.date | None = self.rule.date(year)
+        if holiday_date is not None and holiday_date.weekday() == Weekday.SUNDAY:
+            return holiday_date + datetime.timedelta(days=1)
+        return holiday_date
+
+
+class InEffect(namedtuple("InEffect", ["rule", "first_year", "last_year"], defaults=[None])):
+    """
+    A holiday that is only observed from a first year to an optional last year inclusive.
+    """
+
+    __slots__ = ()
+
+    def date(self, year: int) -> datetime.date | None:
+        if year < self.first_year or (self.last_year is not None and year > self.last_year):
+            return None
+        return self.rule.date(year)
+
+
+# the rules for the holidays observed in every jurisdiction
+NEW_YEARS_DAY_RULE: FixedDate = FixedDate(Month.JANUARY, 1)
+GOOD_FRIDAY_RULE: EasterRelative = EasterRelative(-2)
+EASTER_SUNDAY_RULE: EasterRelative = EasterRelative(0)
+EASTER_MONDAY_RULE: EasterRelative = EasterRelative(1)
+VICTORIA_DAY_RULE: LastWeekdayBefore = LastWeekdayBefore(Month.MAY, 25, Weekday.MONDAY)
+CANADA_DAY_RULE: ObservedIfSunday = ObservedIfSunday(FixedDate(Month.JULY, 1))
+LABOUR_DAY_RULE: NthWeekday = NthWeekday(Month.SEPTEMBER, Weekday.MONDAY, 1)
+NATIONAL_DAY_FOR_TRUTH_AND_RECONCILIATION_RULE: FixedDate = FixedDate(Month.SEPTEMBER, 30)
+THANKSGIVING_DAY_RULE: NthWeekday = NthWeekday(Month.OCTOBER, Weekday.MONDAY, 2)
+REMEMBRANCE_DAY_RULE: FixedDate = FixedDate(Month.NOVEMBER, 11)
+CHRISTMAS_DAY_RULE: FixedDate = FixedDate(Month.DECEMBER, 25)
+BOXING_DAY_RULE: FixedDate = FixedDate(Month.DECEMBER, 26)
+
+# the rules for the holidays observed in some jurisdictions
+SAINT_JEAN_BAPTISTE_DAY_RULE: FixedDate = FixedDate(Month.JUNE, 24)
+CIVIC_HOLIDAY_RULE: NthWeekday = NthWeekday(Month.AUGUST, Weekday.MONDAY, 1)
+THIRD_MONDAY_IN_FEBRUARY_RULE: NthWeekday = NthWeekday(Month.FEBRUARY, Weekday.MONDAY, 3)
+
+COMMON_RULES: list[tuple[str, object]] = [
+    (NEW_YEARS_DAY, NEW_YEARS_DAY_RULE),
+    (GOOD_FRIDAY, GOOD_FRIDAY_RULE),
+    (EASTER_SUNDAY, EASTER_SUNDAY_RULE),
+    (EASTER_MONDAY, EASTER_MONDAY_RULE),
+    (VICTORIA_DAY, VICTORIA_DAY_RULE),
+    (CANADA_DAY, CANADA_DAY_RULE),
+    (LABOUR_DAY, LABOUR_DAY_RULE),
+    (NATIONAL_DAY_FOR_TRUTH_AND_RECONCILIATION, NATIONAL_DAY_FOR_TRUTH_AND_RECONCILIATION_RULE),
+    (THANKSGIVING_DAY, THANKSGIVING_DAY_RULE),
+    (REMEMBRANCE_DAY, REMEMBRANCE_DAY_RULE),
+    (CHRISTMAS_DAY, CHRISTMAS_DAY_RULE),
+    (BOXING_DAY, BOXING_DAY_RULE),
+]
+
+# the arguments of canadian_holidays.register_jurisdiction for each built-in jurisdiction, in registration order:
+# (jurisdiction, rules, parent, excluded_names)
+BUILT_IN_JURISDICTIONS: list[tuple[str, list[tuple[str, object]], str | None, list[str] | None]] = [
+    (CANADA_JURISDICTION, COMMON_RULES + [(CIVIC_HOLIDAY, CIVIC_HOLIDAY_RULE)], None, None),
+    (QUEBEC_JURISDICTION, COMMON_RULES + [(SAINT_JEAN_BAPTISTE_DAY, SAINT_JEAN_BAPTISTE_DAY_RULE)], None, None),
+    ("ON", [(FAMILY_DAY, InEffect(THIRD_MONDAY_IN_FEBRUARY_RULE, 2008))], CANADA_JURISDICTION, None),
+    ("AB", [(FAMILY_DAY, InEffect(THIRD_MONDAY_IN_FEBRUARY_RULE, 1990))], CANADA_JURISDICTION, None),
+    ("MB", [(LOUIS_RIEL_DAY, InEffect(THIRD_MONDAY_IN_FEBRUARY_RULE, 2008))], CANADA_JURISDICTION, None),
+    ("NS", [(HERITAGE_DAY, InEffect(THIRD_MONDAY_IN_FEBRUARY_RULE, 2015))], CANADA_JURISDICTION, None),
+    ("BC",
+     [(FAMILY_DAY, InEffect(NthWeekday(Month.FEBRUARY, Weekday.MONDAY, 2), 2013, 2018)),
+      (FAMILY_DAY, InEffect(THIRD_MONDAY_IN_FEBRUARY_RULE, 2019)),
+      (BC_DAY, CIVIC_HOLIDAY_RULE)],
+     CANADA_JURISDICTION,
+     [CIVIC_HOLIDAY]),
+]
@@ -0,0 +1,130 @@
+"""
+This module provides opt-in instrumentation of deadline computations.
+
+While tracing is enabled, each call of `due_dates.deadline` records a trace of how the
+deadline was found: the days stepped over, the recess days and closed days that were skipped,
+the days rolled forward or backward to reach a day on which the court is open, whether the
+court calendar covered the computation, and the wall time taken. Traces are added to the
+aggregated counters and passed to any active collectors.
+
+When tracing is disabled, which is the default, `deadline` only checks the `enabled` flag,
+so the instrumentation costs almost nothing.
+"""
+
+from collections import namedtuple
+from collections.abc import Callable
+
+# True while deadline computations are being traced
+enabled: bool = False
+
+# a trace of one deadline computation
+# this is a namedtuple rather than a dataclass since due_dates imports this module at startup
+DeadlineTrace = namedtuple("DeadlineTrace", ["event_date",
+                                             "number_of_days",
+                                             "after_event",
+                                             "is_quebec",
+                                             "deadline_date",
+                                             "days_stepped",
+                                             "recess_days",
+                                             "closed_days",
+                                             "rolled_days",
+                                             "calendar_hit",
+                                             "seconds"])
+
+# a snapshot of the aggregated counters
+TraceCounters = namedtuple("TraceCounters", ["calls",
+                                             "calendar_hits",
+                                             "calendar_misses",
+                                             "days_stepped",
+                                             "recess_days",
+                                             "closed_days",
+                                             "rolled_days",
+                                             "seconds"])
+
+# the initial values of the aggregated counters
+ZERO_COUNTERS: TraceCounters = TraceCounters(0, 0, 0, 0, 0, 0, 0, 0.0)
+
+# the aggregated counters, in the order of the fields of TraceCounters
+_counters: list[int | float] = list(ZERO_COUNTERS)
+
+# the functions called with each trace
+_listeners: list[Callable[[DeadlineTrace], None]] = []
+
+
+class TraceCollector:
+    """
+    A context manager that enables tracing and collects the traces of the deadlines computed in its body.
+    """
+
+    def __init__(self):
+        self.traces: list[DeadlineTrace] = []
+        self._was_enabled: bool = False
+
+    def __enter__(self) -> "TraceCollector":
+        global enabled
+        self._was_enabled = enabled
+        _listeners.append(self.traces.append)
+        enabled = True
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        global enabled
+        _listeners.remove(self.traces.append)
+        enabled = self._was_enabled
+
+
+def enable_tracing() -> None:
+    """
+    Start tracing deadline computations.
+    """
+
+    global enabled
+    enabled = True
+
+
+def disable_tracing() -> None:
+    """
+    Stop tracing deadline computations.
+    """
+
+    global enabled
+    enabled = False
+
+
+def record(trace: DeadlineTrace) -> None:
+    """
+    Add a trace to the aggregated counters and pass it to the active collectors.
+
+    Args:
+        trace: the trace of a deadline computation
+    """
+
+    _counters[0] += 1
+    _counters[1 if trace.calendar_hit else 2] += 1
+    _counters[3] += trace.days_stepped
+    _counters[4] += trace.recess_days
+    _counters[5] += trace.closed_days
+    _counters[6] += trace.rolled_days
+    _counters[7] += trace.seconds
+
+    for listener in _listeners:
+        listener(trace)
+
+
+def trace_counters() -> TraceCounters:
+    """
+    Get the aggregated counters of every traced deadline computation.
+
+    Returns:
+        a snapshot of the counters
+    """
+
+    return TraceCounters(*_counters)
+
+
+def reset_counters() -> None:
+    """
+    Reset the aggregated counters to zero.
+    """
+
+    _counters[:] = ZERO_COUNTERS
@@ -0,0 +1,227 @@
+"""
+This module provides a bounded, observable memoization decorator.
+
+Unlike `functools.cache`, a bounded cache evicts its least recently used entries once it is full,
+counts its hits, misses and evictions, and can be resized, warmed up and cleared at run time.
+Every bounded cache is registered by name so that `cache_stats` can report on all of them,
+for example to export the counters as metrics.
+"""
+
+import threading
+from collections import OrderedDict, namedtuple
+from collections.abc import Callable, Hashable, Iterable
+from functools import update_wrapper
+
+# the registered caches, keyed by name
+_caches: dict[str, "BoundedCache"] = {}
+
+
+# the counters describing the performance of a bounded cache
+# this is a namedtuple rather than a dataclass since the cache is used at import time,
+# and importing dataclasses would slow down startup
+CacheStats = namedtuple("CacheStats", ["hits", "misses", "evictions", "size", "max_size"])
+
+
+class BoundedCache:
+    """
+    A function wrapper that caches the most recently used results of the function.
+    """
+
+    def __init__(self,
+                 function: Callable[..., object],
+                 max_size: int,
+                 name: str,
+                 key: Callable[..., Hashable] | None = None):
+        """
+        Wrap a function with an empty cache and register it.
+
+        Args:
+            function: the function to wrap
+            max_size: the maximum number of cached results
+            name: the name under which the cache is registered
+            key: a function that maps the arguments of a call to its cache key, so that equivalent calls
+                share one result, or None to key each call by its arguments
+
+        Raises:
+            ValueError: If max_size is not positive.
+        """
+
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+
+        update_wrapper(self, function)
+        self.function: Callable[..., object] = function
+        self.max_size: int = max_size
+        self.name: str = name
+        self.key: Callable[..., Hashable] | None = key
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self._results: OrderedDict[Hashable, object] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+        _caches[name] = self
+
+    def __call__(self, *args: Hashable, **kwargs: Hashable) -> object:
+        key: Hashable = self.cache_key(*args, **kwargs)
+
+        with self._lock:
+            if key in self._results:
+                self.hits += 1
+                self._results.move_to_end(key)
+                return self._results[key]
+            self.misses += 1
+
+        # compute outside the lock so that slow calls do not block other threads
+        result: object = self.function(*args, **kwargs)
+
+        with self._lock:
+            self._results[key] = result
+            self._evict()
+
+        return result
+
+    def cache_key(self, *args: Hashable, **kwargs: Hashable) -> Hashable:
+        """
+        Get the key under which the result of a call is cached.
+
+        Args:
+            args: the positional arguments of the call
+            kwargs: the keyword arguments of the call
+
+        Returns:
+            the cache key
+        """
+
+        if self.key is not None:
+            return self.key(*args, **kwargs)
+
+        return (args, tuple(sorted(kwargs.items()))) if kwargs else args
+
+    def _evict(self) -> None:
+        while len(self._results) > self.max_size:
+            self._results.popitem(last=False)
+            self.evictions += 1
+
+    def resize(self, max_size: int) -> None:
+        """
+        Change the maximum number of cached results, evicting the least recently used results if necessary.
+
+        Args:
+            max_size: the new maximum number of cached results
+
+        Raises:
+            ValueError: If max_size is not positive.
+        """
+
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+
+        with self._lock:
+            self.max_size = max_size
+            self._evict()
+
+    def warm_up(self, calls: Iterable[tuple[Hashable, ...]]) -> None:
+        """
+        Compute and cache the results for several calls in advance.
+
+        Args:
+            calls: the positional arguments of each call
+        """
+
+        for args in calls:
+            self(*args)
+
+    def store(self, args: tuple[Hashable, ...], result: object) -> None:
+        """
+        Cache a result that was computed elsewhere, for example loaded from disk, without counting a miss.
+
+        Args:
+            args: the positional arguments of the call
+            result: the result of the call
+        """
+
+        key: Hashable = self.cache_key(*args)
+        with self._lock:
+            self._results[key] = result
+            self._results.move_to_end(key)
+            self._evict()
+
+    def cache_clear(self) -> None:
+        """
+        Remove every cached result and reset the counters.
+        """
+
+        with self._lock:
+            self._results.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def cache_stats(self) -> CacheStats:
+        """
+        Get the counters of the cache.
+
+        Returns:
+            a snapshot of the counters
+        """
+
+        with self._lock:
+            return CacheStats(self.hits, self.misses, self.evictions, len(self._results), self.max_size)
+
+
+def bounded_cache(max_size: int,
+                  name: str | None = None,
+                  key: Callable[..., Hashable] | None = None) -> Callable[[Callable[..., object]], BoundedCache]:
+    """
+    Decorate a function with a bounded cache.
+
+    Args:
+        max_size: the maximum number of cached results
+        name: the name under which the cache is registered, or None to use the name of the function
+        key: a function that maps the arguments of a call to its cache key, or None to key each call by its arguments
+
+    Returns:
+        the decorator
+    """
+
+    def decorator(function: Callable[..., object]) -> BoundedCache:
+        return BoundedCache(function, max_size, name or function.__name__, key)
+
+    return decorator
+
+
+def get_cache(name: str) -> BoundedCache:
+    """
+    Get a registered cache.
+
+    Args:
+        name: the name of the cache
+
+    Returns:
+        the cache
+
+    Raises:
+        KeyError: If no cache is registered with the name.
+    """
+
+    return _caches[name]
+
+
+def cache_stats() -> dict[str, CacheStats]:
+    """
+    Get the counters of every registered cache.
+
+    Returns:
+        the counters, keyed by cache name
+    """
+
+    return {name: cache.cache_stats() for name, cache in _caches.items()}
+
+
+def clear_caches() -> None:
+    """
+    Clear every registered cache.
+    """
+
+    for cache in _caches.values():
+        cache.cache_clear()
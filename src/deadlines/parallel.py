@@ -0,0 +1,154 @@
+"""
+This module computes deadlines for large batches of requests using several processes.
+
+The requests are sorted by the year of the event date and split into shards that each cover
+a range of years. Each shard is sent to a worker process together with the flags of the court
+calendar for just those years, or, if a calendar file is given, the workers memory-map that
+file and share its pages. The results are merged back into the order of the requests, and
+are identical to those of calling `due_dates.deadline` on each request in turn.
+"""
+
+import datetime
+import os
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from deadlines.calendar_file import open_calendar_file
+from deadlines.court_calendar import CourtCalendar, ensure_court_calendar
+from deadlines.dates import set_court_calendar
+from deadlines.due_dates import DeadlineRequest, deadline
+from deadlines.enums import Month
+from deadlines.memo import bounded_cache
+
+# the number of shards given to each worker, so that faster workers can take on more of the work
+SHARDS_PER_WORKER: int = 4
+
+# the number of years added to each end of a shard's calendar, since deadlines may fall in a later or earlier year
+YEAR_MARGIN: int = 2
+
+
+@bounded_cache(1, name="shared_calendar_file")
+def open_shared_calendar(calendar_path: str) -> CourtCalendar:
+    """
+    Open a calendar file once per worker process.
+
+    Args:
+        calendar_path: the path of the calendar file
+
+    Returns:
+        the court calendar backed by the memory-mapped file
+    """
+
+    return open_calendar_file(calendar_path)
+
+
+def calendar_slice(court_calendar: CourtCalendar, min_year: int, max_year: int) -> tuple[int, int, bytes] | None:
+    """
+    Extract the flags for a range of years from a court calendar.
+
+    Args:
+        court_calendar: the court calendar
+        min_year: the first year wanted
+        max_year: the last year wanted
+
+    Returns:
+        the first year, last year and flags of the part of the range covered by the calendar,
+        or None if the calendar covers none of it
+    """
+
+    min_year = max(min_year, court_calendar.min_year)
+    max_year = min(max_year, court_calendar.max_year)
+    if min_year > max_year:
+        return None
+
+    start_index: int = court_calendar.index(datetime.date(min_year, Month.JANUARY, 1))
+    end_index: int = court_calendar.index(datetime.date(max_year, Month.DECEMBER, 31))
+
+    return min_year, max_year, bytes(court_calendar.flags[start_index:end_index + 1])
+
+
+def compute_shard(requests: list[DeadlineRequest],
+                  flags_slice: tuple[int, int, bytes] | None = None,
+                  calendar_path: str | None = None) -> list[datetime.date]:
+    """
+    Compute the deadlines for a shard of requests in a worker process.
+
+    Args:
+        requests: the requests in the shard
+        flags_slice: the first year, last year and flags of the calendar for the shard, or None
+        calendar_path: the path of a calendar file shared by the workers, or None
+
+    Returns:
+        the deadlines, in the same order as the requests
+    """
+
+    if calendar_path is not None:
+        set_court_calendar(open_shared_calendar(calendar_path))
+    elif flags_slice is not None:
+        min_year, max_year, flags = flags_slice
+        set_court_calendar(CourtCalendar(min_year, max_year, flags))
+
+    return [deadline(*request) for request in requests]
+
+
+def plan_shards(requests: Sequence[DeadlineRequest], number_of_shards: int) -> list[list[int]]:
+    """
+    Split the requests into shards of about the same size, each covering a range of years.
+
+    Args:
+        requests: the requests
+        number_of_shards: the maximum number of shards
+
+    Returns:
+        the indices of the requests in each shard
+    """
+
+    order: list[int] = sorted(range(len(requests)), key=lambda index: requests[index][0])
+    shard_size: int = max(1, -(-len(order) // max(1, number_of_shards)))
+
+    return [order[start:start + shard_size] for start in range(0, len(order), shard_size)]
+
+
+def deadlines_parallel(requests: Sequence[DeadlineRequest],
+                       max_workers: int | None = None,
+                       calendar_path: str | None = None) -> list[datetime.date]:
+    """
+    Compute the deadlines for many requests in parallel.
+
+    Args:
+        requests: the requests, each an (event_date, number_of_days, after_event, is_quebec) tuple
+        max_workers: the number of worker processes, or None to use the number of CPUs
+        calendar_path: the path of a calendar file for the workers to share, or None to send
+            each worker the flags for the years of its shards
+
+    Returns:
+        the deadlines, in the same order as the requests
+
+    Raises:
+        ValueError: If any number of days is negative.
+    """
+
+    if any(request[1] < 0 for request in requests):
+        raise ValueError("number_of_days must be non-negative")
+
+    max_workers = max_workers or os.cpu_count() or 1
+    shards: list[list[int]] = plan_shards(requests, max_workers * SHARDS_PER_WORKER)
+    court_calendar: CourtCalendar | None = None if calendar_path is not None else ensure_court_calendar()
+
+    deadline_dates: list[datetime.date | None] = [None] * len(requests)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = []
+        for shard in shards:
+            shard_requests: list[DeadlineRequest] = [requests[index] for index in shard]
+            flags_slice: tuple[int, int, bytes] | None = None
+            if court_calendar is not None:
+                flags_slice = calendar_slice(court_calendar,
+                                             shard_requests[0][0].year - YEAR_MARGIN,
+                                             shard_requests[-1][0].year + YEAR_MARGIN)
+            futures.append(executor.submit(compute_shard, shard_requests, flags_slice, calendar_path))
+
+        # merge the results back into the order of the requests
+        for shard, future in zip(shards, futures):
+            for index, deadline_date in zip(shard, future.result()):
+                deadline_dates[index] = deadline_date
+
+    return deadline_dates
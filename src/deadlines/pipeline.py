@@ -0,0 +1,316 @@
+"""
+This module adds a deadline column to streams of docket events in CSV or JSON Lines format.
+
+Rows are read lazily, processed in chunks and written as soon as each chunk is complete,
+so memory use does not depend on the size of the input. Deadlines are computed with the
+court calendar, which is installed once before the first chunk.
+
+Each row gives an event date in YYYY-MM-DD format and a signed number of days, as for `due_dates.dl`:
+a positive number of days gives a deadline after the event and a negative number gives one before it.
+"""
+
+import csv
+import datetime
+import json
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from itertools import islice
+from typing import TextIO
+from deadlines.court_calendar import ensure_court_calendar
+from deadlines.dates import format_date, parse_date
+from deadlines.due_dates import deadline
+
+CSV_FORMAT: str = "csv"
+JSONL_FORMAT: str = "jsonl"
+FORMATS: list[str] = [CSV_FORMAT, JSONL_FORMAT]
+
+DEFAULT_CHUNK_SIZE: int = 10_000
+
+# the strings in a CSV file that mean True in the Quebec column
+TRUE_STRINGS: set[str] = {"1", "true", "t", "yes", "y"}
+
+
+@dataclass
+class PipelineColumns:
+    """
+    The names of the columns read and written by the pipeline.
+    """
+
+    event_column: str = "event_date"
+    days_column: str = "number_of_days"
+    quebec_column: str | None = None
+    output_column: str = "deadline"
+
+
+@dataclass
+class PipelineStats:
+    """
+    The number of rows processed by the pipeline and the time taken.
+    """
+
+    rows: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+
+def format_from_path(path: str) -> str:
+    """
+    Infer the format of a file from its name.
+
+    Args:
+        path: the path of the file
+
+    Returns:
+        JSONL_FORMAT if the file name ends in .jsonl or .ndjson, otherwise CSV_FORMAT
+    """
+
+    return JSONL_FORMAT if path.endswith((".jsonl", ".ndjson")) else CSV_FORMAT
+
+
+def read_rows(file: TextIO, file_format: str = CSV_FORMAT) -> Iterator[dict]:
+    """
+    Read rows lazily from a file.
+
+    Args:
+        file: the input file
+        file_format: the format of the file, CSV_FORMAT or JSONL_FORMAT
+
+    Returns:
+        an iterator over the rows as dictionaries
+    """
+
+    if file_format == CSV_FORMAT:
+        return iter(csv.DictReader(file))
+
+    return (json.loads(line) for line in file if line.strip())
+
+
+def parse_quebec(value: object) -> bool:
+    """
+    Parse the value of the Quebec column.
+
+    Args:
+        value: the value, which is a bool in JSON Lines and a string in CSV
+
+    Returns:
+        True if the value means the deadline is calculated according to Quebec rules
+    """
+
+    if isinstance(value, str):
+        return value.strip().lower() in TRUE_STRINGS
+
+    return bool(value)
+
+
+def add_deadline(row: dict, columns: PipelineColumns) -> dict:
+    """
+    Add the deadline to a row.
+
+    Args:
+        row: the row
+        columns: the names of the columns
+
+    Returns:
+        the row, with the deadline in YYYY-MM-DD format in the output column
+    """
+
+    event_date: datetime.date = parse_date(row[columns.event_column])
+    signed_number_of_days: int = int(row[columns.days_column])
+    is_quebec: bool = parse_quebec(row.get(columns.quebec_column, False)) if columns.quebec_column else False
+
+    # if the number of days is positive, the deadline is after the event date, else it is before
+    deadline_date: datetime.date = deadline(event_date,
+                                            abs(signed_number_of_days),
+                                            signed_number_of_days > 0,
+                                            is_quebec)
+    row[columns.output_column] = format_date(deadline_date)
+
+    return row
+
+
+def process_chunks(rows: Iterable[dict],
+                   columns: PipelineColumns,
+                   chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[list[dict]]:
+    """
+    Add deadlines to rows, one chunk at a time.
+
+    Args:
+        rows: the rows
+        columns: the names of the columns
+        chunk_size: the maximum number of rows in each chunk
+
+    Returns:
+        an iterator over the chunks of rows with deadlines
+
+    Raises:
+        ValueError: If chunk_size is less than 1.
+    """
+
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, not {chunk_size}")
+
+    ensure_court_calendar()
+
+    row_iterator: Iterator[dict] = iter(rows)
+    while chunk := list(islice(row_iterator, chunk_size)):
+        yield [add_deadline(row, columns) for row in chunk]
+
+
+class RowWriter:
+    """
+    A writer of rows in CSV or JSON Lines format.
+    The CSV header is taken from the first row written.
+    """
+
+    def __init__(self, file: TextIO, file_format: str = CSV_FORMAT):
+        self.file: TextIO = file
+        self.file_format: str = file_format
+        self.csv_writer: csv.DictWriter | None = None
+
+    def write_rows(self, rows: list[dict]) -> None:
+        """
+        Write rows to the file.
+
+        Args:
+            rows: the rows
+        """
+
+        if not rows:
+            return
+
+        if self.file_format == JSONL_FORMAT:
+            self.file.writelines(json.dumps(row) + "\n" for row in rows)
+            return
+
+        if self.csv_writer is None:
+            self.csv_writer = csv.DictWriter(self.file, fieldnames=list(rows[0]))
+            self.csv_writer.writeheader()
+        self.csv_writer.writerows(rows)
+
+
+def run_pipeline(input_file: TextIO,
+                 output_file: TextIO,
+                 input_format: str = CSV_FORMAT,
+                 output_format: str | None = None,
+                 columns: PipelineColumns | None = None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 progress_file: TextIO | None = None) -> PipelineStats:
+    """
+    Read rows from a file, add their deadlines and write them to another file.
+
+    Args:
+        input_file: the input file
+        output_file: the output file
+        input_format: the format of the input file
+        output_format: the format of the output file, or None to use the input format
+        columns: the names of the columns, or None to use the defaults
+        chunk_size: the maximum number of rows in each chunk
+        progress_file: the file to which the throughput is reported after each chunk, or None
+
+    Returns:
+        the number of rows processed and the time taken
+
+    Raises:
+        ValueError: If chunk_size is less than 1.
+    """
+
+    columns = columns or PipelineColumns()
+    writer: RowWriter = RowWriter(output_file, output_format or input_format)
+    stats: PipelineStats = PipelineStats()
+    start_time: float = time.perf_counter()
+
+    for chunk in process_chunks(read_rows(input_file, input_format), columns, chunk_size):
+        writer.write_rows(chunk)
+        stats.rows += len(chunk)
+        stats.seconds = time.perf_counter() - start_time
+        if progress_file is not None:
+            print(f"{stats.rows} rows, {stats.rows_per_second:.0f} rows/s", file=progress_file)
+
+    output_file.flush()
+    stats.seconds = time.perf_counter() - start_time
+
+    return stats
+
+
+def positive_int(value: str) -> int:
+    """
+    Parse a command line argument that must be a positive integer.
+
+    Args:
+        value: the argument
+
+    Returns:
+        the integer
+
+    Raises:
+        ValueError: If the argument is not an integer of at least 1, which argparse reports as an invalid value.
+    """
+
+    number: int = int(value)
+    if number < 1:
+        raise ValueError(f"{value} is not positive")
+
+    return number
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Run the pipeline from the command line.
+
+    Args:
+        argv: the command line arguments, or None to use sys.argv
+
+    Returns:
+        the exit status
+    """
+
+    # import argparse on first use since only the command line needs it
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="python -m deadlines",
+                                     description="Add a deadline column to a CSV or JSON Lines file of events.")
+    parser.add_argument("input", help="the input file, or - for standard input")
+    parser.add_argument("output", nargs="?", default="-", help="the output file, or - for standard output")
+    parser.add_argument("--format", choices=FORMATS, help="the input format, inferred from the file name by default")
+    parser.add_argument("--output-format", choices=FORMATS, help="the output format, the input format by default")
+    parser.add_argument("--event-column", default=PipelineColumns.event_column)
+    parser.add_argument("--days-column", default=PipelineColumns.days_column)
+    parser.add_argument("--quebec-column", default=PipelineColumns.quebec_column)
+    parser.add_argument("--output-column", default=PipelineColumns.output_column)
+    parser.add_argument("--chunk-size", type=positive_int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--quiet", action="store_true", help="do not report the throughput")
+    args = parser.parse_args(argv)
+
+    input_format: str = args.format or format_from_path(args.input)
+    output_format: str = args.output_format or (format_from_path(args.output) if args.output != "-" else input_format)
+    columns: PipelineColumns = PipelineColumns(args.event_column,
+                                               args.days_column,
+                                               args.quebec_column,
+                                               args.output_column)
+
+    input_file: TextIO = sys.stdin if args.input == "-" else open(args.input, newline="", encoding="utf-8")
+    output_file: TextIO = sys.stdout if args.output == "-" else open(args.output, "w", newline="", encoding="utf-8")
+    try:
+        stats: PipelineStats = run_pipeline(input_file,
+                                            output_file,
+                                            input_format,
+                                            output_format,
+                                            columns,
+                                            args.chunk_size,
+                                            None if args.quiet else sys.stderr)
+    finally:
+        if input_file is not sys.stdin:
+            input_file.close()
+        if output_file is not sys.stdout:
+            output_file.close()
+
+    if not args.quiet:
+        print(f"done: {stats.rows} rows in {stats.seconds:.2f} s, {stats.rows_per_second:.0f} rows/s",
+              file=sys.stderr)
+
+    return 0
@@ -0,0 +1,301 @@
+"""
+This module provides an asyncio service for computing deadlines.
+
+Concurrent identical requests are coalesced into one computation, and results are kept in a
+bounded cache whose entries expire after a time to live. The computation runs as its own task,
+so cancelling one of the requests waiting for it does not affect the others, and it is only cancelled
+once no request is waiting for it. Building the court calendar, and computing deadlines that run past
+it, may block for a noticeable time, so that work runs in an executor and the event loop never stalls.
+Deadlines found in the calendar are computed inline since they only take a few binary searches.
+"""
+
+import asyncio
+import datetime
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from functools import partial
+from deadlines import instrumentation
+from deadlines.court_calendar import CourtCalendar, ensure_court_calendar
+from deadlines.dates import closure_generation, format_date, get_court_calendar, parse_date
+from deadlines.due_dates import deadline, deadline_by_calendar
+
+# the key of a deadline request: (event_date, number_of_days, after_event, is_quebec)
+RequestKey = tuple[datetime.date, int, bool, bool]
+
+DEFAULT_MAX_SIZE: int = 10_000
+DEFAULT_TTL: float = 3600.0
+
+
+@dataclass
+class ServiceStats:
+    """
+    Counters describing how deadline requests were served.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+
+class ResultCache:
+    """
+    A least-recently-used cache of deadlines whose entries expire after a time to live.
+    Every entry is discarded when the installed closures change, since any deadline may have moved.
+    """
+
+    def __init__(self,
+                 max_size: int = DEFAULT_MAX_SIZE,
+                 ttl: float = DEFAULT_TTL,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Create an empty cache.
+
+        Args:
+            max_size: the maximum number of entries
+            ttl: the number of seconds for which an entry remains valid
+            clock: the function that returns the current time in seconds
+
+        Raises:
+            ValueError: If max_size is not positive.
+        """
+
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+
+        self.max_size: int = max_size
+        self.ttl: float = ttl
+        self.clock: Callable[[], float] = clock
+        self.stats: ServiceStats = ServiceStats()
+        self._entries: OrderedDict[RequestKey, tuple[float, datetime.date]] = OrderedDict()
+        self.generation: int = closure_generation()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def check_generation(self) -> None:
+        """
+        Discard every entry if the installed closures have changed since the entries were cached.
+        """
+
+        generation: int = closure_generation()
+        if generation != self.generation:
+            self._entries.clear()
+            self.generation = generation
+
+    def get(self, key: RequestKey) -> datetime.date | None:
+        """
+        Get the cached deadline for a request.
+
+        Args:
+            key: the request key
+
+        Returns:
+            the cached deadline, or None if it is not cached or has expired
+        """
+
+        self.check_generation()
+        entry: tuple[float, datetime.date] | None = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, deadline_date = entry
+        if self.clock() >= expires_at:
+            del self._entries[key]
+            self.stats.expirations += 1
+            return None
+
+        self._entries.move_to_end(key)
+        return deadline_date
+
+    def put(self, key: RequestKey, deadline_date: datetime.date, generation: int | None = None) -> None:
+        """
+        Cache the deadline for a request, evicting the least recently used entry if the cache is full.
+
+        Args:
+            key: the request key
+            deadline_date: the deadline
+            generation: the closure generation when the deadline was computed, or None if it is current
+        """
+
+        self.check_generation()
+        if generation is not None and generation != self.generation:
+            # the closures changed while the deadline was computed
+            return
+
+        self._entries[key] = (self.clock() + self.ttl, deadline_date)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def clear(self) -> None:
+        """
+        Remove every entry.
+        """
+
+        self._entries.clear()
+
+
+class DeadlineService:
+    """
+    An asyncio service that computes deadlines, coalescing identical concurrent requests.
+    """
+
+    def __init__(self,
+                 max_size: int = DEFAULT_MAX_SIZE,
+                 ttl: float = DEFAULT_TTL,
+                 executor: Executor | None = None,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Create the service.
+
+        Args:
+            max_size: the maximum number of cached deadlines
+            ttl: the number of seconds for which a cached deadline remains valid
+            executor: the executor that runs blocking work, or None to use the default executor of the loop
+            clock: the function that returns the current time in seconds
+        """
+
+        self.cache: ResultCache = ResultCache(max_size, ttl, clock)
+        self.executor: Executor | None = executor
+        self._in_flight: dict[RequestKey, asyncio.Task[datetime.date]] = {}
+        self._waiters: dict[asyncio.Task[datetime.date], int] = {}
+        self._calendar_future: asyncio.Future[CourtCalendar] | None = None
+
+    @property
+    def stats(self) -> ServiceStats:
+        """
+        Get the counters describing how requests were served.
+        """
+
+        return self.cache.stats
+
+    async def warm_up(self) -> CourtCalendar:
+        """
+        Make sure the court calendar is installed, building it in the executor if necessary.
+        Concurrent calls wait for the same build. The calendar is looked up on every call,
+        since installing closures or resetting the calendars replaces it.
+
+        Returns:
+            the installed court calendar
+        """
+
+        court_calendar: CourtCalendar | None = get_court_calendar()
+        if court_calendar is not None:
+            return court_calendar
+
+        # a finished build has since been discarded, so build the calendar again
+        if self._calendar_future is None or self._calendar_future.done():
+            loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+            self._calendar_future = asyncio.ensure_future(loop.run_in_executor(self.executor,
+                                                                               ensure_court_calendar))
+        try:
+            return await asyncio.shield(self._calendar_future)
+        except BaseException:
+            # let the next call retry a failed build
+            if self._calendar_future.done():
+                self._calendar_future = None
+            raise
+
+    async def deadline(self,
+                       event_date: datetime.date,
+                       number_of_days: int,
+                       after_event: bool = True,
+                       is_quebec: bool = False) -> datetime.date:
+        """
+        Compute the deadline for a given event date and number of days.
+
+        Args:
+            event_date: The date of the event.
+            number_of_days: The number of days between the event date and deadline.
+            after_event: If True, the deadline is after the event date; otherwise, it's before.
+            is_quebec: If True, the deadline is calculated according to Quebec rules.
+
+        Returns:
+            The computed deadline date.
+
+        Raises:
+            ValueError: If number_of_days is negative.
+        """
+
+        key: RequestKey = (event_date, number_of_days, after_event, is_quebec)
+
+        deadline_date: datetime.date | None = self.cache.get(key)
+        if deadline_date is not None:
+            self.stats.hits += 1
+            return deadline_date
+
+        task: asyncio.Task[datetime.date] | None = self._in_flight.get(key)
+        if task is None:
+            self.stats.misses += 1
+            task = asyncio.ensure_future(self._compute_and_cache(key))
+            task.add_done_callback(partial(self._forget, key))
+            self._in_flight[key] = task
+        else:
+            self.stats.coalesced += 1
+
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            waiters: int = self._waiters.pop(task) - 1
+            if waiters > 0:
+                self._waiters[task] = waiters
+            elif not task.done():
+                # no request is waiting for the computation any more
+                task.cancel()
+                self._forget(key, task)
+
+    def _forget(self, key: RequestKey, task: asyncio.Task[datetime.date]) -> None:
+        # a later request may have started a new computation for the same key
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+
+    async def _compute_and_cache(self, key: RequestKey) -> datetime.date:
+        generation: int = closure_generation()
+        deadline_date: datetime.date = await self._compute(key)
+        self.cache.put(key, deadline_date, generation)
+
+        return deadline_date
+
+    async def _compute(self, key: RequestKey) -> datetime.date:
+        court_calendar: CourtCalendar = await self.warm_up()
+
+        # a deadline found in the calendar only takes a few binary searches
+        number_of_days: int = key[1]
+        if number_of_days >= 0 and not instrumentation.enabled:
+            deadline_date: datetime.date | None = deadline_by_calendar(court_calendar, *key)
+            if deadline_date is not None:
+                return deadline_date
+
+        # the deadline may run past the calendar and have to be found by stepping one day at a time
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, deadline, *key)
+
+    async def dl(self, event_date_str: str, signed_number_of_days: int, is_quebec: bool = False) -> str:
+        """
+        Compute the deadline for a given event date and number of days.
+
+        Args:
+            event_date_str: The date of the event in YYYY-MM-DD format.
+            signed_number_of_days: The number of days between the event date and deadline.
+            is_quebec: If True, the deadline is calculated according to Quebec rules.
+
+        Returns:
+            The computed deadline date in YYYY-MM-DD format.
+        """
+
+        event_date: datetime.date = parse_date(event_date_str)
+
+        # if the number of days is positive, the deadline is after the event date, else it is before
+        deadline_date: datetime.date = await self.deadline(event_date,
+                                                           abs(signed_number_of_days),
+                                                           signed_number_of_days > 0,
+                                                           is_quebec)
+
+        return format_date(deadline_date)
@@ -0,0 +1,57 @@
+import pytest
+import datetime
+from deadlines.due_dates import deadline
+from deadlines.examples import guideline_examples
+
+np = pytest.importorskip("numpy")
+
+from deadlines.batch import deadlines_batch
+
+
+def test_deadlines_batch_guideline_examples():
+    event_dates: list[datetime.date] = [example.event_date for example in guideline_examples]
+    numbers_of_days: list[int] = [example.number_of_days for example in guideline_examples]
+    after_event: list[bool] = [example.after_event for example in guideline_examples]
+
+    deadline_dates = deadlines_batch(event_dates, numbers_of_days, after_event)
+
+    assert deadline_dates.dtype == np.dtype('datetime64[D]')
+    assert deadline_dates.tolist() == [example.deadline_date for example in guideline_examples]
+
+
+@pytest.mark.parametrize("after_event", [True, False])
+@pytest.mark.parametrize("is_quebec", [False, True])
+def test_deadlines_batch_matches_deadline(after_event, is_quebec):
+    """
+    Test that the batch deadlines match the scalar deadlines for every event date in 2012.
+    """
+    event_dates = np.arange('2012-01-01', '2013-01-01', dtype='datetime64[D]')
+    for number_of_days in [0, 1, 4, 6, 7, 10, 30, 365]:
+        deadline_dates = deadlines_batch(event_dates, number_of_days, after_event, is_quebec)
+        expected_dates: list[datetime.date] = [
+            deadline(event_date, number_of_days, after_event, is_quebec) for event_date in event_dates.tolist()
+        ]
+        assert deadline_dates.tolist() == expected_dates
+
+
+def test_deadlines_batch_outside_calendar():
+    """
+    Test that rows that are not covered by the calendar are still computed.
+    """
+    event_dates: list[str] = ['1990-06-11', '2012-06-11', '2060-06-11']
+    deadline_dates = deadlines_batch(event_dates, [30, 30, 30], [True, True, False])
+    assert deadline_dates.tolist() == [
+        deadline(datetime.date(1990, 6, 11), 30),
+        deadline(datetime.date(2012, 6, 11), 30),
+        deadline(datetime.date(2060, 6, 11), 30, after_event=False),
+    ]
+
+
+def test_deadlines_batch_negative_days():
+    with pytest.raises(ValueError):
+        deadlines_batch(['2012-06-11'], [-1])
+
+
+def test_deadlines_batch_missing_date():
+    with pytest.raises(ValueError):
+        deadlines_batch(np.array(['2012-06-11', 'NaT'], dtype='datetime64[D]'), 30)
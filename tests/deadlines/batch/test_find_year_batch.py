@@ -0,0 +1,36 @@
+import pytest
+from deadlines.dates import find_year
+
+np = pytest.importorskip("numpy")
+
+from deadlines.batch import find_year_batch
+
+
+def test_find_year_batch_matches_find_year():
+    """
+    Test that the batch form gives the same years as find_year, including February 29 and 1900.
+    """
+    rng = np.random.default_rng(0)
+    months = rng.integers(1, 13, 5000)
+    days = rng.integers(1, 29, 5000)
+    days[:500] = 29
+    months[:500] = 2
+    weekdays = rng.integers(0, 7, 5000)
+    max_years = rng.integers(1850, 2150, 5000)
+
+    years = find_year_batch(months, days, weekdays, max_years)
+    assert years.tolist() == [find_year(*row) for row in zip(months.tolist(), days.tolist(),
+                                                             weekdays.tolist(), max_years.tolist())]
+
+
+def test_find_year_batch_broadcasts():
+    assert find_year_batch(3, 14, [4, 3], 2025).tolist() == [2025, 2024]
+
+
+def test_find_year_batch_invalid():
+    with pytest.raises(ValueError):
+        find_year_batch([2, 2], [28, 30], 0, 2024)
+    with pytest.raises(ValueError):
+        find_year_batch(3, 14, [7, 0], 2025)
+    with pytest.raises(ValueError):
+        find_year_batch(3, 14, -1, 2025)
@@ -0,0 +1,96 @@
+import pytest
+import datetime
+import os
+from deadlines.calendar_cache import CACHE_DIR_ENV, cache_path, clear_cache, load_court_calendar
+from deadlines.calendar_cache import load_holiday_tables, COURT_CALENDAR_PREFIX, HOLIDAY_TABLES_PREFIX
+from deadlines.canadian_holidays import calc_holidays
+from deadlines.court_calendar import CourtCalendar, ensure_court_calendar
+from deadlines.dates import get_court_calendar, set_court_calendar
+
+
+def test_load_court_calendar(tmp_path):
+    """
+    Test that a cached calendar is written once and then read back unchanged.
+    """
+    cache_dir: str = str(tmp_path)
+    path: str = cache_path(cache_dir, COURT_CALENDAR_PREFIX, 2012, 2013, ".bin")
+
+    court_calendar: CourtCalendar = load_court_calendar(2012, 2013, cache_dir)
+    modified_time: float = os.path.getmtime(path)
+    cached_calendar: CourtCalendar = load_court_calendar(2012, 2013, cache_dir)
+
+    assert os.path.getmtime(path) == modified_time
+    assert bytes(cached_calendar.flags) == bytes(CourtCalendar(2012, 2013).flags)
+    assert list(cached_calendar.open_counts) == list(court_calendar.open_counts)
+    with pytest.raises(TypeError):
+        cached_calendar.flags[0] = 0
+
+
+def test_load_court_calendar_rebuilds_truncated_file(tmp_path):
+    cache_dir: str = str(tmp_path)
+    path: str = cache_path(cache_dir, COURT_CALENDAR_PREFIX, 2012, 2012, ".bin")
+    with open(path, "wb") as file:
+        file.write(b"\0" * 10)
+
+    court_calendar: CourtCalendar = load_court_calendar(2012, 2012, cache_dir)
+
+    assert len(court_calendar) == 366
+
+
+def test_cache_key_includes_rules_version(tmp_path, monkeypatch):
+    """
+    Test that changing the rules version changes the cache file.
+    """
+    cache_dir: str = str(tmp_path)
+    path: str = cache_path(cache_dir, COURT_CALENDAR_PREFIX, 2012, 2012, ".bin")
+    monkeypatch.setattr("deadlines.calendar_cache.RULES_VERSION", 0)
+
+    assert cache_path(cache_dir, COURT_CALENDAR_PREFIX, 2012, 2012, ".bin") != path
+
+
+def test_load_holiday_tables(tmp_path):
+    cache_dir: str = str(tmp_path)
+    load_holiday_tables(2012, 2013, cache_dir)
+    holiday_tables = load_holiday_tables(2012, 2013, cache_dir)
+
+    assert holiday_tables[(2012, True)] == calc_holidays(2012, True)
+    assert holiday_tables[(2013, False)] == calc_holidays(2013, False)
+    assert clear_cache(cache_dir) == 1
+    assert clear_cache(cache_dir) == 0
+
+
+def test_load_holiday_tables_rebuilds_damaged_file(tmp_path):
+    cache_dir: str = str(tmp_path)
+    path: str = cache_path(cache_dir, HOLIDAY_TABLES_PREFIX, 2012, 2012, ".json")
+    with open(path, "w") as file:
+        file.write("[{")
+
+    assert load_holiday_tables(2012, 2012, cache_dir)[(2012, False)] == calc_holidays(2012)
+
+
+def test_load_court_calendar_loads_holidays(tmp_path):
+    """
+    Test that loading a cached calendar fills the holiday cache without recomputing the holidays.
+    """
+    cache_dir: str = str(tmp_path)
+    load_court_calendar(2012, 2013, cache_dir)
+    calc_holidays.cache_clear()
+
+    load_court_calendar(2012, 2013, cache_dir)
+    holidays: dict[str, datetime.date] = calc_holidays(2013, jurisdiction="QC")
+
+    assert holidays == calc_holidays.function(2013, True)
+    assert calc_holidays.cache_stats().misses == 0
+    assert calc_holidays.cache_stats().size == 4
+
+
+def test_ensure_court_calendar_uses_cache(tmp_path, monkeypatch):
+    installed_calendar: CourtCalendar | None = get_court_calendar()
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path))
+    set_court_calendar(None)
+    try:
+        court_calendar: CourtCalendar = ensure_court_calendar()
+        assert court_calendar.is_court_open(datetime.date(2012, 10, 9))
+        assert clear_cache() == 2
+    finally:
+        set_court_calendar(installed_calendar)
@@ -0,0 +1,71 @@
+import pytest
+import datetime
+from deadlines.canadian_holidays import register_jurisdiction
+from deadlines.calendar_file import encode_calendar, decode_calendar, open_calendar_file, write_calendar_file
+from deadlines.court_calendar import CourtCalendar
+from deadlines.dates import get_court_calendar, is_court_open, set_court_calendar
+from deadlines.due_dates import deadline
+from deadlines.examples import guideline_examples
+
+court_calendar: CourtCalendar = CourtCalendar(2011, 2022)
+
+
+def test_calendar_file_round_trip(tmp_path):
+    path: str = str(tmp_path / "calendar.bin")
+    write_calendar_file(path, court_calendar)
+
+    mapped_calendar: CourtCalendar = open_calendar_file(path)
+
+    assert (mapped_calendar.min_year, mapped_calendar.max_year) == (2011, 2022)
+    assert mapped_calendar.jurisdiction == "CA"
+    assert bytes(mapped_calendar.flags) == bytes(court_calendar.flags)
+    assert list(mapped_calendar.non_recess_counts) == list(court_calendar.non_recess_counts)
+    assert list(mapped_calendar.open_counts) == list(court_calendar.open_counts)
+    assert list(mapped_calendar.quebec_open_counts) == list(court_calendar.quebec_open_counts)
+
+
+def test_calendar_file_keeps_jurisdiction():
+    ontario_calendar: CourtCalendar = CourtCalendar(2024, 2024, jurisdiction="ON")
+    decoded_calendar: CourtCalendar = decode_calendar(memoryview(encode_calendar(ontario_calendar)))
+
+    assert decoded_calendar.jurisdiction == "ON"
+    assert bytes(decoded_calendar.flags) == bytes(ontario_calendar.flags)
+    assert not decoded_calendar.is_court_open(datetime.date(2024, 2, 19))
+
+
+def test_calendar_file_rejects_long_jurisdiction():
+    register_jurisdiction("ON-TORONTO", [], "ON")
+    toronto_calendar: CourtCalendar = CourtCalendar(2024, 2024, jurisdiction="ON-TORONTO")
+
+    with pytest.raises(ValueError):
+        encode_calendar(toronto_calendar)
+
+
+@pytest.mark.parametrize("example", guideline_examples)
+def test_deadline_with_mapped_calendar(tmp_path, example):
+    """
+    Test that the date functions and deadline read an installed memory-mapped calendar.
+    """
+    path: str = str(tmp_path / "calendar.bin")
+    write_calendar_file(path, court_calendar)
+    installed_calendar: CourtCalendar | None = get_court_calendar()
+    set_court_calendar(open_calendar_file(path))
+    try:
+        assert is_court_open(example.deadline_date)
+        assert deadline(example.event_date, example.number_of_days, example.after_event) == example.deadline_date
+    finally:
+        set_court_calendar(installed_calendar)
+
+
+def test_decode_calendar_rejects_bad_files(monkeypatch):
+    data: bytes = encode_calendar(court_calendar)
+
+    with pytest.raises(ValueError):
+        decode_calendar(memoryview(b"XXXX" + data[4:]))
+
+    with pytest.raises(ValueError):
+        decode_calendar(memoryview(data[:-1]))
+
+    monkeypatch.setattr("deadlines.calendar_file.RULES_VERSION", 0)
+    with pytest.raises(ValueError):
+        decode_calendar(memoryview(data))
@@ -1,6 +1,8 @@
+import pytest
 import datetime
 from deadlines.enums import Month
 from deadlines.canadian_holidays import calc_good_friday, calc_easter_sunday, calc_easter_monday
+from deadlines.canadian_holidays import GOOD_FRIDAY, calc_holidays_package_date
 
 def test_calc_good_friday():
     good_friday: datetime.date = calc_good_friday(2012)
@@ -13,3 +15,24 @@ def test_calc_easter_sunday():
 def test_calc_easter_monday():
     easter_monday: datetime.date = calc_easter_monday(2012)
     assert easter_monday == datetime.date(2012, Month.APRIL, 9)
+
+@pytest.mark.parametrize(
+    "year, expected",
+    [
+        (1818, datetime.date(1818, Month.MARCH, 22)),  # earliest possible Easter
+        (1943, datetime.date(1943, Month.APRIL, 25)),  # latest possible Easter
+        (2000, datetime.date(2000, Month.APRIL, 23)),
+        (2024, datetime.date(2024, Month.MARCH, 31)),
+        (2025, datetime.date(2025, Month.APRIL, 20)),
+    ]
+)
+def test_calc_easter_sunday_known_dates(year, expected):
+    assert calc_easter_sunday(year) == expected
+
+def test_calc_good_friday_matches_holidays_package():
+    """
+    Cross-check the computus against the `holidays` package, if it is installed.
+    """
+    pytest.importorskip("holidays")
+    for year in range(1900, 2101):
+        assert calc_good_friday(year) == calc_holidays_package_date(year, GOOD_FRIDAY)
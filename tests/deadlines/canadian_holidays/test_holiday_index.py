@@ -0,0 +1,46 @@
+import pytest
+import datetime
+from deadlines.canadian_holidays import (CIVIC_HOLIDAY, CHRISTMAS_DAY, BOXING_DAY, SAINT_JEAN_BAPTISTE_DAY,
+                                         HolidayIndex, calc_holidays, holiday_name, holidays_between)
+
+
+@pytest.mark.parametrize("is_quebec", [False, True])
+def test_index_matches_calc_holidays(is_quebec):
+    index: HolidayIndex = HolidayIndex(2010, 2014, is_quebec)
+    for year in range(2010, 2015):
+        for name, holiday_date in calc_holidays(year, is_quebec).items():
+            assert index.holiday_name(holiday_date) == name
+    assert len(index.ordinals) == sum(len(calc_holidays(year, is_quebec)) for year in range(2010, 2015))
+
+
+@pytest.mark.parametrize(
+    "date, is_quebec, expected_name",
+    [
+        (datetime.date(2024, 6, 24), True, SAINT_JEAN_BAPTISTE_DAY),
+        (datetime.date(2024, 6, 24), False, None),
+        (datetime.date(2024, 8, 5), False, CIVIC_HOLIDAY),
+        (datetime.date(2024, 8, 5), True, None),
+        (datetime.date(2024, 8, 6), False, None),
+        (datetime.date(1990, 12, 25), False, CHRISTMAS_DAY),
+        (datetime.date(2100, 12, 26), True, BOXING_DAY),
+    ]
+)
+def test_holiday_name(date, is_quebec, expected_name):
+    assert holiday_name(date, is_quebec) == expected_name
+
+
+def test_holidays_between():
+    assert holidays_between(datetime.date(2024, 12, 20), datetime.date(2025, 1, 1)) == [
+        (datetime.date(2024, 12, 25), CHRISTMAS_DAY),
+        (datetime.date(2024, 12, 26), BOXING_DAY),
+        (datetime.date(2025, 1, 1), "New Year's Day"),
+    ]
+    assert holidays_between(datetime.date(2024, 12, 27), datetime.date(2024, 12, 31)) == []
+    assert holidays_between(datetime.date(2025, 1, 1), datetime.date(2024, 1, 1)) == []
+
+
+def test_holidays_between_outside_default_range():
+    holidays: list[tuple[datetime.date, str]] = holidays_between(datetime.date(1999, 12, 1), datetime.date(2000, 1, 31))
+    assert [holiday_date for holiday_date, _ in holidays] == [datetime.date(1999, 12, 25),
+                                                              datetime.date(1999, 12, 26),
+                                                              datetime.date(2000, 1, 1)]
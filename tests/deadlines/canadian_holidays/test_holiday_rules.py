@@ -0,0 +1,62 @@
+import pytest
+import datetime
+from deadlines.canadian_holidays import (BC_DAY, CIVIC_HOLIDAY, FAMILY_DAY, CANADA_DAY, calc_holidays,
+                                         jurisdiction_rules, register_jurisdiction, resolve_jurisdiction,
+                                         rules_fingerprint)
+from deadlines.holiday_rules import EasterRelative, FixedDate, InEffect, LastWeekdayBefore, NthWeekday, ObservedIfSunday
+from deadlines.enums import Month, Weekday
+
+
+@pytest.mark.parametrize(
+    "rule, year, expected_date",
+    [
+        (FixedDate(Month.NOVEMBER, 11), 2024, datetime.date(2024, 11, 11)),
+        (NthWeekday(Month.OCTOBER, Weekday.MONDAY, 2), 2024, datetime.date(2024, 10, 14)),
+        (NthWeekday(Month.SEPTEMBER, Weekday.MONDAY, 1), 2025, datetime.date(2025, 9, 1)),
+        (LastWeekdayBefore(Month.MAY, 25, Weekday.MONDAY), 2024, datetime.date(2024, 5, 20)),
+        (LastWeekdayBefore(Month.MAY, 25, Weekday.MONDAY), 2026, datetime.date(2026, 5, 18)),
+        (EasterRelative(-2), 2024, datetime.date(2024, 3, 29)),
+        (ObservedIfSunday(FixedDate(Month.JULY, 1)), 2018, datetime.date(2018, 7, 2)),
+        (ObservedIfSunday(FixedDate(Month.JULY, 1)), 2019, datetime.date(2019, 7, 1)),
+        (InEffect(FixedDate(Month.JULY, 1), 2000, 2010), 2011, None),
+    ]
+)
+def test_rule_dates(rule, year, expected_date):
+    assert rule.date(year) == expected_date
+
+
+def test_jurisdictions_follow_is_quebec():
+    assert resolve_jurisdiction() == "CA"
+    assert resolve_jurisdiction(is_quebec=True) == "QC"
+    assert resolve_jurisdiction("ON", is_quebec=True) == "ON"
+    assert calc_holidays(2024, True) == calc_holidays(2024, jurisdiction="QC")
+    with pytest.raises(ValueError):
+        resolve_jurisdiction("XX")
+
+
+@pytest.mark.parametrize(
+    "jurisdiction, year, expected_date",
+    [
+        ("ON", 2007, None),
+        ("ON", 2024, datetime.date(2024, 2, 19)),
+        ("BC", 2015, datetime.date(2015, 2, 9)),
+        ("BC", 2019, datetime.date(2019, 2, 18)),
+        ("AB", 1995, datetime.date(1995, 2, 20)),
+        ("CA", 2024, None),
+    ]
+)
+def test_family_day(jurisdiction, year, expected_date):
+    assert calc_holidays(year, jurisdiction=jurisdiction).get(FAMILY_DAY) == expected_date
+
+
+def test_register_municipal_jurisdiction():
+    register_jurisdiction("BC-TEST", [(CIVIC_HOLIDAY, FixedDate(Month.MARCH, 3))], "BC", excluded_names=[BC_DAY])
+    holidays: dict[str, datetime.date] = calc_holidays(2024, jurisdiction="BC-TEST")
+    assert holidays[CIVIC_HOLIDAY] == datetime.date(2024, 3, 3)
+    assert holidays[CANADA_DAY] == datetime.date(2024, 7, 1)
+    assert BC_DAY not in holidays
+    assert "BC-TEST" in rules_fingerprint("BC-TEST")
+    assert len(jurisdiction_rules("BC-TEST")) == len(jurisdiction_rules("BC"))
+
+    with pytest.raises(ValueError):
+        register_jurisdiction("XX-TEST", [], "XX")
@@ -0,0 +1,127 @@
+import pytest
+import asyncio
+import datetime
+from deadlines.calendar_file import open_calendar_file, write_calendar_file
+from deadlines.closures import Closure, add_closure, affected_deadlines, install_closures, remove_closure
+from deadlines.court_calendar import CourtCalendar, ensure_court_calendar, ensure_jurisdiction_calendar
+from deadlines.deadline_table import DeadlineTable
+from deadlines.dates import get_court_calendar, is_court_open, parse_date, set_court_calendar
+from deadlines.due_dates import deadline
+from deadlines.enums import ClosureKind
+from deadlines.service import DeadlineService
+
+MOURNING: Closure = Closure(parse_date("2024-02-20"), parse_date("2024-02-20"), ClosureKind.CLOSURE, "mourning")
+
+
+@pytest.fixture(autouse=True)
+def no_closures():
+    install_closures(None)
+    yield
+    install_closures(None)
+
+
+def assert_same_calendar(court_calendar: CourtCalendar, expected: CourtCalendar):
+    assert bytes(court_calendar.flags) == bytes(expected.flags)
+    assert list(court_calendar.non_recess_counts) == list(expected.non_recess_counts)
+    assert list(court_calendar.open_counts) == list(expected.open_counts)
+    assert list(court_calendar.quebec_open_counts) == list(expected.quebec_open_counts)
+
+
+@pytest.mark.parametrize("closure", [
+    MOURNING,
+    Closure(parse_date("2024-06-28"), parse_date("2024-07-03"), ClosureKind.RECESS, "extended recess"),
+])
+def test_patch_matches_rebuild(closure):
+    """
+    Test that patching the calendars gives the same flags and prefix sums as rebuilding them.
+    """
+    court_calendar: CourtCalendar = ensure_court_calendar()
+    ontario_calendar, _ = ensure_jurisdiction_calendar("ON")
+
+    changed_dates: list[datetime.date] = add_closure(closure)
+    assert changed_dates
+    assert all(closure.start_date <= date <= closure.end_date for date in changed_dates)
+    assert get_court_calendar() is court_calendar
+    assert_same_calendar(court_calendar, CourtCalendar())
+    assert_same_calendar(ontario_calendar, CourtCalendar(jurisdiction="ON"))
+
+    assert remove_closure(closure) == changed_dates
+    assert_same_calendar(court_calendar, CourtCalendar())
+
+
+def test_remove_part_of_closure():
+    """
+    Test that removing some days of a closure keeps the others.
+    """
+    ensure_court_calendar()
+    add_closure(Closure(parse_date("2024-02-19"), parse_date("2024-02-23")))
+    assert remove_closure(Closure(parse_date("2024-02-20"), parse_date("2024-02-21"))) == \
+           [parse_date("2024-02-20"), parse_date("2024-02-21")]
+    assert [is_court_open(parse_date(f"2024-02-{day}")) for day in range(19, 24)] == \
+           [False, True, True, False, False]
+
+
+def test_patch_mapped_calendar(tmp_path):
+    """
+    Test that a calendar mapped from a file is copied before it is patched, leaving the file unchanged.
+    """
+    path: str = str(tmp_path / "calendar.bin")
+    write_calendar_file(path, CourtCalendar())
+    court_calendar: CourtCalendar = open_calendar_file(path)
+    previous_calendar: CourtCalendar | None = get_court_calendar()
+    set_court_calendar(court_calendar)
+    try:
+        add_closure(MOURNING)
+        assert not court_calendar.is_court_open(MOURNING.start_date)
+        assert open_calendar_file(path).is_court_open(MOURNING.start_date)
+    finally:
+        set_court_calendar(previous_calendar)
+
+
+@pytest.mark.parametrize("number_of_days", [0, 4, 10, 30])
+@pytest.mark.parametrize("after_event", [True, False])
+def test_affected_deadlines(number_of_days, after_event):
+    """
+    Test that the affected deadlines are exactly those that change when every deadline is recomputed.
+    """
+    requests: list[tuple[datetime.date, int, bool, bool]] = [
+        (datetime.date(2024, 1, 1) + datetime.timedelta(days=offset), number_of_days, after_event, False)
+        for offset in range(120)
+    ]
+    deadline_dates: list[datetime.date] = [deadline(*request) for request in requests]
+
+    add_closure(MOURNING)
+    new_deadline_dates: list[datetime.date] = [deadline(*request) for request in requests]
+    expected: dict[int, datetime.date] = {index: new_deadline_date
+                                          for index, (deadline_date, new_deadline_date)
+                                          in enumerate(zip(deadline_dates, new_deadline_dates))
+                                          if deadline_date != new_deadline_date}
+    assert affected_deadlines(requests, deadline_dates, MOURNING.start_date, MOURNING.end_date) == expected
+    if number_of_days < 7:
+        assert expected
+
+
+def test_closures_invalidate_cached_deadlines():
+    """
+    Test that the service cache and a deadline table do not answer with deadlines from before a closure changed.
+    """
+    event_date: datetime.date = parse_date("2024-02-19")
+    ensure_court_calendar()
+    service: DeadlineService = DeadlineService()
+    table: DeadlineTable = DeadlineTable(2024, 2024, 10)
+
+    async def service_deadline() -> datetime.date:
+        return await service.deadline(event_date, 1)
+
+    assert asyncio.run(service_deadline()) == parse_date("2024-02-20")
+    assert table.deadline(event_date, 1) == parse_date("2024-02-20")
+
+    add_closure(MOURNING)
+    assert asyncio.run(service_deadline()) == parse_date("2024-02-21")
+    assert table.deadline_ordinal(event_date.toordinal(), 1) is None
+    assert table.deadline(event_date, 1) == parse_date("2024-02-21")
+
+    # the table answers again once the closures match those it was computed with
+    remove_closure(MOURNING)
+    assert table.deadline_ordinal(event_date.toordinal(), 1) == parse_date("2024-02-20").toordinal()
+    assert asyncio.run(service_deadline()) == parse_date("2024-02-20")
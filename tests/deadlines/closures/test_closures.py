@@ -0,0 +1,119 @@
+import pytest
+import datetime
+from deadlines.closures import Closure, ClosureIndex, install_closures, load_closures
+from deadlines.dates import is_court_open, is_recess, parse_date
+from deadlines.due_dates import deadline, deadline_by_steps, dl
+from deadlines.enums import ClosureKind, DayReason
+from deadlines.explanation import explain_deadline
+
+
+@pytest.fixture
+def closures():
+    """
+    Install a storm closure and an additional recess, inside and outside the court calendar.
+    """
+    closure_index: ClosureIndex = ClosureIndex([
+        Closure(parse_date("2024-02-20"), parse_date("2024-02-20"), ClosureKind.CLOSURE, "storm"),
+        Closure(parse_date("2024-03-04"), parse_date("2024-03-08"), ClosureKind.RECESS, "March break"),
+        Closure(parse_date("2070-02-19"), parse_date("2070-02-21"), ClosureKind.CLOSURE, "outage"),
+    ])
+    install_closures(closure_index)
+    yield closure_index
+    install_closures(None)
+
+
+def test_merge():
+    """
+    Test that overlapping and adjacent closures of the same kind are merged.
+    """
+    closure_index: ClosureIndex = ClosureIndex([
+        Closure(parse_date("2024-01-10"), parse_date("2024-01-12"), reason="storm"),
+        Closure(parse_date("2024-01-03"), parse_date("2024-01-04"), reason="outage"),
+        Closure(parse_date("2024-01-13"), parse_date("2024-01-13"), reason="storm"),
+        Closure(parse_date("2024-01-11"), parse_date("2024-01-15"), reason="flood"),
+        Closure(parse_date("2024-01-12"), parse_date("2024-01-12"), ClosureKind.RECESS),
+    ])
+    assert len(closure_index) == 3
+    assert closure_index.closure(parse_date("2024-01-14")) == \
+           Closure(parse_date("2024-01-10"), parse_date("2024-01-15"), ClosureKind.CLOSURE, "storm; flood")
+    assert closure_index.closure(parse_date("2024-01-12")).kind is ClosureKind.RECESS
+    assert closure_index.closure(parse_date("2024-01-05")) is None
+    assert closure_index.closure(parse_date("2024-01-02")) is None
+    assert closure_index.is_closure(parse_date("2024-01-03"))
+    assert not closure_index.is_recess(parse_date("2024-01-03"))
+
+
+def test_closures_between():
+    """
+    Test that the closures overlapping a range are found in date order.
+    """
+    closure_index: ClosureIndex = ClosureIndex([
+        Closure(parse_date("2024-01-03"), parse_date("2024-01-04")),
+        Closure(parse_date("2024-01-10"), parse_date("2024-01-12")),
+        Closure(parse_date("2024-01-08"), parse_date("2024-01-08"), ClosureKind.RECESS),
+    ])
+    assert [closure.start_date for closure in closure_index.closures_between(parse_date("2024-01-04"),
+                                                                             parse_date("2024-01-10"))] == \
+           [parse_date("2024-01-03"), parse_date("2024-01-08"), parse_date("2024-01-10")]
+    assert closure_index.closures_between(parse_date("2024-01-05"), parse_date("2024-01-07")) == []
+
+
+def test_invalid_closure():
+    with pytest.raises(ValueError):
+        ClosureIndex([Closure(parse_date("2024-01-04"), parse_date("2024-01-03"))])
+
+
+def test_load_closures(tmp_path):
+    """
+    Test that closures are loaded from a CSV file, with the end date and kind optional.
+    """
+    path = tmp_path / "closures.csv"
+    path.write_text("start_date,end_date,kind,reason\n"
+                    "2024-02-20,,,storm\n"
+                    "2024-03-04,2024-03-08,Recess,March break\n")
+    closure_index: ClosureIndex = load_closures(str(path))
+    assert closure_index.closures_between(parse_date("2024-01-01"), parse_date("2024-12-31")) == [
+        Closure(parse_date("2024-02-20"), parse_date("2024-02-20"), ClosureKind.CLOSURE, "storm"),
+        Closure(parse_date("2024-03-04"), parse_date("2024-03-08"), ClosureKind.RECESS, "March break"),
+    ]
+
+
+def test_installed_closures(closures):
+    """
+    Test that installed closures close the court and change the deadlines.
+    """
+    assert not is_court_open(parse_date("2024-02-20"))
+    assert not is_court_open(parse_date("2024-02-20"), jurisdiction="ON")
+    assert is_recess(parse_date("2024-03-06"))
+    assert not is_court_open(parse_date("2070-02-20"))
+
+    assert dl("2024-02-15", 4) == "2024-02-22"
+    assert dl("2024-03-01", 10) == "2024-03-18"
+
+    segments = explain_deadline(parse_date("2024-02-15"), 4).skipped_segments()
+    assert [segment.reason for segment in segments] == [DayReason.WEEKEND, DayReason.CLOSURE]
+
+
+@pytest.mark.parametrize("year", [2024, 2070])
+@pytest.mark.parametrize("number_of_days", [4, 10])
+def test_calendar_matches_steps(closures, year, number_of_days):
+    """
+    Test that the calendar and stepping agree on deadlines around the closures.
+    """
+    event_date: datetime.date = datetime.date(year, 2, 1)
+    while event_date.month < 4:
+        for after_event in [True, False]:
+            assert deadline(event_date, number_of_days, after_event) == \
+                   deadline_by_steps(event_date, number_of_days, after_event)
+        event_date += datetime.timedelta(days=1)
+
+
+def test_uninstalled_closures():
+    """
+    Test that removing the closures restores the rules.
+    """
+    install_closures(ClosureIndex([Closure(parse_date("2024-02-20"), parse_date("2024-02-20"))]))
+    assert dl("2024-02-15", 4) == "2024-02-22"
+    install_closures(None)
+    assert is_court_open(parse_date("2024-02-20"))
+    assert dl("2024-02-15", 4) == "2024-02-21"
@@ -0,0 +1,32 @@
+import pytest
+from collections.abc import Callable
+from deadlines import dates
+from deadlines.court_calendar import CourtCalendar
+
+
+@pytest.fixture(scope="session")
+def small_calendar() -> CourtCalendar:
+    """
+    A court calendar for 2011 to 2014, which is quick to build and covers most of the test dates.
+    """
+    return CourtCalendar(2011, 2014)
+
+
+@pytest.fixture
+def install_calendar(monkeypatch) -> Callable[[CourtCalendar | None], None]:
+    """
+    Install court calendars during a test, restoring the previously installed calendar afterwards.
+    """
+    def install(court_calendar: CourtCalendar | None) -> None:
+        monkeypatch.setattr(dates, "_court_calendar", court_calendar)
+
+    return install
+
+
+@pytest.fixture
+def installed_calendar(small_calendar, install_calendar) -> CourtCalendar:
+    """
+    Install the small court calendar for the duration of a test.
+    """
+    install_calendar(small_calendar)
+    return small_calendar
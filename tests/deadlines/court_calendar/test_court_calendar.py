@@ -0,0 +1,64 @@
+import pytest
+import datetime
+from deadlines.court_calendar import CourtCalendar
+from deadlines.dates import add_days, get_court_calendar, is_court_open, is_holiday, is_recess, is_weekend
+from deadlines.dates import set_court_calendar
+from deadlines.enums import DayFlag
+
+court_calendar: CourtCalendar = CourtCalendar(2012, 2013)
+
+
+@pytest.mark.parametrize("is_quebec", [False, True])
+def test_court_calendar_matches_rules(is_quebec):
+    """
+    Test that every day in the calendar agrees with the rules.
+    """
+    date: datetime.date = datetime.date(2012, 1, 1)
+    while court_calendar.covers(date):
+        assert court_calendar.is_weekend(date) == is_weekend(date)
+        assert court_calendar.is_holiday(date, is_quebec) == is_holiday(date, is_quebec)
+        assert court_calendar.is_recess(date) == is_recess(date)
+        assert court_calendar.is_court_open(date, is_quebec) == is_court_open(date, is_quebec)
+        date = add_days(date, 1)
+
+
+@pytest.mark.parametrize(
+    "date, expected",
+    [
+        (datetime.date(2012, 6, 24), DayFlag.WEEKEND | DayFlag.QUEBEC_HOLIDAY),  # Saint-Jean-Baptiste Day
+        (datetime.date(2012, 8, 6), DayFlag.HOLIDAY | DayFlag.RECESS),  # Civic Holiday
+        (datetime.date(2012, 10, 8), DayFlag.HOLIDAY | DayFlag.QUEBEC_HOLIDAY),  # Thanksgiving Day
+        (datetime.date(2012, 10, 9), DayFlag.OPEN | DayFlag.QUEBEC_OPEN),
+    ]
+)
+def test_day_flags(date, expected):
+    assert court_calendar.day_flags(date) == expected
+
+
+def test_court_calendar_range():
+    assert len(court_calendar) == 366 + 365
+    assert not court_calendar.covers(datetime.date(2011, 12, 31))
+    with pytest.raises(ValueError):
+        court_calendar.is_court_open(datetime.date(2014, 1, 1))
+
+
+def test_set_court_calendar():
+    """
+    Test that the date functions consult an installed calendar.
+    """
+    date: datetime.date = datetime.date(2012, 10, 9)
+    patched_calendar: CourtCalendar = CourtCalendar(2012, 2012)
+    patched_calendar.flags[patched_calendar.index(date)] |= DayFlag.HOLIDAY
+    patched_calendar.flags[patched_calendar.index(date)] &= ~DayFlag.OPEN
+
+    set_court_calendar(patched_calendar)
+    try:
+        assert get_court_calendar() is patched_calendar
+        assert is_holiday(date)
+        assert not is_court_open(date)
+        assert is_court_open(date, is_quebec=True)
+    finally:
+        set_court_calendar(None)
+
+    assert not is_holiday(date)
+    assert is_court_open(date)
@@ -0,0 +1,80 @@
+import pytest
+import datetime
+from itertools import islice
+from deadlines.court_days import iter_holidays, iter_open_days, iter_recess_spans, nth_open_day
+from deadlines.dates import is_court_open, is_recess
+from deadlines.enums import Direction
+
+
+def step_open_days(date: datetime.date, direction: Direction, count: int, is_quebec: bool = False):
+    open_days: list[datetime.date] = []
+    while len(open_days) < count:
+        date += datetime.timedelta(days=direction)
+        if is_court_open(date, is_quebec):
+            open_days.append(date)
+    return open_days
+
+
+@pytest.mark.parametrize("date", [datetime.date(2012, 6, 20), datetime.date(2050, 11, 1),
+                                  datetime.date(2000, 2, 1), datetime.date(2070, 6, 1)])
+@pytest.mark.parametrize("direction", [Direction.FORWARD, Direction.BACKWARD])
+@pytest.mark.parametrize("is_quebec", [False, True])
+def test_iter_open_days(date, direction, is_quebec):
+    """
+    Test that the open days agree with stepping, inside, across and outside the court calendar.
+    """
+    assert list(islice(iter_open_days(date, direction, is_quebec), 200)) == \
+           step_open_days(date, direction, 200, is_quebec)
+
+
+@pytest.mark.parametrize("date", [datetime.date(2012, 6, 20), datetime.date(2050, 11, 1),
+                                  datetime.date(2000, 2, 1), datetime.date(2070, 6, 1)])
+@pytest.mark.parametrize("direction", [Direction.FORWARD, Direction.BACKWARD])
+def test_nth_open_day(date, direction):
+    """
+    Test that the nth open day is the nth day yielded by iter_open_days.
+    """
+    open_days: list[datetime.date] = step_open_days(date, direction, 300)
+    for n in [1, 2, 5, 30, 300]:
+        assert nth_open_day(date, n, direction) == open_days[n - 1]
+
+
+def test_nth_open_day_invalid():
+    with pytest.raises(ValueError):
+        nth_open_day(datetime.date(2012, 6, 20), 0)
+
+
+@pytest.mark.parametrize("date", [datetime.date(2012, 7, 15), datetime.date(2012, 3, 1), datetime.date(2050, 10, 1)])
+@pytest.mark.parametrize("direction", [Direction.FORWARD, Direction.BACKWARD])
+def test_iter_recess_spans(date, direction):
+    """
+    Test that the recess spans are maximal runs of recess days, nearest first.
+    """
+    spans: list[tuple[datetime.date, datetime.date]] = list(islice(iter_recess_spans(date, direction), 4))
+    for first_date, last_date in spans:
+        assert not is_recess(first_date - datetime.timedelta(days=1))
+        assert not is_recess(last_date + datetime.timedelta(days=1))
+        assert all(is_recess(first_date + datetime.timedelta(days=n)) for n in range((last_date - first_date).days + 1))
+
+    if direction == Direction.BACKWARD:
+        spans.reverse()
+    assert spans == sorted(spans)
+    assert all(earlier[1] < later[0] for earlier, later in zip(spans, spans[1:]))
+
+
+def test_iter_recess_spans_2012():
+    assert list(islice(iter_recess_spans(datetime.date(2012, 7, 15)), 2)) == [
+        (datetime.date(2012, 7, 1), datetime.date(2012, 8, 31)),
+        (datetime.date(2012, 12, 21), datetime.date(2013, 1, 7)),
+    ]
+    assert next(iter_recess_spans(datetime.date(2012, 7, 15), Direction.BACKWARD)) == \
+           (datetime.date(2012, 7, 1), datetime.date(2012, 8, 31))
+
+
+def test_iter_holidays():
+    assert list(islice(iter_holidays(datetime.date(2012, 12, 25)), 2)) == [
+        (datetime.date(2012, 12, 26), "Boxing Day"),
+        (datetime.date(2013, 1, 1), "New Year's Day"),
+    ]
+    assert [name for _, name in islice(iter_holidays(datetime.date(2012, 7, 1), Direction.BACKWARD, True), 1)] == \
+           ["Saint-Jean-Baptiste Day"]
@@ -1,6 +1,7 @@
 
 import pytest
 import calendar
+import datetime
 from deadlines.dates import Month, Weekday
 from deadlines.dates import find_year
 
@@ -17,3 +18,47 @@ from deadlines.dates import find_year
 def test_find_year(month, day, weekday, max_year, expected):
     year = find_year(month, day, weekday, max_year)
     assert year == expected
+
+
+@pytest.mark.parametrize(
+    "month, day, weekday, max_year, expected",
+    [
+        (Month.FEBRUARY, 29, Weekday.THURSDAY, 2024, 2024),
+        (Month.FEBRUARY, 29, Weekday.TUESDAY, 2023, 2000),
+        (Month.FEBRUARY, 29, Weekday.THURSDAY, 1910, 1872),
+        (Month.FEBRUARY, 29, Weekday.TUESDAY, 2130, 2124),
+        (Month.MARCH, 1, Weekday.THURSDAY, 1900, 1900),
+        (Month.JANUARY, 1, Weekday.MONDAY, 2100, 2091),
+    ]
+)
+def test_find_year_leap_years(month, day, weekday, max_year, expected):
+    """
+    Test February 29 and the centuries that are not leap years, where the 28-year cycle breaks.
+    """
+    assert find_year(month, day, weekday, max_year) == expected
+
+
+@pytest.mark.parametrize("month, day", [(Month.JANUARY, 1), (Month.FEBRUARY, 28), (Month.FEBRUARY, 29),
+                                        (Month.MARCH, 1), (Month.DECEMBER, 31)])
+def test_find_year_matches_search(month, day):
+    """
+    Test find_year against a search back from max_year over several centuries.
+    """
+    weekdays_by_year: dict[int, int] = {year: datetime.date(year, month, day).weekday()
+                                        for year in range(1700, 2300) if calendar.isleap(year) or day != 29}
+    for max_year in range(1760, 2300):
+        for weekday in range(7):
+            expected: int = max(year for year, year_weekday in weekdays_by_year.items()
+                                if year <= max_year and year_weekday == weekday)
+            assert find_year(month, day, weekday, max_year) == expected
+
+
+def test_find_year_invalid():
+    with pytest.raises(ValueError):
+        find_year(Month.FEBRUARY, 30, Weekday.MONDAY, 2024)
+    with pytest.raises(ValueError):
+        find_year(Month.JANUARY, 1, Weekday.SUNDAY, 1)
+    with pytest.raises(ValueError):
+        find_year(Month.MARCH, 14, 7, 2025)
+    with pytest.raises(ValueError):
+        find_year(Month.MARCH, 14, -1, 2025)
@@ -0,0 +1,21 @@
+import pytest
+import datetime
+from deadlines.dates import format_ordinal, format_ordinals, parse_ordinal, parse_ordinals
+
+
+def test_round_trip():
+    """
+    Test that parsing and formatting ordinals agrees with datetime.date, including from the caches.
+    """
+    dates: list[datetime.date] = [datetime.date(1899, 12, 31) + datetime.timedelta(days=n) for n in range(0, 80_000, 7)]
+    strings: list[str] = [date.isoformat() for date in dates]
+    ordinals: list[int] = [date.toordinal() for date in dates]
+    for _ in range(2):
+        assert parse_ordinals(strings) == ordinals
+        assert format_ordinals(ordinals) == strings
+
+
+def test_invalid():
+    with pytest.raises(ValueError):
+        parse_ordinal("2024-02-30")
+    assert format_ordinal(datetime.date(2024, 2, 29).toordinal()) == "2024-02-29"
@@ -0,0 +1,75 @@
+import pytest
+import datetime
+from array import array
+from deadlines.closures import Closure, add_closure, install_closures
+from deadlines.court_calendar import ensure_court_calendar
+from deadlines.deadline_table import (DeadlineTable, decode_deadline_table, encode_deadline_table, open_deadline_table,
+                                      verify_deadline_table, write_deadline_table)
+from deadlines.due_dates import deadline
+from deadlines.examples import guideline_examples
+
+table: DeadlineTable = DeadlineTable(2012, 2012, 30)
+
+
+def test_table_matches_deadline():
+    """
+    Test that every deadline in the table is the deadline computed by the rules.
+    """
+    for is_quebec in [False, True]:
+        for after_event in [True, False]:
+            for number_of_days in range(31):
+                event_date: datetime.date = datetime.date(2012, 1, 1)
+                while event_date.year == 2012:
+                    assert table.deadline_ordinal(event_date.toordinal(), number_of_days, after_event, is_quebec) == \
+                           deadline(event_date, number_of_days, after_event, is_quebec).toordinal()
+                    event_date += datetime.timedelta(days=1)
+
+
+@pytest.mark.parametrize("example", guideline_examples)
+def test_mapped_table(tmp_path, example):
+    """
+    Test that a table opened from a file answers in its window and computes the deadlines outside it.
+    """
+    path: str = str(tmp_path / "deadlines.bin")
+    write_deadline_table(path, table)
+    mapped_table: DeadlineTable = open_deadline_table(path)
+
+    assert mapped_table.deadline(example.event_date, example.number_of_days, example.after_event) == \
+           example.deadline_date
+    assert mapped_table.deadline_ordinal(datetime.date(2013, 1, 1).toordinal(), 4) is None
+    assert mapped_table.deadline(datetime.date(2013, 1, 1), 4) == deadline(datetime.date(2013, 1, 1), 4)
+    assert mapped_table.deadline(datetime.date(2012, 1, 1), 60) == deadline(datetime.date(2012, 1, 1), 60)
+
+
+def test_decode_rejects_bad_files():
+    data: bytes = encode_deadline_table(table)
+
+    with pytest.raises(ValueError):
+        decode_deadline_table(memoryview(b"XXXX" + data[4:]))
+
+    with pytest.raises(ValueError):
+        decode_deadline_table(memoryview(data[:-2]))
+
+    with pytest.raises(ValueError):
+        DeadlineTable(2012, 2012, 30, array("h", [0]))
+
+
+def test_golden_table():
+    """
+    Test that a table computed with other rules is rejected, unless it is opened as a golden table to verify.
+    """
+    data: bytes = encode_deadline_table(table)
+    assert verify_deadline_table(decode_deadline_table(memoryview(data))) == []
+
+    ensure_court_calendar()
+    add_closure(Closure(datetime.date(2012, 10, 9), datetime.date(2012, 10, 9)))
+    try:
+        with pytest.raises(ValueError):
+            decode_deadline_table(memoryview(data))
+
+        mismatches = verify_deadline_table(decode_deadline_table(memoryview(data), check_rules=False))
+        assert mismatches
+        assert (datetime.date(2012, 10, 5), 1, True, False, datetime.date(2012, 10, 9), datetime.date(2012, 10, 10)) \
+               in mismatches
+    finally:
+        install_closures(None)
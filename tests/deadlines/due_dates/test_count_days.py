@@ -0,0 +1,48 @@
+import pytest
+import datetime
+from deadlines.dates import is_court_open, is_recess
+from deadlines.due_dates import count_countable_days, count_open_days, counting_rule, deadline
+from deadlines.enums import CountingRule
+
+
+def test_counting_rule():
+    assert counting_rule(6) is CountingRule.OPEN
+    assert counting_rule(7) is CountingRule.NON_RECESS
+
+
+@pytest.mark.parametrize("start_date, end_date", [
+    (datetime.date(2012, 6, 25), datetime.date(2012, 9, 10)),
+    (datetime.date(2049, 12, 1), datetime.date(2051, 1, 15)),
+    (datetime.date(1999, 12, 15), datetime.date(2000, 1, 20)),
+    (datetime.date(2070, 3, 1), datetime.date(2070, 4, 30)),
+])
+@pytest.mark.parametrize("is_quebec", [False, True])
+def test_count_days_matches_loop(start_date, end_date, is_quebec):
+    """
+    Test that the counts agree with checking every day, inside, across and outside the court calendar.
+    """
+    dates: list[datetime.date] = [start_date + datetime.timedelta(days=n)
+                                  for n in range((end_date - start_date).days + 1)]
+
+    assert count_open_days(start_date, end_date, is_quebec) == sum(is_court_open(date, is_quebec) for date in dates)
+    assert count_countable_days(start_date, end_date) == sum(not is_recess(date) for date in dates)
+    assert count_open_days(end_date, start_date, is_quebec) == 0
+
+
+@pytest.mark.parametrize("number_of_days", [4, 30])
+def test_count_days_to_deadline(number_of_days):
+    """
+    Test that the days counted from the day after the event date to the deadline reach the number of days.
+    """
+    event_date: datetime.date = datetime.date(2012, 1, 1)
+    while event_date.year == 2012:
+        deadline_date: datetime.date = deadline(event_date, number_of_days)
+        assert count_countable_days(event_date + datetime.timedelta(days=1),
+                                    deadline_date,
+                                    counting_rule(number_of_days)) >= number_of_days
+        event_date += datetime.timedelta(days=3)
+
+
+def test_count_open_days_jurisdiction():
+    assert count_open_days(datetime.date(2024, 2, 19), datetime.date(2024, 2, 23)) == 5
+    assert count_open_days(datetime.date(2024, 2, 19), datetime.date(2024, 2, 23), jurisdiction="ON") == 4
@@ -0,0 +1,53 @@
+import pytest
+import datetime
+from deadlines.dates import add_days
+from deadlines.due_dates import deadline, deadline_by_calendar, deadline_by_steps
+
+
+@pytest.fixture
+def no_court_calendar(install_calendar):
+    """
+    Remove the installed court calendar so that deadline_by_steps applies the rules directly.
+    """
+    install_calendar(None)
+
+
+@pytest.mark.parametrize("number_of_days", [0, 1, 4, 6, 7, 10, 30])
+@pytest.mark.parametrize("after_event", [True, False])
+@pytest.mark.parametrize("is_quebec", [False, True])
+def test_deadline_by_calendar_matches_steps(no_court_calendar, small_calendar, number_of_days, after_event, is_quebec):
+    """
+    Test that jumping through the calendar gives the same deadline as stepping for every event date in 2012.
+    """
+    event_date: datetime.date = datetime.date(2012, 1, 1)
+    while event_date.year == 2012:
+        expected_date: datetime.date = deadline_by_steps(event_date, number_of_days, after_event, is_quebec)
+        assert deadline_by_calendar(small_calendar, event_date, number_of_days, after_event, is_quebec) == \
+               expected_date
+        event_date = add_days(event_date, 1)
+
+
+@pytest.mark.parametrize("after_event", [True, False])
+def test_deadline_by_calendar_365_days(no_court_calendar, small_calendar, after_event):
+    event_date: datetime.date = datetime.date(2012, 12, 14)
+    expected_date: datetime.date = deadline_by_steps(event_date, 365, after_event)
+    assert deadline_by_calendar(small_calendar, event_date, 365, after_event) == expected_date
+
+
+@pytest.mark.parametrize(
+    "event_date, number_of_days, after_event",
+    [
+        (datetime.date(2014, 12, 14), 30, True),
+        (datetime.date(2011, 1, 20), 30, False),
+        (datetime.date(2010, 6, 1), 10, True),
+    ]
+)
+def test_deadline_outside_calendar(install_calendar, small_calendar, event_date, number_of_days, after_event):
+    """
+    Test that deadlines outside the calendar fall back to stepping.
+    """
+    install_calendar(None)
+    assert deadline_by_calendar(small_calendar, event_date, number_of_days, after_event) is None
+    expected_date: datetime.date = deadline_by_steps(event_date, number_of_days, after_event)
+    install_calendar(small_calendar)
+    assert deadline(event_date, number_of_days, after_event) == expected_date
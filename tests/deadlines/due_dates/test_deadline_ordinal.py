@@ -0,0 +1,38 @@
+import pytest
+import datetime
+from deadlines import instrumentation
+from deadlines.due_dates import deadline, deadline_ordinal, dl
+
+
+@pytest.mark.parametrize("year", [2012, 2070])
+@pytest.mark.parametrize("number_of_days", [0, 4, 30])
+@pytest.mark.parametrize("after_event", [True, False])
+@pytest.mark.parametrize("is_quebec", [False, True])
+def test_deadline_ordinal_matches_deadline(year, number_of_days, after_event, is_quebec):
+    """
+    Test that deadline_ordinal agrees with deadline, inside and outside the court calendar.
+    """
+    event_date: datetime.date = datetime.date(year, 1, 1)
+    while event_date.year == year:
+        assert deadline_ordinal(event_date.toordinal(), number_of_days, after_event, is_quebec) == \
+               deadline(event_date, number_of_days, after_event, is_quebec).toordinal()
+        event_date += datetime.timedelta(days=5)
+
+
+def test_deadline_ordinal_jurisdiction():
+    assert deadline_ordinal(datetime.date(2024, 2, 15).toordinal(), 4, jurisdiction="ON") == \
+           datetime.date(2024, 2, 22).toordinal()
+
+
+def test_deadline_ordinal_traced():
+    """
+    Test that deadline_ordinal records a trace while tracing is enabled.
+    """
+    with instrumentation.TraceCollector() as collector:
+        assert dl("2012-06-11", 30) == "2012-09-11"
+    assert [trace.deadline_date for trace in collector.traces] == [datetime.date(2012, 9, 11)]
+
+
+def test_deadline_ordinal_negative_days():
+    with pytest.raises(ValueError):
+        deadline_ordinal(datetime.date(2012, 6, 11).toordinal(), -1)
@@ -0,0 +1,26 @@
+import pytest
+import datetime
+from deadlines.dates import add_days
+from deadlines.due_dates import deadline, deadlines_for_offsets
+
+OFFSETS: list[int] = [2, 4, 7, 10, 14, 15, 20, 30, 60, 0, 1, 6, 4]
+
+
+@pytest.mark.parametrize("after_event", [True, False])
+@pytest.mark.parametrize("is_quebec", [False, True])
+def test_deadlines_for_offsets_matches_deadline(after_event, is_quebec):
+    """
+    Test that the single pass agrees with separate deadline calls for every event date in 2012.
+    """
+    event_date: datetime.date = datetime.date(2012, 1, 1)
+    while event_date.year == 2012:
+        expected_dates: list[datetime.date] = [
+            deadline(event_date, number_of_days, after_event, is_quebec) for number_of_days in OFFSETS
+        ]
+        assert deadlines_for_offsets(event_date, OFFSETS, after_event, is_quebec) == expected_dates
+        event_date = add_days(event_date, 1)
+
+
+def test_deadlines_for_offsets_negative():
+    with pytest.raises(ValueError):
+        deadlines_for_offsets(datetime.date(2012, 6, 11), [10, -1])
@@ -0,0 +1,48 @@
+import pytest
+import datetime
+from deadlines.dates import add_days
+from deadlines.due_dates import deadline, earliest_event_date, event_dates_for_deadline, latest_event_date
+
+
+@pytest.mark.parametrize("number_of_days", [0, 1, 4, 7, 10, 30])
+@pytest.mark.parametrize("after_event", [True, False])
+@pytest.mark.parametrize("is_quebec", [False, True])
+def test_event_dates_for_deadline_matches_search(number_of_days, after_event, is_quebec):
+    """
+    Test the inverse against a brute-force search of the event dates in 2012.
+    """
+    event_dates: list[datetime.date] = [add_days(datetime.date(2011, 9, 1), n_days) for n_days in range(700)]
+    deadline_dates: list[datetime.date] = [
+        deadline(event_date, number_of_days, after_event, is_quebec) for event_date in event_dates
+    ]
+
+    deadline_date: datetime.date = datetime.date(2012, 1, 1)
+    while deadline_date.year == 2012:
+        expected_dates: list[datetime.date] = [
+            event_date for event_date, other_date in zip(event_dates, deadline_dates) if other_date == deadline_date
+        ]
+        assert event_dates_for_deadline(deadline_date, number_of_days, after_event, is_quebec) == expected_dates
+
+        expected_date: datetime.date = max(
+            event_date for event_date, other_date in zip(event_dates, deadline_dates) if other_date <= deadline_date
+        )
+        assert latest_event_date(deadline_date, number_of_days, after_event, is_quebec) == expected_date
+
+        expected_date = min(
+            event_date for event_date, other_date in zip(event_dates, deadline_dates) if other_date >= deadline_date
+        )
+        assert earliest_event_date(deadline_date, number_of_days, after_event, is_quebec) == expected_date
+
+        deadline_date = add_days(deadline_date, 1)
+
+
+def test_latest_event_date_guideline():
+    """
+    The latest service date for a 30-day deadline on or before 2012-09-11 is 2012-06-11.
+    """
+    assert latest_event_date(datetime.date(2012, 9, 11), 30) == datetime.date(2012, 6, 11)
+
+
+def test_latest_event_date_outside_calendar():
+    with pytest.raises(ValueError):
+        latest_event_date(datetime.date(1900, 9, 11), 30)
@@ -0,0 +1,46 @@
+import pytest
+import datetime
+from deadlines.dates import add_days, is_court_open, is_holiday
+from deadlines.due_dates import deadline, deadline_by_steps, dl
+
+
+@pytest.mark.parametrize("number_of_days", [0, 4, 10])
+@pytest.mark.parametrize("is_quebec", [False, True])
+def test_default_jurisdictions_match_is_quebec(number_of_days, is_quebec):
+    """
+    Test that naming the default jurisdictions gives the same deadlines as is_quebec.
+    """
+    jurisdiction: str = "QC" if is_quebec else "CA"
+    event_date: datetime.date = datetime.date(2012, 1, 1)
+    while event_date.year == 2012:
+        assert deadline(event_date, number_of_days, is_quebec=is_quebec) == \
+               deadline(event_date, number_of_days, jurisdiction=jurisdiction)
+        event_date = add_days(event_date, 3)
+
+
+def test_provincial_holiday():
+    """
+    Test that Family Day closes the court in Ontario but not elsewhere.
+    """
+    family_day: datetime.date = datetime.date(2024, 2, 19)
+    assert is_court_open(family_day)
+    assert not is_court_open(family_day, jurisdiction="ON")
+    assert is_holiday(family_day, jurisdiction="ON")
+    assert not is_holiday(family_day, jurisdiction="QC")
+
+    assert dl("2024-02-15", 4) == "2024-02-21"
+    assert dl("2024-02-15", 4, jurisdiction="ON") == "2024-02-22"
+
+
+@pytest.mark.parametrize("jurisdiction", ["ON", "BC", "MB", "NS"])
+@pytest.mark.parametrize("after_event", [True, False])
+def test_jurisdiction_calendar_matches_steps(jurisdiction, after_event):
+    """
+    Test that the calendar for a jurisdiction gives the same deadlines as stepping, inside and outside the calendar.
+    """
+    for year in (2024, 2070):
+        event_date: datetime.date = datetime.date(year, 2, 1)
+        while event_date.month < 4:
+            assert deadline(event_date, 4, after_event, jurisdiction=jurisdiction) == \
+                   deadline_by_steps(event_date, 4, after_event, jurisdiction=jurisdiction)
+            event_date = add_days(event_date, 1)
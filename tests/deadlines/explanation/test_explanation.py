@@ -0,0 +1,88 @@
+import pytest
+import datetime
+from deadlines.canadian_holidays import THANKSGIVING_DAY
+from deadlines.dates import add_days
+from deadlines.due_dates import deadline
+from deadlines.enums import DayReason
+from deadlines.explanation import DeadlineExplanation, Segment, explain_deadline
+
+
+def test_explain_short_deadline(installed_calendar):
+    """
+    Test a 4-day deadline that skips a weekend and Thanksgiving Day.
+    """
+    explanation: DeadlineExplanation = deadline(datetime.date(2014, 10, 9), 4, explain=True)
+    assert explanation.deadline_date == datetime.date(2014, 10, 16)
+    assert explanation.segments == [
+        Segment(datetime.date(2014, 10, 10), datetime.date(2014, 10, 10), DayReason.COUNTED),
+        Segment(datetime.date(2014, 10, 11), datetime.date(2014, 10, 12), DayReason.WEEKEND),
+        Segment(datetime.date(2014, 10, 13), datetime.date(2014, 10, 13), DayReason.HOLIDAY,
+                holiday_name=THANKSGIVING_DAY),
+        Segment(datetime.date(2014, 10, 14), datetime.date(2014, 10, 16), DayReason.COUNTED),
+    ]
+
+
+def test_explain_roll_forward(installed_calendar):
+    """
+    Test a 12-day deadline that counts Thanksgiving Day and rolls forward past a weekend.
+    """
+    explanation: DeadlineExplanation = deadline(datetime.date(2012, 10, 1), 12, explain=True)
+    assert explanation.deadline_date == datetime.date(2012, 10, 15)
+    assert explanation.segments == [
+        Segment(datetime.date(2012, 10, 2), datetime.date(2012, 10, 13), DayReason.COUNTED),
+        Segment(datetime.date(2012, 10, 14), datetime.date(2012, 10, 14), DayReason.WEEKEND, is_rolled=True),
+    ]
+
+
+def test_explain_before_seasonal_recess(installed_calendar):
+    """
+    Test a deadline before the event date that skips the seasonal recess and rolls backward past a weekend,
+    with the segments in date order.
+    """
+    explanation: DeadlineExplanation = deadline(datetime.date(2013, 1, 10), 7, after_event=False, explain=True)
+    assert explanation.deadline_date == datetime.date(2012, 12, 14)
+    assert explanation.skipped_segments() == [
+        Segment(datetime.date(2012, 12, 15), datetime.date(2012, 12, 15), DayReason.WEEKEND, is_rolled=True),
+        Segment(datetime.date(2012, 12, 21), datetime.date(2013, 1, 7), DayReason.RECESS),
+    ]
+    assert explanation.segments[0].start_date == datetime.date(2012, 12, 15)
+
+
+@pytest.mark.parametrize("number_of_days", [0, 1, 4, 6, 7, 10, 30])
+@pytest.mark.parametrize("after_event", [True, False])
+@pytest.mark.parametrize("is_quebec", [False, True])
+def test_explanation_matches_deadline(number_of_days, after_event, is_quebec):
+    """
+    Test that the explained deadline matches the computed deadline and that its segments account for every day.
+    """
+    event_date: datetime.date = datetime.date(2012, 1, 1)
+    while event_date.year == 2012:
+        explanation: DeadlineExplanation = explain_deadline(event_date, number_of_days, after_event, is_quebec)
+        assert explanation.deadline_date == deadline(event_date, number_of_days, after_event, is_quebec)
+
+        segments: list[Segment] = explanation.segments
+        assert sum(len(segment) for segment in segments if segment.reason is DayReason.COUNTED) == number_of_days
+        for previous_segment, segment in zip(segments, segments[1:]):
+            assert add_days(previous_segment.end_date, 1) == segment.start_date
+        if segments:
+            # the segments run from the first day walked to the deadline, or the day before it, in date order
+            day_step: int = 1 if after_event else -1
+            first_walked_date: datetime.date = add_days(event_date, day_step if number_of_days else 0)
+            last_walked_dates: tuple[datetime.date, ...] = (explanation.deadline_date,
+                                                            add_days(explanation.deadline_date, -day_step))
+            if after_event:
+                assert segments[0].start_date == first_walked_date
+                assert segments[-1].end_date in last_walked_dates
+            else:
+                assert segments[-1].end_date == first_walked_date
+                assert segments[0].start_date in last_walked_dates
+        event_date = add_days(event_date, 5)
+
+
+def test_explain_outside_calendar(installed_calendar):
+    """
+    Test that days outside the calendar are explained from the rules, with holiday names.
+    """
+    explanation: DeadlineExplanation = deadline(datetime.date(2009, 10, 8), 4, explain=True)
+    assert explanation.deadline_date == datetime.date(2009, 10, 15)
+    assert [segment.holiday_name for segment in explanation.skipped_segments()] == [None, THANKSGIVING_DAY]
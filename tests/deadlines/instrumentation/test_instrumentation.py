@@ -0,0 +1,87 @@
+import pytest
+import datetime
+from deadlines import instrumentation
+from deadlines.court_calendar import CourtCalendar
+from deadlines.dates import add_days
+from deadlines.due_dates import deadline, deadline_by_steps
+from deadlines.instrumentation import DeadlineTrace, TraceCollector
+
+# a calendar that does not cover the test dates, so that deadlines are found by stepping
+other_calendar: CourtCalendar = CourtCalendar(2030, 2030)
+
+
+@pytest.fixture
+def trace_counters():
+    """
+    Reset the aggregated counters before and after a test.
+    """
+    instrumentation.reset_counters()
+    yield
+    instrumentation.reset_counters()
+
+
+def trace_deadline(event_date: datetime.date,
+                   number_of_days: int,
+                   after_event: bool,
+                   is_quebec: bool) -> DeadlineTrace:
+    """
+    Compute a deadline with the installed court calendar and return its trace.
+    """
+    with TraceCollector() as collector:
+        deadline(event_date, number_of_days, after_event, is_quebec)
+
+    assert len(collector.traces) == 1
+    return collector.traces[0]
+
+
+def test_tracing_disabled_by_default(trace_counters):
+    assert not instrumentation.enabled
+    deadline(datetime.date(2012, 6, 11), 30)
+    assert instrumentation.trace_counters() == instrumentation.ZERO_COUNTERS
+
+
+def test_trace_summer_recess(installed_calendar):
+    """
+    Test a 30-day deadline that spans the summer recess.
+    """
+    trace: DeadlineTrace = trace_deadline(datetime.date(2012, 6, 11), 30, True, False)
+    assert trace.calendar_hit
+    assert trace.deadline_date == deadline_by_steps(datetime.date(2012, 6, 11), 30)
+    assert trace.recess_days == 62
+    assert trace.closed_days == 0
+    assert trace.days_stepped == 30 + 62
+    assert trace.seconds >= 0
+
+
+@pytest.mark.parametrize("number_of_days", [0, 1, 4, 7, 30])
+@pytest.mark.parametrize("after_event", [True, False])
+@pytest.mark.parametrize("is_quebec", [False, True])
+def test_calendar_trace_matches_steps(install_calendar, small_calendar, number_of_days, after_event, is_quebec):
+    """
+    Test that the counts taken from the prefix sums match those found by stepping for every event date in 2012.
+    """
+    event_date: datetime.date = datetime.date(2012, 1, 1)
+    while event_date.year == 2012:
+        install_calendar(small_calendar)
+        calendar_trace: DeadlineTrace = trace_deadline(event_date, number_of_days, after_event, is_quebec)
+        install_calendar(other_calendar)
+        steps_trace: DeadlineTrace = trace_deadline(event_date, number_of_days, after_event, is_quebec)
+        assert calendar_trace.calendar_hit and not steps_trace.calendar_hit
+        assert calendar_trace[:-2] == steps_trace[:-2]
+        event_date = add_days(event_date, 7)
+
+
+def test_counters(trace_counters, installed_calendar):
+    instrumentation.enable_tracing()
+    try:
+        deadline(datetime.date(2012, 12, 17), 4)
+        deadline(datetime.date(2010, 12, 17), 4)
+    finally:
+        instrumentation.disable_tracing()
+
+    counters = instrumentation.trace_counters()
+    assert counters.calls == 2
+    assert counters.calendar_hits == 1
+    assert counters.calendar_misses == 1
+    assert counters.recess_days > 0
+    assert counters.days_stepped == counters.recess_days + counters.closed_days + 8
@@ -0,0 +1,71 @@
+import pytest
+from deadlines.canadian_holidays import calc_holidays, warm_holidays
+from deadlines.court_calendar import CourtCalendar
+from deadlines.memo import BoundedCache, CacheStats, bounded_cache, cache_stats, get_cache
+
+
+def test_bounded_cache_counts_and_evicts():
+    calls: list[int] = []
+
+    @bounded_cache(2, name="test_square")
+    def square(n: int) -> int:
+        calls.append(n)
+        return n * n
+
+    assert [square(1), square(2), square(1), square(3), square(2)] == [1, 4, 1, 9, 4]
+
+    # 2 was evicted by 3 since 1 was used more recently
+    assert calls == [1, 2, 3, 2]
+    assert square.cache_stats() == CacheStats(hits=1, misses=4, evictions=2, size=2, max_size=2)
+    assert cache_stats()["test_square"] == square.cache_stats()
+    assert get_cache("test_square") is square
+
+    square.resize(1)
+    assert square.cache_stats().size == 1
+
+    square.cache_clear()
+    assert square.cache_stats() == CacheStats(hits=0, misses=0, evictions=0, size=0, max_size=1)
+
+    with pytest.raises(ValueError):
+        square.resize(0)
+
+
+def test_calc_holidays_cache():
+    """
+    Test that calc_holidays is bounded and can be warmed up.
+    """
+    assert isinstance(calc_holidays, BoundedCache)
+    calc_holidays.cache_clear()
+
+    warm_holidays(2012, 2013)
+    assert calc_holidays.cache_stats().misses == 4
+
+    calc_holidays(2012, True)
+    assert calc_holidays.cache_stats().hits == 1
+    assert calc_holidays.cache_stats().size == 4
+
+
+def test_warm_holidays_covers_calendar_builds():
+    """
+    Test that the holidays warmed by is_quebec are the ones a court calendar looks up by jurisdiction.
+    """
+    calc_holidays.cache_clear()
+    warm_holidays(2012, 2013)
+
+    CourtCalendar(2012, 2013)
+    assert calc_holidays.cache_stats().misses == 4
+    assert calc_holidays(2012, jurisdiction="QC") is calc_holidays(2012, True)
+    assert calc_holidays.cache_stats().size == 4
+
+
+def test_bounded_cache_key():
+    calls: list[int] = []
+
+    @bounded_cache(2, name="test_absolute", key=abs)
+    def absolute(n: int) -> int:
+        calls.append(n)
+        return abs(n)
+
+    assert [absolute(-1), absolute(1)] == [1, 1]
+    assert calls == [-1]
+    assert absolute.cache_stats().hits == 1
@@ -0,0 +1,48 @@
+import pytest
+import datetime
+import random
+from deadlines.calendar_file import write_calendar_file
+from deadlines.court_calendar import CourtCalendar
+from deadlines.due_dates import deadline
+from deadlines.parallel import DeadlineRequest, deadlines_parallel, plan_shards
+
+
+def random_requests(number_of_requests: int) -> list[DeadlineRequest]:
+    generator: random.Random = random.Random(2012)
+    first_ordinal: int = datetime.date(1995, 1, 1).toordinal()
+    last_ordinal: int = datetime.date(2055, 12, 31).toordinal()
+    return [
+        (datetime.date.fromordinal(generator.randint(first_ordinal, last_ordinal)),
+         generator.choice([0, 1, 4, 6, 7, 10, 30, 60, 365]),
+         generator.random() < 0.5,
+         generator.random() < 0.5)
+        for _ in range(number_of_requests)
+    ]
+
+
+def test_plan_shards():
+    requests: list[DeadlineRequest] = random_requests(10)
+    shards: list[list[int]] = plan_shards(requests, 3)
+
+    assert len(shards) == 3
+    assert sorted(index for shard in shards for index in shard) == list(range(10))
+    assert [requests[index][0] for shard in shards for index in shard] == sorted(request[0] for request in requests)
+
+
+def test_deadlines_parallel_matches_serial():
+    requests: list[DeadlineRequest] = random_requests(2000)
+    assert deadlines_parallel(requests, max_workers=2) == [deadline(*request) for request in requests]
+
+
+def test_deadlines_parallel_with_calendar_file(tmp_path):
+    calendar_path: str = str(tmp_path / "calendar.bin")
+    write_calendar_file(calendar_path, CourtCalendar(2000, 2030))
+    requests: list[DeadlineRequest] = random_requests(500)
+
+    assert deadlines_parallel(requests, max_workers=2, calendar_path=calendar_path) == \
+           [deadline(*request) for request in requests]
+
+
+def test_deadlines_parallel_negative_days():
+    with pytest.raises(ValueError):
+        deadlines_parallel([(datetime.date(2012, 6, 11), -1, True, False)])
@@ -0,0 +1,77 @@
+import pytest
+import io
+import json
+import os
+import subprocess
+import sys
+import deadlines
+from deadlines.due_dates import dl
+from deadlines.pipeline import CSV_FORMAT, JSONL_FORMAT, PipelineColumns, PipelineStats, main, run_pipeline
+
+CSV_INPUT: str = """docket,event_date,number_of_days,quebec
+T-1,2012-06-11,30,no
+T-2,2012-12-14,-10,yes
+T-3,2021-12-16,4,no
+"""
+
+
+def test_run_pipeline_csv():
+    output_file: io.StringIO = io.StringIO()
+    columns: PipelineColumns = PipelineColumns(quebec_column="quebec")
+
+    stats: PipelineStats = run_pipeline(io.StringIO(CSV_INPUT), output_file, CSV_FORMAT, columns=columns, chunk_size=2)
+
+    assert stats.rows == 3
+    assert output_file.getvalue().splitlines() == [
+        "docket,event_date,number_of_days,quebec,deadline",
+        "T-1,2012-06-11,30,no,2012-09-11",
+        f"T-2,2012-12-14,-10,yes,{dl('2012-12-14', -10, is_quebec=True)}",
+        "T-3,2021-12-16,4,no,2022-01-11",
+    ]
+
+
+def test_run_pipeline_jsonl():
+    input_file: io.StringIO = io.StringIO(
+        '{"date": "2012-05-31", "days": 10}\n\n{"date": "2012-04-03", "days": 4}\n'
+    )
+    output_file: io.StringIO = io.StringIO()
+    columns: PipelineColumns = PipelineColumns(event_column="date", days_column="days", output_column="due")
+
+    run_pipeline(input_file, output_file, JSONL_FORMAT, columns=columns)
+
+    rows: list[dict] = [json.loads(line) for line in output_file.getvalue().splitlines()]
+    assert [row["due"] for row in rows] == ["2012-06-11", "2012-04-11"]
+
+
+@pytest.mark.parametrize("chunk_size", [0, -1])
+def test_run_pipeline_rejects_chunk_size(chunk_size):
+    with pytest.raises(ValueError):
+        run_pipeline(io.StringIO(CSV_INPUT), io.StringIO(), CSV_FORMAT, chunk_size=chunk_size)
+
+
+def test_main_rejects_chunk_size(capsys):
+    with pytest.raises(SystemExit):
+        main(["-", "--chunk-size", "0"])
+
+    assert "--chunk-size" in capsys.readouterr().err
+
+
+def test_main(tmp_path):
+    """
+    Test the python -m deadlines entry point, converting CSV to JSON Lines.
+    """
+    input_path: str = str(tmp_path / "events.csv")
+    output_path: str = str(tmp_path / "deadlines.jsonl")
+    with open(input_path, "w") as file:
+        file.write(CSV_INPUT)
+
+    src_dir: str = os.path.dirname(os.path.dirname(deadlines.__file__))
+    env: dict[str, str] = dict(os.environ, PYTHONPATH=src_dir)
+    result = subprocess.run([sys.executable, "-m", "deadlines", input_path, output_path,
+                             "--quebec-column", "quebec"],
+                            env=env, capture_output=True, text=True, check=True)
+
+    assert "rows/s" in result.stderr
+    with open(output_path) as file:
+        rows: list[dict] = [json.loads(line) for line in file]
+    assert [row["deadline"] for row in rows][0] == "2012-09-11"
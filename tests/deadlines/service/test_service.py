@@ -0,0 +1,186 @@
+import pytest
+import asyncio
+import datetime
+import threading
+import time
+from deadlines.closures import Closure, ClosureIndex, install_closures
+from deadlines.due_dates import deadline, dl
+from deadlines.examples import guideline_examples
+from deadlines.service import DeadlineService, ResultCache
+
+
+def test_service_guideline_examples():
+    async def compute() -> list[datetime.date]:
+        service: DeadlineService = DeadlineService()
+        return await asyncio.gather(*[
+            service.deadline(example.event_date, example.number_of_days, example.after_event)
+            for example in guideline_examples
+        ])
+
+    assert asyncio.run(compute()) == [example.deadline_date for example in guideline_examples]
+
+
+def test_service_dl():
+    async def compute() -> str:
+        return await DeadlineService().dl("2012-06-11", -30, is_quebec=True)
+
+    assert asyncio.run(compute()) == dl("2012-06-11", -30, is_quebec=True)
+
+
+def test_service_coalesces_identical_requests(monkeypatch):
+    """
+    Test that identical concurrent requests outside the calendar are computed once, in the executor.
+    """
+    calls: list[tuple] = []
+
+    def slow_deadline(*args) -> datetime.date:
+        calls.append(args)
+        time.sleep(0.05)
+        return deadline(*args)
+
+    monkeypatch.setattr("deadlines.service.deadline", slow_deadline)
+    event_date: datetime.date = datetime.date(1990, 6, 11)
+
+    async def compute() -> tuple[list[datetime.date], DeadlineService]:
+        service: DeadlineService = DeadlineService()
+        deadline_dates: list[datetime.date] = await asyncio.gather(*[
+            service.deadline(event_date, 30) for _ in range(10)
+        ])
+        deadline_dates.append(await service.deadline(event_date, 30))
+        return deadline_dates, service
+
+    deadline_dates, service = asyncio.run(compute())
+
+    assert deadline_dates == [deadline(event_date, 30)] * 11
+    assert len(calls) == 1
+    assert (service.stats.misses, service.stats.coalesced, service.stats.hits) == (1, 9, 1)
+
+
+def test_service_survives_cancelled_requester(monkeypatch):
+    """
+    Test that cancelling the request that started a computation does not cancel the requests coalesced with it.
+    """
+    calls: list[tuple] = []
+
+    def slow_deadline(*args) -> datetime.date:
+        calls.append(args)
+        time.sleep(0.05)
+        return deadline(*args)
+
+    monkeypatch.setattr("deadlines.service.deadline", slow_deadline)
+    event_date: datetime.date = datetime.date(1990, 6, 11)
+
+    async def compute() -> tuple[bool, datetime.date, DeadlineService]:
+        service: DeadlineService = DeadlineService()
+        first_request: asyncio.Task = asyncio.ensure_future(service.deadline(event_date, 30))
+        second_request: asyncio.Task = asyncio.ensure_future(service.deadline(event_date, 30))
+        await asyncio.sleep(0.01)
+        first_request.cancel()
+        deadline_date: datetime.date = await second_request
+        return first_request.cancelled(), deadline_date, service
+
+    first_cancelled, deadline_date, service = asyncio.run(compute())
+
+    assert first_cancelled
+    assert deadline_date == deadline(event_date, 30)
+    assert len(calls) == 1
+    assert len(service.cache) == 1
+
+
+def test_service_cancels_abandoned_computation(monkeypatch):
+    def slow_deadline(*args) -> datetime.date:
+        time.sleep(0.05)
+        return deadline(*args)
+
+    monkeypatch.setattr("deadlines.service.deadline", slow_deadline)
+    event_date: datetime.date = datetime.date(1990, 6, 11)
+
+    async def compute() -> tuple[DeadlineService, datetime.date]:
+        service: DeadlineService = DeadlineService()
+        request: asyncio.Task = asyncio.ensure_future(service.deadline(event_date, 30))
+        await asyncio.sleep(0.01)
+        request.cancel()
+        await asyncio.sleep(0.1)
+
+        # the abandoned result is not cached, and a new request starts a new computation
+        assert len(service.cache) == 0
+        return service, await service.deadline(event_date, 30)
+
+    service, deadline_date = asyncio.run(compute())
+
+    assert deadline_date == deadline(event_date, 30)
+    assert service.stats.misses == 2
+
+
+def test_service_steps_past_calendar_in_executor(monkeypatch):
+    """
+    Test that a deadline whose event date is in the calendar but which runs past its end is computed in the executor.
+    """
+    threads: list[int] = []
+
+    def recording_deadline(*args) -> datetime.date:
+        threads.append(threading.get_ident())
+        return deadline(*args)
+
+    monkeypatch.setattr("deadlines.service.deadline", recording_deadline)
+    event_date: datetime.date = datetime.date(2050, 12, 1)
+
+    async def compute() -> list[datetime.date]:
+        service: DeadlineService = DeadlineService()
+        return [await service.deadline(event_date, 60), await service.deadline(datetime.date(2012, 6, 11), 30)]
+
+    deadline_dates: list[datetime.date] = asyncio.run(compute())
+
+    assert deadline_dates == [deadline(event_date, 60), deadline(datetime.date(2012, 6, 11), 30)]
+    assert len(threads) == 1
+    assert threads[0] != threading.get_ident()
+
+
+def test_service_uses_installed_calendar():
+    """
+    Test that the service computes from the calendar installed with the closures, not the one it first saw.
+    """
+    event_date: datetime.date = datetime.date(2024, 3, 1)
+
+    async def compute(service: DeadlineService) -> list[datetime.date]:
+        return [await service.deadline(event_date, 3), await service.deadline(event_date, 4)]
+
+    service: DeadlineService = DeadlineService()
+    assert asyncio.run(compute(service)) == [datetime.date(2024, 3, 6), datetime.date(2024, 3, 7)]
+
+    install_closures(ClosureIndex([Closure(datetime.date(2024, 3, 4), datetime.date(2024, 3, 8))]))
+    try:
+        assert asyncio.run(compute(service)) == [deadline(event_date, 3), deadline(event_date, 4)]
+        assert deadline(event_date, 3) == datetime.date(2024, 3, 13)
+    finally:
+        install_closures(None)
+
+    assert asyncio.run(compute(service)) == [datetime.date(2024, 3, 6), datetime.date(2024, 3, 7)]
+
+
+def test_service_propagates_errors():
+    async def compute() -> None:
+        service: DeadlineService = DeadlineService()
+        await asyncio.gather(service.deadline(datetime.date(2012, 6, 11), -1),
+                             service.deadline(datetime.date(2012, 6, 11), -1))
+
+    with pytest.raises(ValueError):
+        asyncio.run(compute())
+
+
+def test_result_cache_evicts_and_expires():
+    now: list[float] = [0.0]
+    cache: ResultCache = ResultCache(max_size=2, ttl=10.0, clock=lambda: now[0])
+    keys = [(datetime.date(2012, 6, day), 30, True, False) for day in (1, 2, 3)]
+
+    cache.put(keys[0], datetime.date(2012, 7, 1))
+    cache.put(keys[1], datetime.date(2012, 7, 2))
+    assert cache.get(keys[0]) == datetime.date(2012, 7, 1)
+    cache.put(keys[2], datetime.date(2012, 7, 3))
+
+    assert cache.get(keys[1]) is None
+    assert cache.stats.evictions == 1
+
+    now[0] = 10.0
+    assert cache.get(keys[0]) is None
+    assert cache.stats.expirations == 1
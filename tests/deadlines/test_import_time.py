@@ -0,0 +1,61 @@
+import pytest
+import os
+import subprocess
+import sys
+import deadlines
+
+# the maximum time in microseconds that importing a module may take, measured by python -X importtime
+IMPORT_TIME_BUDGET_US: int = 50_000
+
+# modules that must only be imported on first use
+LAZY_MODULES: list[str] = ["holidays", "numpy", "calendar", "typing", "deadlines.holiday_rules"]
+
+
+def measure_import(module: str) -> dict[str, int]:
+    """
+    Import a module in a fresh interpreter and measure the cumulative import time of every module it loads.
+
+    Args:
+        module: the name of the module to import
+
+    Returns:
+        the dictionary of cumulative import times in microseconds, keyed by module name
+    """
+    src_dir: str = os.path.dirname(os.path.dirname(deadlines.__file__))
+    env: dict[str, str] = dict(os.environ, PYTHONPATH=src_dir)
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            env=env, capture_output=True, text=True, check=True)
+
+    # each line looks like "import time:       self [us] |  cumulative | imported package"
+    import_times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        fields: list[str] = line.removeprefix("import time:").split("|")
+        if len(fields) == 3 and fields[1].strip().isdigit():
+            import_times[fields[2].strip()] = int(fields[1])
+
+    return import_times
+
+
+@pytest.mark.parametrize("module", ["deadlines.dates", "deadlines.due_dates"])
+def test_import_time(module):
+    """
+    Test that importing a module stays within the budget and does not load heavy modules.
+    The best of several runs is used to reduce noise from other processes.
+    """
+    measurements: list[dict[str, int]] = [measure_import(module) for _ in range(3)]
+
+    for lazy_module in LAZY_MODULES:
+        assert lazy_module not in measurements[0]
+
+    assert min(import_times[module] for import_times in measurements) < IMPORT_TIME_BUDGET_US
+
+
+def test_calendar_cache_does_not_load_process_pool():
+    """
+    Test that loading cached calendars and closures does not import the process pool machinery.
+    """
+    import_times: dict[str, int] = measure_import("deadlines.calendar_cache")
+
+    assert "deadlines.closures" in import_times
+    assert "deadlines.parallel" not in import_times
+    assert "concurrent.futures.process" not in import_times